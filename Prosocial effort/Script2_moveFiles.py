@@ -1,62 +1,15 @@
 '''
-Function to move newly created files to a specific folder. By default, it's the Data folder. To use this script, just run it (like how you run any other PsychoPy experiment script), and enter the participant number accordingly. The participants' files will be moved into the Data folder and zipped.
+Function to move newly created files to a specific folder. By default, it's the Data folder. To use this script, just run it (like how you run any other PsychoPy experiment script), and the data files (csv, backup journals, columnar copies, session state; see DATAFILES in psychopyTools/archiver.py) will be moved into the Data folder and zipped. The files of a session that hasn't finished (e.g., after a crash) are left where they are, so that it can be resumed.
+
+Only files that are new or changed since the last run are zipped (see psychopyTools/archiver.py); each _UPLOAD_NEW_FILES_ zip file holds only the files new since the previous one, so upload every one of them (not only the newest). Zip files already in Data are moved into Data/Archive on the next run.
 
 Click green runinng man icon to begin.
 '''
 
-import pandas as pd
-import numpy as np
-import random, os, time
-import zipfile
-
-def moveFiles(outputDir = 'Data'):
-    # info = {}
-    # info['participant'] = ''
-    # dlg = gui.DlgFromDict(info) # create a dialogue box (function gui)
-    # if not dlg.OK: # if dialogue response is NOT OK, quit
-    #     core.quit()
-
-    # list files in current directory
-    files = os.listdir(os.getcwd())
-
-    # info['participant'] = "{:03}".format(int(info['participant']))
-
-    # create new directory (or the directory to move files to)
-    dataDirectory = os.getcwd() + os.path.sep + outputDir
-    if not os.path.exists(dataDirectory):
-        os.mkdir(dataDirectory)
-        os.mkdir(dataDirectory + os.path.sep + 'Archive')
-
-    for filename in files:
-        if filename.endswith("csv"):
-            # print filename
-            newNameAndDir = dataDirectory + os.path.sep + filename
-            # print newNameAndDir
-            os.rename(filename, newNameAndDir)
-
-moveFiles(outputDir='Data') # move csv into Data directory
-
-def zipStuff():
-    # list files in current directory
-    os.chdir('Data')
-    # print os.getcwd()
-
-    files = os.listdir(os.getcwd())
-    # print files
-
-    zipFileName = "_UPLOAD_ONLY_THIS_FILE_" + str(time.strftime('%Y-%m-%d-%H-%M-%S', time.localtime())) + '.zip'
-
-    # remove existing zip files
-    for filename in files:
-        if filename.endswith("zip"):
-            # print filename
-            os.remove(filename)
+import os, sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)) # repository root, for psychopyTools
+from psychopyTools.archiver import moveFiles, archiveData
 
-    # zip file
-    with zipfile.ZipFile(zipFileName, 'w') as myzip:
-        for filename in files:
-            if filename.endswith("csv"):
-                # print filename
-                myzip.write(filename)
+moveFiles(outputDir='Data') # move data files of finished sessions into Data directory
 
-zipStuff() # remove existing zip files and zip all csv files in the Data directory
+archiveData(dataDir='Data') # zip data files in the Data directory that are new or changed since the last zip file
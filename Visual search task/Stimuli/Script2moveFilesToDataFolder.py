@@ -4,33 +4,16 @@ Function to move newly created files to a specific folder. By default, it's the
 Click green runinng man icon to begin.
 '''
 
-import pandas as pd
-import numpy as np
-import random, os, time
-from psychopy import visual, core, event, data, gui, logging, monitors
-
-
-def moveFiles(outputDir = 'Data'):
-    info = {}
-    info['participant'] = ''
-    dlg = gui.DlgFromDict(info) # create a dialogue box (function gui)
-    if not dlg.OK: # if dialogue response is NOT OK, quit
-        core.quit()
-
-    # list files in current directory
-    files = os.listdir(os.getcwd())
-
-    info['participant'] = "{:03}".format(int(info['participant']))
-
-    # create new directory (or the directory to move files to)
-    dataDirectory = os.getcwd() + os.path.sep + 'Data'
-    if not os.path.exists(dataDirectory):
-        os.mkdir(dataDirectory)
-
-    for filename in files:
-        if filename.startswith(str(info['participant'])):
-            newNameAndDir = dataDirectory + os.path.sep + filename
-            print newNameAndDir
-            os.rename(filename, newNameAndDir)
-
-moveFiles(outputDir = 'Data')
+import os, sys
+from psychopy import core, gui
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir)) # repository root, for psychopyTools
+from psychopyTools.archiver import moveFiles
+
+info = {}
+info['participant'] = ''
+dlg = gui.DlgFromDict(info) # create a dialogue box (function gui)
+if not dlg.OK: # if dialogue response is NOT OK, quit
+    core.quit()
+
+for filename in moveFiles(outputDir='Data', participant=int(info['participant'])): # move the participant's files (e.g., 007-*) into Data directory
+    print(os.path.join('Data', filename))
@@ -0,0 +1,5 @@
+'''Helpers shared by the experiment scripts in this repository.
+
+Each experiment folder adds the repository root to sys.path and imports what it needs, e.g.
+    from psychopyTools.sessionData import SessionLedger
+'''
@@ -0,0 +1,332 @@
+'''Adaptive procedures for titrated parameters (response deadlines, blank durations, dot coherence, ...).
+
+With titrate=True every runner carried its own copy of the titration rule, and on each trial rebuilt the
+list of the block's accuracy so far and took its np.nanmean (O(n) per trial, O(n^2) per block). A
+procedure keeps running statistics instead and updates them once per trial:
+
+    procedures = blockProcedures(titrate, lambda: [AccuracyRule('targetFrames', frameRate.frames(0.05), frameRate.frames(0.017), frameRate.frames(0.1))])
+    for i, thisTrial in plan:
+        for procedure in procedures:
+            procedure.apply(i, trials) # set trials[i, 'targetFrames'] and log the procedure's state
+        ... trial ...
+        for procedure in procedures:
+            procedure.update(trials[i, 'acc'])
+
+Procedures:
+    AccuracyRule: the scripts' rule (step down after a correct response if block accuracy >= 80%, ...)
+    Staircase: n-up/m-down staircase (e.g., 3-down/1-up converges on 79% correct)
+    Quest: Bayesian threshold estimate (Watson & Pelli, 1983) on a grid of candidate thresholds
+Stepping down makes trials harder, so higher levels of the parameter have to be easier (more frames,
+longer blanks, higher coherence). Each trial's row gets the procedure's state in columns named after the
+parameter (targetFramesProcedure, targetFramesAcc, targetFramesReversals, targetFramesThreshold, ...).
+
+titrate can be True (the runner's default procedures), False, or procedures made by the caller, e.g.
+    runDotMotionBlock(..., titrate=Staircase('coherence', 0.02, nDown=3, nUp=1, minimum=0.01, maximum=1.0))
+A procedure passed in keeps its level (and statistics) from one block to the next. So do the default
+procedures: the runners are often called with one trial per block, and the old rules read the level from the
+last rows of the csv file. One SessionProcedures per script keeps each task's procedures for the session:
+
+    sessionProcedures = SessionProcedures()
+    ...
+    procedures = sessionProcedures.forBlock(taskName, titrate, lambda: [AccuracyRule(...)])
+
+AccuracyRule steps by the accuracy of the current block (as the rule did), so its accuracy starts over with
+each block (startBlock()); its level doesn't.
+
+Run as a script to compare the per-trial cost of the old list/np.nanmean rule with AccuracyRule:
+    python adaptiveProcedure.py [trials]
+'''
+
+from __future__ import print_function
+import sys
+import timeit
+from collections import OrderedDict
+import numpy as np
+
+
+class RunningAccuracy(object):
+    '''Accuracy of the trials so far, updated in O(1) (trials without accuracy, i.e., NaN/None, are left out of the mean).'''
+
+    def __init__(self):
+        self.trials = 0
+        self.correct = 0.0
+        self.last = None
+
+    def add(self, acc):
+        self.last = acc
+        if acc is not None and acc == acc: # not None or NaN
+            self.trials += 1
+            self.correct += acc
+
+    @property
+    def mean(self):
+        return self.correct / self.trials if self.trials else np.nan
+
+
+class Procedure(object):
+    '''One adaptively set parameter (a column of the trials); subclasses work out the next level in step().
+
+    parameter: column the level is written to (e.g., 'targetFrames')
+    start: first level (None: the first trial's planned value)
+    minimum, maximum: bounds of the level (None: unbounded)
+    integer: round levels to whole numbers (e.g., frames)
+    '''
+
+    name = 'procedure'
+
+    def __init__(self, parameter, start=None, minimum=None, maximum=None, integer=False):
+        self.parameter = parameter
+        self.level = start
+        self.minimum = minimum
+        self.maximum = maximum
+        self.integer = integer
+        self.accuracy = RunningAccuracy()
+
+    def apply(self, i, trials):
+        '''Set trial i's parameter to the current level (keep its planned value if there is no level yet) and log the state.'''
+        if self.level is None:
+            self.level = self.bounded(trials[i, self.parameter])
+            self.begin()
+        trials[i, self.parameter] = self.level
+        for suffix, value in self.state().items():
+            trials[i, self.parameter + suffix] = value
+
+    def resume(self, i, trials):
+        '''Catch up on trial i, completed before the session was resumed (its level and accuracy).'''
+        first = self.level is None
+        self.level = trials[i, self.parameter]
+        if first:
+            self.begin()
+        self.update(trials[i, 'acc'])
+
+    def update(self, acc):
+        '''Move to the next level after a trial with accuracy acc (1, 0, or NaN/None if it wasn't scored).'''
+        self.accuracy.add(acc)
+        if self.level is not None:
+            self.level = self.bounded(self.step(acc))
+
+    def begin(self):
+        '''Called once the first level is known.'''
+        pass
+
+    def startBlock(self):
+        '''Called at the start of each block the procedure is used in.'''
+        pass
+
+    def step(self, acc):
+        '''Next level (unbounded).'''
+        return self.level
+
+    def state(self):
+        '''Columns (suffix -> value) logged with each trial.'''
+        return OrderedDict([('Procedure', self.name), ('Acc', self.accuracy.mean)])
+
+    def bounded(self, level):
+        if level is None or level != level: # None or NaN (e.g., no planned value): left as it is
+            return level
+        if self.minimum is not None:
+            level = max(level, self.minimum)
+        if self.maximum is not None:
+            level = min(level, self.maximum)
+        return int(round(level)) if self.integer else level
+
+
+class AccuracyRule(Procedure):
+    '''The scripts' titration rule. After a correct response: down by down if block accuracy >= criterion, else
+    up by up; after an error: no change if accuracy >= criterion, else up by upAfterError; after a trial
+    without accuracy: up by up.'''
+
+    name = 'accuracyRule'
+
+    def __init__(self, parameter, down, up, upAfterError, criterion=0.8, **kwargs):
+        Procedure.__init__(self, parameter, **kwargs)
+        self.down = down
+        self.up = up
+        self.upAfterError = upAfterError
+        self.criterion = criterion
+
+    def startBlock(self):
+        self.accuracy = RunningAccuracy() # accuracy of the block
+
+    def step(self, acc):
+        accMean = self.accuracy.mean
+        if acc == 1 and accMean >= self.criterion:
+            return self.level - self.down
+        elif acc == 1:
+            return self.level + self.up
+        elif acc == 0 and accMean >= self.criterion:
+            return self.level
+        elif acc == 0:
+            return self.level + self.upAfterError
+        return self.level + self.up # e.g., nan in previous trial
+
+
+class Staircase(Procedure):
+    '''n-up/m-down staircase: down by stepDown after nDown correct responses in a row, up by stepUp (default:
+    stepDown) after nUp errors in a row; trials without accuracy are skipped.'''
+
+    name = 'staircase'
+
+    def __init__(self, parameter, stepDown, stepUp=None, nDown=3, nUp=1, **kwargs):
+        Procedure.__init__(self, parameter, **kwargs)
+        self.stepDown = stepDown
+        self.stepUp = stepDown if stepUp is None else stepUp
+        self.nDown = nDown
+        self.nUp = nUp
+        self.correctRun = 0
+        self.errorRun = 0
+        self.direction = 0 # of the last step (-1 down, 1 up)
+        self.reversals = 0
+
+    def step(self, acc):
+        if acc is None or acc != acc:
+            return self.level
+        if acc == 1:
+            self.correctRun += 1
+            self.errorRun = 0
+            if self.correctRun < self.nDown:
+                return self.level
+            direction, level = -1, self.level - self.stepDown
+        else:
+            self.errorRun += 1
+            self.correctRun = 0
+            if self.errorRun < self.nUp:
+                return self.level
+            direction, level = 1, self.level + self.stepUp
+        self.correctRun = self.errorRun = 0
+        if self.direction != 0 and direction != self.direction:
+            self.reversals += 1
+        self.direction = direction
+        return level
+
+    def state(self):
+        state = Procedure.state(self)
+        state['Reversals'] = self.reversals
+        return state
+
+
+class Quest(Procedure):
+    '''QUEST: posterior over candidate thresholds (minimum to maximum) for a Weibull psychometric function;
+    each trial is run at the level where the estimated function reaches pThreshold. An update costs
+    O(gridSize), whatever the no. of trials.
+
+    start: prior guess of the threshold (None: the first trial's planned value); startSd: prior SD
+    (default: a quarter of maximum - minimum)
+    gamma: guess rate (e.g., 1/3 with three response keys); delta: lapse rate; beta: slope
+    minimum, maximum: range of thresholds considered (required; minimum > 0)
+    '''
+
+    name = 'quest'
+
+    def __init__(self, parameter, minimum, maximum, pThreshold=0.8, gamma=0.0, delta=0.01, beta=3.5, startSd=None, gridSize=200, **kwargs):
+        Procedure.__init__(self, parameter, minimum=minimum, maximum=maximum, **kwargs)
+        if not 0 < minimum < maximum:
+            raise ValueError('Quest needs 0 < minimum < maximum')
+        if not gamma < pThreshold < 1 - delta:
+            raise ValueError('pThreshold has to be between gamma and 1 - delta')
+        self.gamma = gamma
+        self.delta = delta
+        self.beta = beta
+        self.startSd = (maximum - minimum) / 4.0 if startSd is None else startSd
+        self.thresholds = np.linspace(minimum, maximum, gridSize)
+        self.logPosterior = None
+        # level / threshold at which the psychometric function reaches pThreshold
+        self.scale = (-np.log(1 - (pThreshold - gamma) / (1 - gamma - delta))) ** (1.0 / beta)
+
+    def begin(self):
+        guess = self.level if self.level == self.level else (self.minimum + self.maximum) / 2.0
+        self.logPosterior = -0.5 * ((self.thresholds - guess) / self.startSd) ** 2 # Gaussian prior
+
+    def posterior(self):
+        posterior = np.exp(self.logPosterior - self.logPosterior.max())
+        return posterior / posterior.sum()
+
+    def threshold(self):
+        '''Posterior mean and SD of the threshold.'''
+        if self.logPosterior is None:
+            return np.nan, np.nan
+        posterior = self.posterior()
+        mean = (posterior * self.thresholds).sum()
+        return mean, np.sqrt((posterior * (self.thresholds - mean) ** 2).sum())
+
+    def step(self, acc):
+        if acc is None or acc != acc or self.level != self.level:
+            return self.level
+        pCorrect = self.gamma + (1 - self.gamma - self.delta) * (1 - np.exp(-(float(self.level) / self.thresholds) ** self.beta))
+        self.logPosterior += np.log(pCorrect if acc == 1 else 1 - pCorrect)
+        return self.threshold()[0] * self.scale
+
+    def state(self):
+        state = Procedure.state(self)
+        state['Threshold'], state['ThresholdSd'] = self.threshold()
+        return state
+
+
+def blockProcedures(titrate, default):
+    '''Procedures of a block: none if titrate is False/None, default() if it is True, else titrate itself (a procedure or a list of them).'''
+    if isinstance(titrate, Procedure):
+        return [titrate]
+    if isinstance(titrate, (list, tuple)):
+        return list(titrate)
+    return default() if titrate else []
+
+
+class SessionProcedures(object):
+    '''Default procedures (titrate=True) of each task, made on the task's first block and kept for the session,
+    so their levels carry over from one block to the next.'''
+
+    def __init__(self):
+        self.procedures = {}
+
+    def forBlock(self, task, titrate, default):
+        '''Procedures of a block of task (see blockProcedures); with titrate=True, the task's procedures (default() the first time).'''
+        if titrate and not isinstance(titrate, (Procedure, list, tuple)):
+            if task not in self.procedures:
+                self.procedures[task] = default()
+            procedures = self.procedures[task]
+        else:
+            procedures = blockProcedures(titrate, default)
+        for procedure in procedures:
+            procedure.startBlock()
+        return procedures
+
+
+def benchmark(trials=300, repeats=5):
+    '''Per-trial cost (microseconds) of titrating a block with the old list/np.nanmean rule and with AccuracyRule.'''
+    acc = np.random.binomial(1, 0.85, trials).astype(float)
+
+    def listRule():
+        targetFrames = np.full(trials, 90.0)
+        for i in range(1, trials):
+            allAccuracyList = list(acc[:i])
+            accMean = np.nanmean(allAccuracyList)
+            if allAccuracyList[-1] == 1 and accMean >= 0.8:
+                targetFrames[i] = targetFrames[i-1] - 3
+            elif allAccuracyList[-1] == 1 and accMean < 0.8:
+                targetFrames[i] = targetFrames[i-1] + 1
+            elif allAccuracyList[-1] == 0 and accMean >= 0.8:
+                targetFrames[i] = targetFrames[i-1]
+            elif allAccuracyList[-1] == 0 and accMean < 0.8:
+                targetFrames[i] = targetFrames[i-1] + 6
+            else:
+                targetFrames[i] = targetFrames[i-1] + 1
+        return targetFrames
+
+    def procedureRule():
+        targetFrames = np.full(trials, 90.0)
+        rule = AccuracyRule('targetFrames', 3, 1, 6, start=90.0)
+        for i in range(1, trials):
+            rule.update(acc[i-1])
+            targetFrames[i] = rule.level
+        return targetFrames
+
+    if not np.array_equal(listRule(), procedureRule()):
+        raise AssertionError('AccuracyRule differs from the list rule')
+    return dict((name, min(timeit.repeat(function, number=1, repeat=repeats)) / trials * 1e6)
+                for name, function in [('list/np.nanmean', listRule), ('AccuracyRule', procedureRule)])
+
+
+if __name__ == '__main__':
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    for name, perTrial in sorted(benchmark(trials).items()):
+        print('{:<16} {:8.1f} us per trial ({} trials)'.format(name, perTrial, trials))
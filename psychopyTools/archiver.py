@@ -0,0 +1,261 @@
+'''Move data files into the Data folder and bundle new or changed files for upload.
+
+The Script2 files used to move every csv into Data/, delete all existing zip files and re-zip the whole
+folder on every run, so after a semester thousands of files were recompressed each time. archiveData
+keeps a manifest (Data/_manifest.json) with the size, modification time and checksum of every file that
+has been bundled, and only puts new or changed files into the next upload bundle
+(_UPLOAD_NEW_FILES_<time>.zip). Files are read, checksummed and compressed in a pool of worker
+threads, written to the bundle one at a time as they come in (never the whole bundle in memory), and the
+bundle is verified (CRC and size of every entry) before the manifest is updated. Earlier bundles are kept
+in Data/Archive.
+
+A bundle holds only the files that are not in an earlier bundle, so the data are complete only if EVERY
+bundle is uploaded, not only the newest. The next run moves the bundles in Data into Data/Archive: upload
+them before running it again.
+
+By default the data files are every kind of file the scripts write (DATAFILES): csv files (with the
+-incomplete files of resumed sessions), backup journals (.jsonl), columnar copies (.npz + .json), .npy
+files and the session state (-session.pkl) and checkpoint (-checkpoint.pkl) files. The files of a session
+that hasn't finished (its state or checkpoint file isn't marked as finished, e.g., after a crash) are left
+where they are, so that the script can still resume it; they are moved once the session has finished.
+
+moveFiles has two modes: all files with the given extensions (what the Script2 files did), or all files
+whose name starts with a participant's number (what Stimuli/Script2moveFilesToDataFolder.py did):
+    moveFiles(outputDir='Data') # move data files into Data
+    moveFiles(outputDir='Data', participant=7) # move 007-* files into Data
+    archiveData(dataDir='Data') # bundle new/changed data files in Data
+
+From the command line (in the task's folder):
+    python archiver.py archive [ext ...]
+    python archiver.py participant 7
+'''
+
+from __future__ import print_function
+import os
+import sys
+import json
+import time
+import zlib
+import struct
+import hashlib
+import zipfile
+from multiprocessing.pool import ThreadPool
+try:
+    from .sessionTimeline import loadTimeline
+    from .checkpoint import RestoredSession, readRecords
+except (ValueError, ImportError): # run as a script
+    from sessionTimeline import loadTimeline
+    from checkpoint import RestoredSession, readRecords
+
+MANIFEST = '_manifest.json'
+DATAFILES = ('csv', 'jsonl', 'npz', 'json', 'npy', '-session.pkl', '-checkpoint.pkl') # endings of the files the scripts write
+BUNDLEPREFIX = '_UPLOAD_NEW_FILES_' # each bundle holds only new or changed files: upload all of them
+
+
+def unfinishedSessions(directory):
+    '''Prefixes ({participant:03d}-{startTime}-) of the sessions in directory whose state or checkpoint file isn't marked as finished.'''
+    prefixes = []
+    for filename in sorted(os.listdir(directory)):
+        path = os.path.join(directory, filename)
+        if filename.endswith('-session.pkl'):
+            state = loadTimeline(path)
+            finished = state is not None and state['finished']
+            prefix = filename[:-len('session.pkl')]
+        elif filename.endswith('-checkpoint.pkl'):
+            finished = RestoredSession(readRecords(path)).finished
+            prefix = filename[:-len('checkpoint.pkl')]
+        else:
+            continue
+        if not finished:
+            prefixes.append(prefix)
+    return prefixes
+
+
+def moveFiles(outputDir='Data', extensions=DATAFILES, participant=None, sourceDir=None):
+    '''Move files from sourceDir (default: current directory) into outputDir and return their names.
+
+    extensions: move files ending with one of these (ignored if participant is given)
+    participant: if given, move files starting with the participant's number instead (e.g., 007-...)
+    Files of sessions that haven't finished are left in sourceDir (see unfinishedSessions).
+    '''
+    if sourceDir is None:
+        sourceDir = os.getcwd()
+    dataDirectory = os.path.join(sourceDir, outputDir)
+    if not os.path.exists(dataDirectory):
+        os.mkdir(dataDirectory)
+
+    unfinished = tuple(unfinishedSessions(sourceDir))
+    moved = []
+    for filename in sorted(os.listdir(sourceDir)):
+        if not os.path.isfile(os.path.join(sourceDir, filename)):
+            continue
+        if participant is not None:
+            move = filename.startswith("{:03}".format(int(participant)))
+        else:
+            move = filename.endswith(tuple(extensions))
+        if move and unfinished and filename.startswith(unfinished):
+            print('{}: left in place (session not finished, it can still be resumed)'.format(filename))
+            continue
+        if move:
+            os.rename(os.path.join(sourceDir, filename), os.path.join(dataDirectory, filename))
+            moved.append(filename)
+    return moved
+
+
+def loadManifest(dataDir):
+    '''Manifest of dataDir: filename -> dict with size, mtime, sha1, crc and bundle.'''
+    path = os.path.join(dataDir, MANIFEST)
+    if not os.path.isfile(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _saveManifest(dataDir, manifest):
+    path = os.path.join(dataDir, MANIFEST)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    if os.path.exists(path):
+        os.remove(path)
+    os.rename(path + '.tmp', path)
+
+
+def _sha1(path):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def changedFiles(dataDir='Data', extensions=DATAFILES, manifest=None):
+    '''Files in dataDir with one of extensions that are new or changed since they were last bundled.'''
+    if manifest is None:
+        manifest = loadManifest(dataDir)
+    changed = []
+    for filename in sorted(os.listdir(dataDir)):
+        path = os.path.join(dataDir, filename)
+        if not os.path.isfile(path) or not filename.endswith(tuple(extensions)) or filename == MANIFEST:
+            continue
+        entry = manifest.get(filename)
+        stat = os.stat(path)
+        if entry is not None and entry['size'] == stat.st_size:
+            if entry['mtime'] == int(stat.st_mtime):
+                continue
+            if entry['sha1'] == _sha1(path): # touched but not changed
+                entry['mtime'] = int(stat.st_mtime)
+                continue
+        changed.append(filename)
+    return changed
+
+
+def _compress(path):
+    '''Read, checksum and deflate one file (runs on a worker thread; zlib and hashlib release the GIL).'''
+    with open(path, 'rb') as f:
+        data = f.read()
+    stat = os.stat(path)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15) # raw deflate stream, as stored in zip files
+    compressed = compressor.compress(data) + compressor.flush()
+    return {'path': path, 'size': len(data), 'mtime': int(stat.st_mtime), 'sha1': hashlib.sha1(data).hexdigest(),
+            'crc': zlib.crc32(data) & 0xffffffff, 'compressed': compressed}
+
+
+class _ZipStream(object):
+    '''Write a zip file entry by entry from data that has already been deflated.'''
+
+    def __init__(self, path):
+        self.file = open(path, 'wb')
+        self.central = []
+
+    def add(self, name, result):
+        name = name.encode('utf-8')
+        t = time.localtime(result['mtime'])
+        dosTime = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+        dosDate = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+        offset = self.file.tell()
+        self.file.write(struct.pack('<IHHHHHIIIHH', 0x04034b50, 20, 0x0800, zipfile.ZIP_DEFLATED, dosTime, dosDate,
+                                    result['crc'], len(result['compressed']), result['size'], len(name), 0))
+        self.file.write(name)
+        self.file.write(result['compressed'])
+        self.central.append(struct.pack('<IHHHHHHIIIHHHHHII', 0x02014b50, 20, 20, 0x0800, zipfile.ZIP_DEFLATED, dosTime, dosDate,
+                                        result['crc'], len(result['compressed']), result['size'], len(name), 0, 0, 0, 0, 0, offset) + name)
+
+    def close(self):
+        start = self.file.tell()
+        for record in self.central:
+            self.file.write(record)
+        size = self.file.tell() - start
+        self.file.write(struct.pack('<IHHHHIIH', 0x06054b50, 0, 0, len(self.central), len(self.central), size, start, 0))
+        self.file.close()
+
+
+def verifyBundle(path, expected):
+    '''Check every entry of bundle path against expected (filename -> dict with crc and size); raise IOError if it doesn't match.'''
+    with zipfile.ZipFile(path, 'r') as z:
+        bad = z.testzip()
+        if bad is not None:
+            raise IOError('{}: {} is corrupt'.format(path, bad))
+        infos = dict((info.filename, info) for info in z.infolist())
+    for filename, entry in expected.items():
+        info = infos.get(filename)
+        if info is None or (info.CRC & 0xffffffff) != entry['crc'] or info.file_size != entry['size']:
+            raise IOError('{}: {} does not match the data file'.format(path, filename))
+
+
+def archiveData(dataDir='Data', extensions=DATAFILES, workers=4):
+    '''Bundle files in dataDir that are new or changed since the last run; return the bundle's path (None if nothing changed).
+
+    The bundle doesn't contain the files of earlier bundles: every bundle has to be uploaded.
+    '''
+    manifest = loadManifest(dataDir)
+    changed = changedFiles(dataDir, extensions, manifest)
+    if not changed:
+        _saveManifest(dataDir, manifest) # mtimes of touched-but-unchanged files
+        print('No new or changed files in {}'.format(dataDir))
+        return None
+
+    # earlier upload bundles (which should have been uploaded by now) are kept in Archive
+    archiveDir = os.path.join(dataDir, 'Archive')
+    if not os.path.exists(archiveDir):
+        os.mkdir(archiveDir)
+    for filename in os.listdir(dataDir):
+        if filename.startswith(BUNDLEPREFIX) and filename.endswith('.zip'):
+            os.rename(os.path.join(dataDir, filename), os.path.join(archiveDir, filename))
+
+    stamp = time.strftime('%Y-%m-%d-%H-%M-%S', time.localtime())
+    bundleName = BUNDLEPREFIX + stamp + '.zip'
+    n = 1
+    while os.path.exists(os.path.join(archiveDir, bundleName)): # two runs in the same second
+        n += 1
+        bundleName = BUNDLEPREFIX + stamp + '-{}.zip'.format(n)
+    bundlePath = os.path.join(dataDir, bundleName)
+    entries = {}
+    pool = ThreadPool(workers)
+    try:
+        stream = _ZipStream(bundlePath)
+        for filename, result in zip(changed, pool.imap(_compress, [os.path.join(dataDir, f) for f in changed])):
+            stream.add(filename, result)
+            entries[filename] = {'size': result['size'], 'mtime': result['mtime'], 'sha1': result['sha1'], 'crc': result['crc'], 'bundle': bundleName}
+        stream.close()
+    finally:
+        pool.close()
+        pool.join()
+
+    verifyBundle(bundlePath, entries)
+    manifest.update(entries)
+    _saveManifest(dataDir, manifest)
+    print('{}: {} new or changed files'.format(bundleName, len(entries)))
+    return bundlePath
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in ('archive', 'participant') or (sys.argv[1] == 'participant' and len(sys.argv) != 3):
+        print('usage: python archiver.py archive [ext ...] | participant number')
+        sys.exit(1)
+    if sys.argv[1] == 'participant':
+        for name in moveFiles(outputDir='Data', participant=int(sys.argv[2])):
+            print(os.path.join('Data', name))
+    else:
+        extensions = tuple(sys.argv[2:]) or DATAFILES
+        moveFiles(outputDir='Data', extensions=extensions)
+        archiveData(dataDir='Data', extensions=extensions)
@@ -0,0 +1,183 @@
+'''Append-only journal behind the -backup.csv files.
+
+The block runners used to keep every trial of the session in a global dataframe grown with
+DataFrame.append(...).reset_index() and rewrite the whole dataframe to the task's -backup.csv file after
+each trial, which is O(n^2) in time and memory over a long block. BackupJournal appends one line of JSON
+per trial to a journal file next to the backup file (O(1) per trial) and only rewrites (compacts) the
+backup csv every compactEvery trials and when a block ends. If a session crashes between compactions,
+recoverBackup rebuilds the backup csv from the journal with the same content it would have had.
+
+Usage (in place of dataXAll = pd.DataFrame()):
+    dataStroopAll = BackupJournal()
+    dataStroopAll.open(filenamebackup) # at the start of each block
+    dataStroopAll.append(trialsDf[i:i+1]) # after each trial
+    dataStroopAll.compact() # end of block (or before quitting)
+    dataStroopAll.dataFrame() # all trials of the session so far
+
+Run as a script to rebuild backup files from their journals:
+    python backupJournal.py 001-2019-01-01-10-00-00-stroop-backup.csv [...]
+'''
+
+from __future__ import print_function
+import os
+import sys
+import json
+import numbers
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+
+def journalFilename(filename):
+    '''Journal file that belongs to backup csv filename (e.g., 001-...-stroop-backup.jsonl).'''
+    return os.path.splitext(filename)[0] + '.jsonl'
+
+
+def _jsonValue(value):
+    '''Convert a dataframe cell to something json can store (cells it can't store are written as to_csv would write them).'''
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (bool, numbers.Number)):
+        return value
+    if isinstance(value, str):
+        return value
+    try:
+        if isinstance(value, unicode): # python 2
+            return value
+    except NameError:
+        pass
+    return str(value)
+
+
+def _readJournal(filename):
+    '''Rows (OrderedDicts) in journal filename; a partly written last line (crash mid-write) is ignored.'''
+    rows = []
+    if not os.path.isfile(filename):
+        return rows
+    with open(filename, 'r') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line, object_pairs_hook=OrderedDict))
+            except ValueError:
+                break
+    return rows
+
+
+def _toDataFrame(rows, columns):
+    '''Dataframe with rows in journal order and columns in the order they first appeared.'''
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame.from_records(rows, columns=columns)
+
+
+def _writeCsv(df, filename):
+    '''Write df to filename via a temporary file so a crash never leaves a half-written backup file.'''
+    tmp = filename + '.tmp'
+    df.to_csv(tmp, index=False)
+    if hasattr(os, 'replace'):
+        os.replace(tmp, filename)
+    else: # python 2
+        if os.path.exists(filename):
+            os.remove(filename)
+        os.rename(tmp, filename)
+
+
+def recoverBackup(filename):
+    '''Rebuild backup csv filename from its journal (e.g., after a crash) and return its content as a dataframe.'''
+    rows = _readJournal(journalFilename(filename))
+    columns = []
+    for row in rows:
+        for column in row:
+            if column not in columns:
+                columns.append(column)
+    df = _toDataFrame(rows, columns)
+    if rows:
+        _writeCsv(df, filename)
+    return df
+
+
+class BackupJournal(object):
+    '''All trials of one task in this session, journalled to the task's -backup.csv file.
+
+    compactEvery: rewrite the backup csv after this many journalled trials (it's always rewritten by compact())
+    '''
+
+    def __init__(self, compactEvery=50):
+        self.compactEvery = compactEvery
+        self.filename = None # backup csv file
+        self.rows = [] # OrderedDict per trial, in the order they were appended
+        self.columns = [] # column names in the order they first appeared
+        self.uncompacted = 0 # no. of rows appended since the backup csv was last written
+        self._journal = None # open journal file
+        self._df = None # cached dataFrame()
+
+    def open(self, filename):
+        '''Journal to backup csv filename from now on (a journal left by an earlier run with the same filename is continued).'''
+        if filename == self.filename:
+            return
+        self.close()
+        self.filename = filename
+        existing = _readJournal(journalFilename(filename))
+        if existing and not self.rows:
+            self._addRows(existing)
+        if self.rows or os.path.isfile(journalFilename(filename)): # start clean (drops a partly written last line)
+            with open(journalFilename(filename), 'w') as f:
+                for row in self.rows:
+                    f.write(json.dumps(row) + '\n')
+        self.uncompacted = len(self.rows)
+
+    def _addRows(self, rows):
+        for row in rows:
+            for column in row:
+                if column not in self.columns:
+                    self.columns.append(column)
+            self.rows.append(row)
+        self._df = None
+
+    def append(self, df):
+        '''Journal the rows in df (e.g., trialsDf[i:i+1] or TrialRows); the backup csv is rewritten every compactEvery rows.'''
+        if self.filename is None:
+            raise ValueError('BackupJournal.open(filename) has to be called before append()')
+        if self._journal is None: # journal file is only created once there's something to write
+            self._journal = open(journalFilename(self.filename), 'a')
+        rows = []
+        for values in (df.records() if hasattr(df, 'toDataFrame') else df.itertuples(index=False)):
+            rows.append(OrderedDict((column, _jsonValue(value)) for column, value in zip(df.columns, values)))
+        for row in rows:
+            self._journal.write(json.dumps(row) + '\n')
+        self._journal.flush()
+        self._addRows(rows)
+        self.uncompacted += len(rows)
+        if self.compactEvery is not None and self.uncompacted >= self.compactEvery:
+            self.compact()
+
+    def compact(self):
+        '''Rewrite the backup csv with all journalled rows.'''
+        if self.filename is None or not self.rows:
+            return
+        _writeCsv(self.dataFrame(), self.filename)
+        self.uncompacted = 0
+
+    def dataFrame(self):
+        '''All journalled rows as a dataframe (same content as the backup csv).'''
+        if self._df is None:
+            self._df = _toDataFrame(self.rows, self.columns)
+        return self._df
+
+    def close(self):
+        '''Compact and close the journal file.'''
+        self.compact()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def __len__(self):
+        return len(self.rows)
+
+
+if __name__ == '__main__':
+    for backupFile in sys.argv[1:]:
+        recovered = recoverBackup(backupFile)
+        print('{}: {} rows recovered'.format(backupFile, recovered.shape[0]))
@@ -0,0 +1,416 @@
+'''Trial loop shared by the block runners of the speeded-response tasks.
+
+runStroopBlock, runShiftingLetterNumberBlock, runMentalMathBlock, runVisualSearchBlock, ... each carried
+their own copy of the same loop: overall trial numbers, time limits, titration, the response window (frame
+loop, stimulus TTL, scoring), the special keys, saving, the ITI and pausing after missed trials. The loop
+now lives here once. A block runner still generates its trials and creates its stimuli, then hands the
+engine a TrialTask plug-in that draws, scores and gives feedback:
+
+    class StroopTrials(TrialTask):
+        responseKeys = ['r', 'g', 'y']
+        def prepare(self, i, thisTrial, trials): # in the previous trial's ITI
+            stroopStimulus.setText(thisTrial['word'])
+        def showStimulus(self, i, thisTrial, trials):
+            stroopStimulus.setAutoDraw(True)
+        def hideStimulus(self, i, thisTrial, trials):
+            stroopStimulus.setAutoDraw(False)
+
+    trialsDf = blockRunner.run(StroopTrials(), trialsDf, filename, dataStroopAll, blockType=blockType, saveData=saveData, titrate=titrate,
+                               deadlineFrames=[rtMaxFrames, info.get('targetFrames'), frameRate.frames(3.0)], blockMaxTimeSeconds=blockMaxTimeSeconds)
+    if trialsDf is None: # time out or block skipped
+        return None
+
+Tasks whose trials aren't a single scored keypress override more hooks: drawFrame() draws what moves on
+every frame of the response window (runDotMotionBlock's dots), respond() records a choice instead of scoring
+it (the effort/reward choice and demand selection blocks), and afterResponse()/afterITI() run what comes
+between the response and the save, e.g., an embedded block of the effortful task:
+
+    class ChoiceTrials(TrialTask):
+        responseKeys = ['f', 'j']
+        metricColumns = ('acc', 'rt', 'accUpdating')
+        def respond(self, key, i, thisTrial, trials):
+            trials[i, 'choiceText'] = 'baseline' if key == 'f' else 'effortful'
+            return 15 if key == 'f' else 16 # TTL
+        def afterITI(self, i, thisTrial, trials):
+            trials[i, 'accUpdating'] = runMentalMathBlock(trials=1, ...)['acc'].iloc[0]
+
+One BlockRunner is created per script (after the window, clocks and parallel port). It doesn't import
+psychopy: the window, event module, clock class and port are passed in.
+'''
+
+from __future__ import print_function
+import time
+import random
+import numpy as np
+from .trialBuffer import TrialBuffer
+from .trialPlan import TrialPlan
+from .keyboardInput import KeyboardInput, EventBackend
+from .frameRate import FrameRate
+from .itiScheduler import ITIScheduler
+from .adaptiveProcedure import AccuracyRule, SessionProcedures
+from .sessionMetrics import SessionMetrics
+from .sessionClock import SessionClock
+
+
+class TrialTask(object):
+    '''Task plug-in for BlockRunner.run(); override the hooks the task needs.'''
+
+    responseKeys = [] # keys that count as a response (BlockRunner.specialKeys are listened for too)
+    keyNames = {} # key name -> its value in the correctKey column where they differ, e.g., {'comma': ','}
+    correctTTL = 15 # TTL sent (and stored as responseTTL) after a correct response
+    incorrectTTL = 16 # ... after an incorrect response
+    keyColumns = () # columns besides resp that store the key pressed (cleared with resp after a special key)
+    conditionColumn = None # column the trials are tallied by in SessionMetrics besides the task as a whole (e.g., 'congruency')
+    metricColumns = ('acc', 'rt') # columns of each trial published to SessionMetrics (none: not published)
+    resultColumns = ('acc', 'responseTTL') # columns besides rt set to NaN after a special key
+    itiDurations = None # ITI durations (seconds) to choose from (None: the runner's)
+    feedbackBeforeITI = False # True: feedback() right after the response, before the ITI and afterITI()
+    frameRate = FrameRate() # set to the runner's FrameRate by BlockRunner.run()
+
+    def configure(self, **params):
+        '''Set up the task for its next block (TaskSession.run): params (e.g., blockType, rewardSchedule) become attributes.'''
+        for name, value in params.items():
+            setattr(self, name, value)
+
+    def procedures(self):
+        '''Adaptive procedures of a block run with titrate=True (see adaptiveProcedure.py): the response deadline (targetFrames) by the accuracy rule.'''
+        frames = self.frameRate.frames
+        return [AccuracyRule('targetFrames', frames(0.05), frames(0.017), frames(0.1))] # minus 50 ms, plus 17 ms, plus 100 ms
+
+    def prepare(self, i, thisTrial, trials):
+        '''Set up trial i's stimuli that aren't on the screen (setText, setColor, setPos, ...); runs in the previous trial's ITI if it fits.'''
+        pass
+
+    def showStimulus(self, i, thisTrial, trials):
+        '''Draw trial i's stimuli (setAutoDraw(True)); may flip frames first (fixation, digits, ...). The response window starts on the next flip.'''
+        pass
+
+    def drawFrame(self, frameN, i, thisTrial, trials):
+        '''Draw what changes on every frame of the response window (e.g., moving dots); called before each of its flips.'''
+        pass
+
+    def score(self, key, i, thisTrial, trials):
+        '''Whether key is the correct response on trial i.'''
+        return self.keyNames.get(key, key) == thisTrial['correctKey']
+
+    def respond(self, key, i, thisTrial, trials):
+        '''Record response key on trial i (acc, scored by score()); return the TTL to send and store as responseTTL (None: no TTL).
+        Also called for the special keys; resultColumns and keyColumns are cleared afterwards.'''
+        acc = 1 if self.score(key, i, thisTrial, trials) else 0
+        trials[i, 'acc'] = acc
+        return self.correctTTL if acc else self.incorrectTTL
+
+    def noResponse(self, i, thisTrial, trials):
+        '''Record that no response was made on trial i (rt is set to NaN by the runner).'''
+        trials[i, 'acc'] = 0
+
+    def hideStimulus(self, i, thisTrial, trials):
+        '''Remove trial i's stimuli at the end of the response window (the screen is flipped right after).'''
+        pass
+
+    def clearScreen(self):
+        '''Remove everything still drawn, before the block is skipped or paused.'''
+        pass
+
+    def afterResponse(self, i, thisTrial, trials):
+        '''Anything between the response window and the ITI of trial i (e.g., ratings); not called after a special key.'''
+        pass
+
+    def afterITI(self, i, thisTrial, trials):
+        '''Anything after the ITI that trial i's results depend on (e.g., an embedded block of another task); runs before the trial is published and saved.'''
+        pass
+
+    def tally(self, i, thisTrial, trials):
+        '''Values of trial i published to SessionMetrics (name -> value; default: metricColumns).'''
+        return dict((column, trials[i, column]) for column in self.metricColumns)
+
+    def feedback(self, i, thisTrial, trials):
+        '''Feedback after trial i (feedback=True; called after afterITI(), or before the ITI with feedbackBeforeITI).'''
+        pass
+
+    def endTrial(self, i, thisTrial, trials):
+        '''Anything left to do after trial i (e.g., a brief pause before the next trial).'''
+        pass
+
+    def endBlock(self):
+        '''Anything left to do after the last trial of a block that wasn't timed out or skipped (e.g., remove cues, a pause).'''
+        pass
+
+
+class BlockRunner(object):
+    '''Run blocks of trials for a script.
+
+    win, event, quit: the window, psychopy.event and core.quit
+    ledger: the script's SessionLedger
+    globalClock: clock of the whole session (elapsedTime column)
+    ISI: ITIScheduler (or core.StaticPeriod) for the inter-trial interval; saving and the next trial's prepare() run within it (see itiScheduler.py)
+    itiDurations: ITI durations (seconds) to choose from on each trial (info['ITIDuration'])
+    clock: clock class for the response and trial clocks (core.Clock)
+    port: parallel port for TTLs (None: don't send TTLs)
+    pause: called after pauseAfterMissingNTrials missed trials in a row (e.g., instructions to respond faster)
+    keyboard: KeyboardInput for the responses (default: psychopy.event time stamps, see keyboardInput.py)
+    frameTimer: FrameTimer of win (fixation/stimulus/feedback timing columns, see frameTiming.py; None: no timing columns)
+    frameRate: FrameRate of win (titration steps and default deadline; None: 60 Hz, see frameRate.py)
+    metrics: the script's SessionMetrics; each trial's task.tally() (default: acc and rt) is published to it (pause rule, monitor; see sessionMetrics.py)
+    sessionProcedures: the script's SessionProcedures; the levels of titrate=True blocks carry over to the task's next block (see adaptiveProcedure.py)
+    sessionClock: the script's SessionClock (block and experiment time limits; default: one on globalClock and ledger, see sessionClock.py)
+    '''
+
+    specialKeys = ['backslash', 'bracketright'] # quit the script, skip to the next block
+
+    def __init__(self, win, event, quit, ledger, globalClock, ISI, itiDurations, clock, port=None, pause=None, keyboard=None, frameTimer=None, frameRate=None, metrics=None, sessionProcedures=None, sessionClock=None):
+        self.win = win
+        self.event = event
+        self.quit = quit
+        self.ledger = ledger
+        self.globalClock = globalClock
+        self.ISI = ISI if isinstance(ISI, ITIScheduler) else ITIScheduler(ISI, globalClock)
+        self.itiDurations = itiDurations
+        self.port = port
+        self.pause = pause
+        self.trialClock = clock()
+        self.keyboard = keyboard if keyboard is not None else KeyboardInput(EventBackend(event, clock()))
+        self.frameTimer = frameTimer if frameTimer is not None and frameTimer.enabled else None
+        self.frameRate = frameRate if frameRate is not None else FrameRate()
+        self.metrics = metrics if metrics is not None else SessionMetrics()
+        self.sessionProcedures = sessionProcedures if sessionProcedures is not None else SessionProcedures()
+        self.sessionClock = sessionClock if sessionClock is not None else SessionClock(globalClock, ledger)
+
+    def run(self, task, trialsDf, filename, journal, blockType='', saveData=True, feedback=False, titrate=False, pauseAfterMissingNTrials=None, deadlineFrames=None, extra=None, taskName=None, checkpoint=None,
+            blockMaxTimeSeconds=None, experimentMaxTimeSeconds=None):
+        '''Run the trials in trialsDf with task; return the results as a dataframe (None if the block timed out or was skipped).
+
+        filename, journal: csv file and BackupJournal of the task (journal None: csv file only)
+        blockType: no TTLs are sent in 'practice' blocks
+        titrate: True: task.procedures(), kept from the task's last block; or procedures for the block (an adaptiveProcedure.Procedure or a list of them)
+        deadlineFrames, extra: passed to TrialPlan (fallback response deadlines, default 3 s; per-trial values worked out in advance)
+        taskName: name the trials are published to metrics and the procedures are kept under (default: filename)
+        checkpoint: BlockCheckpoint of the block (see checkpoint.py): trials completed before the session was resumed are skipped, saved trials are checkpointed
+        blockMaxTimeSeconds, experimentMaxTimeSeconds: time limits of the block (see sessionClock.py)
+        '''
+        completed = sorted(checkpoint.completed) if checkpoint is not None else []
+        if completed: # resumed block: the rest of its trials are numbered like the ones saved before the crash
+            trialsDf['blockNumber'] = trialsDf.loc[completed[0], 'blockNumber']
+        else:
+            trialsDf['blockNumber'] = self.ledger.nextBlockNumber(filename) # largest block number saved to filename so far plus 1
+        blockTimer = self.sessionClock.startBlock(filename, blockMaxTimeSeconds, experimentMaxTimeSeconds)
+        timer = self.frameTimer
+        outerTrial = timer.suspend() if timer is not None else None # a block run within a trial (e.g., from afterITI()) times its own trials
+        try:
+            return self._runTrials(task, trialsDf, filename, journal, blockTimer, blockType, saveData, feedback, titrate, pauseAfterMissingNTrials, deadlineFrames, extra, taskName, checkpoint)
+        finally:
+            if timer is not None:
+                timer.restore(outerTrial)
+
+    def _runTrials(self, task, trialsDf, filename, journal, blockTimer, blockType, saveData, feedback, titrate, pauseAfterMissingNTrials, deadlineFrames, extra, taskName, checkpoint):
+        '''The trial loop of run().'''
+        if taskName is None:
+            taskName = filename
+        task.frameRate = self.frameRate # titration steps in seconds
+        procedures = self.sessionProcedures.forBlock(taskName, titrate, task.procedures) # adaptive parameters (see adaptiveProcedure.py)
+        if deadlineFrames is None:
+            deadlineFrames = (self.frameRate.frames(3.0),)
+        itiDurations = task.itiDurations if task.itiDurations is not None else self.itiDurations
+        sendTTL = self.port is not None and blockType != 'practice'
+        win = self.win
+        trials = TrialBuffer(trialsDf) # typed result columns for the trial loop (see trialBuffer.py)
+        plan = TrialPlan(trialsDf, deadlineFrames=deadlineFrames, extra=extra) # read-only trial parameters for the loop (see trialPlan.py)
+        keyList = list(task.responseKeys) + self.specialKeys
+        timer = self.frameTimer
+        for column in (timer.columns if timer is not None else []) + ['itiOverrun']: # same columns in every row of the csv file
+            if column not in trials.columns: # (restored with the completed trials when resuming)
+                trials.fill(column, np.nan)
+        self.metrics.startBlock(taskName)
+        if checkpoint is not None:
+            checkpoint.writeAfter(self.ledger, filename) # a trial is checkpointed once its row is in the csv file
+        prepared = set() # trials whose stimuli are set up
+
+        def prepare(j):
+            task.prepare(j, plan[j], trials)
+            prepared.add(j)
+
+        for position, (i, thisTrial) in enumerate(plan):
+            if checkpoint is not None and checkpoint.isCompleted(i): # completed before the session was resumed
+                for procedure in procedures:
+                    procedure.resume(i, trials)
+                self._record(task, taskName, i, thisTrial, trials)
+                continue
+
+            # if there's a max time for this block or for the entire experiment, end block when time's up
+            timeOut = blockTimer.timeUp()
+            if timeOut is not None:
+                print("{} time out".format(timeOut))
+                self._endBlock(filename, checkpoint)
+                return None
+
+            trials[i, 'overallTrialNum'] = self.ledger.reserveTrialNum(filename) # the previous trial's row may still be queued for this ITI
+            if sendTTL:
+                self.port.setData(0) # make sure all pins are low before new trial
+            if timer is not None:
+                timer.startTrial()
+
+            for procedure in procedures:
+                procedure.apply(i, trials)
+            try:
+                targetFramesCurrentTrial = int(trials[i, 'targetFrames']) # titrated or planned deadline
+            except:
+                targetFramesCurrentTrial = thisTrial['deadlineFrames'] # fallback resolved when the plan was compiled
+
+            if i not in prepared:
+                self.ISI.run('prepare') # if it didn't fit in the last ITI
+            if i not in prepared: # first trial, or its preparation was dropped by a block run in between
+                prepare(i)
+            if timer is not None:
+                timer.phase('fixation')
+            task.showStimulus(i, thisTrial, trials)
+            if timer is not None:
+                timer.phase('stimulus')
+
+            self.keyboard.start(win, keyList) # clear key presses; RTs are timed from the next flip
+            win.callOnFlip(self.trialClock.reset) # reset trial clock on next flip
+
+            for frameN in range(targetFramesCurrentTrial):
+                if blockTimer.deadlinePassed(): # time limit reached mid-trial
+                    break
+                if frameN == 0: # on first frame/flip/refresh
+                    if sendTTL:
+                        win.callOnFlip(self.port.setData, int(thisTrial['TTLStim']))
+                elif self.keyboard.ready() and trials[i, 'resp'] is None: # if a response has been made
+                    key, rt = self.keyboard.getResponse()
+                    trials[i, 'rt'] = rt # store RT (key event time relative to the stimulus flip)
+                    trials[i, 'resp'] = key # store response
+                    for column in task.keyColumns:
+                        trials[i, column] = key
+                    responseTTL = task.respond(key, i, thisTrial, trials) # score (acc) or record the choice
+                    if responseTTL is not None:
+                        if sendTTL:
+                            self.port.setData(responseTTL)
+                        trials[i, 'responseTTL'] = responseTTL
+                    if timer is not None:
+                        timer.phase(None) # the next flip ends the stimulus
+                    task.hideStimulus(i, thisTrial, trials) # remove stimulus from screen
+                    win.flip() # clear screen
+                    break # response made: end trial and move on to intertrial interval
+                task.drawFrame(frameN, i, thisTrial, trials)
+                win.flip()
+
+            # if no response has been made within allowed time, remove stimuli and record accuracy
+            if trials[i, 'resp'] is None:
+                task.noResponse(i, thisTrial, trials)
+                trials[i, 'rt'] = np.nan
+                if timer is not None:
+                    timer.phase(None)
+                task.hideStimulus(i, thisTrial, trials)
+                win.flip() # clear screen
+
+            # if time limit was reached before a response, end block without saving the unfinished trial
+            if trials[i, 'resp'] is None and blockTimer.deadlinePassed():
+                print("{} time out".format(blockTimer.expiredLimit()))
+                self._endBlock(filename, checkpoint)
+                return None
+
+            if sendTTL:
+                self.port.setData(0) # parallel port: set all pins to low
+
+            trials[i, 'elapsedTime'] = self.globalClock.getTime() # store total elapsed time in seconds
+            blockTimer.trialEnded(trials[i, 'elapsedTime'])
+            trials[i, 'endTime'] = str(time.strftime('%Y-%m-%d-%H-%M-%S', time.localtime())) # store current time
+            iti = round(random.choice(itiDurations), 2) # randomly select an ITI duration
+            trials[i, 'iti'] = iti # store ITI duration
+
+            # if any special keys pressed
+            if trials[i, 'resp'] in self.specialKeys:
+                trials[i, 'rt'] = np.nan
+                for column in task.resultColumns:
+                    trials[i, column] = np.nan
+                for column in task.keyColumns:
+                    trials[i, column] = None
+                self._endBlock(filename) # earlier trials' rows first
+                if trials[i, 'resp'] == 'backslash': # quit
+                    trials[i, 'resp'] = None
+                    self._save(self._timed(trials, i), filename, journal, saveData, checkpoint, i, compact=True)
+                    self.ledger.close() # write out queued rows before quitting
+                    self.quit()
+                else: # skip to next block (resp keeps 'bracketright')
+                    task.clearScreen()
+                    win.flip()
+                    self._save(self._timed(trials, i), filename, journal, saveData, checkpoint, i, compact=True)
+                    if checkpoint is not None:
+                        checkpoint.finish()
+                    return None
+
+            task.afterResponse(i, thisTrial, trials)
+            if feedback and task.feedbackBeforeITI:
+                if timer is not None:
+                    timer.phase('feedback')
+                task.feedback(i, thisTrial, trials)
+                if timer is not None:
+                    timer.phase(None) # the next flip (ITI) ends the feedback
+
+            self.ISI.start(iti) # start inter-trial interval...
+            if position + 1 < len(plan): # set up the next trial's stimuli during the ITI
+                self.ISI.defer('prepare', prepare, plan.index[position + 1])
+            trials[i, 'itiOverrun'] = self.ISI.complete() # end inter-trial interval (after the previous trial's row is saved)
+
+            task.afterITI(i, thisTrial, trials)
+            for procedure in procedures:
+                procedure.update(trials[i, 'acc'])
+            self._record(task, taskName, i, thisTrial, trials)
+
+            rows = trials.rows(i)
+            if feedback and not task.feedbackBeforeITI:
+                if timer is not None:
+                    timer.phase('feedback')
+                task.feedback(i, thisTrial, trials)
+            self.ISI.defer('save', self._save, self._timed(trials, i, rows), filename, journal, saveData, checkpoint, i) # saved in the next ITI (or at the end of the block), with the feedback timing
+
+            # if missed too many trials, pause the task
+            if pauseAfterMissingNTrials is not None and self.pause is not None:
+                if self.metrics.missedInARow(taskName) >= pauseAfterMissingNTrials: # if the last N trials were missed
+                    task.clearScreen()
+                    self.pause()
+
+            task.endTrial(i, thisTrial, trials)
+
+        self._endBlock(filename)
+        task.endBlock()
+        if checkpoint is not None:
+            checkpoint.finish()
+        return trials.dataFrame() # results of the trial loop
+
+    def _record(self, task, taskName, i, thisTrial, trials):
+        '''Publish trial i to metrics (tallied by task.conditionColumn too).'''
+        values = task.tally(i, thisTrial, trials)
+        if values:
+            self.metrics.record(taskName, None if task.conditionColumn is None else trials[i, task.conditionColumn], **values)
+
+    def _endBlock(self, filename, checkpoint=None):
+        '''Save the rows still queued for the next ITI; drop the preparation of trials that won't run and give back the
+        trial numbers of rows that weren't saved (an unfinished trial, saveData=False); checkpoint the end of the block.'''
+        self.ISI.run('save')
+        self.ISI.discard('prepare')
+        self.ledger.release(filename)
+        if checkpoint is not None:
+            checkpoint.finish()
+
+    def _timed(self, trials, i, rows=None):
+        '''Trial i's rows (TrialRows; default: a new snapshot) with its frame timing columns filled in.'''
+        if rows is None:
+            rows = trials.rows(i)
+        if self.frameTimer is not None:
+            for column, value in self.frameTimer.endTrial().items():
+                trials[i, column] = value
+                rows.values[rows.columns.index(column)][0] = value
+        return rows
+
+    def _save(self, rows, filename, journal, saveData, checkpoint=None, i=None, compact=False):
+        '''Append trial i's rows to the csv file and the backup journal and checkpoint the trial (compact: write the backup file now).'''
+        if not saveData:
+            return
+        self.ledger.appendRows(rows, filename)
+        if journal is not None:
+            journal.append(rows)
+            if compact:
+                journal.compact()
+        if checkpoint is not None:
+            checkpoint.trialDone(i, rows) # incremental checkpoint
@@ -0,0 +1,243 @@
+'''Incremental checkpoints so a crashed session can be resumed from the trial it stopped at.
+
+The Effort reward task used to keep every block's trials in info[taskName] and np.save the whole info
+dict (pickling the entire session so far) whenever a block ended or was skipped. A SessionCheckpoint
+instead appends small records to {participant:03d}-{startTime}-checkpoint.pkl:
+    'info'  changed info entries since the last checkpoint (delta)
+    'block' start of a block: its planned trials and the random number generator states
+    'trial' one completed trial (row), written once the row is in the csv file (BlockCheckpoint.writeAfter)
+    'end'   end of a block; 'sessionEnd' end of the session
+
+Every top-level block runner call gets the next block index; block runners called from inside another
+block (e.g., the dot motion trial run by runDemandSelection) are part of their parent and aren't
+checkpointed themselves. When resuming, finished blocks are skipped, the interrupted block is rebuilt
+from its planned trials and continues at its first incomplete trial:
+    checkpoint = SessionCheckpoint(checkpointFilename(info['participant'], info['startTime']))
+    blockCheckpoint = checkpoint.startBlock(taskName, trialsDf, info)
+    if blockCheckpoint.finished: return blockCheckpoint.trialsDf
+    trialsDf = blockCheckpoint.trialsDf
+    for i, thisTrial in trialsDf.iterrows():
+        if blockCheckpoint.isCompleted(i): continue
+        ...
+        blockCheckpoint.trialDone(i, trialsDf[i:i+1])
+    blockCheckpoint.finish()
+'''
+
+import os
+import glob
+import random
+import struct
+import threading
+try:
+    import cPickle as pickle # python 2
+except ImportError:
+    import pickle
+import numpy as np
+import pandas as pd
+
+PROTOCOL = 2 # readable by python 2 and 3
+HEADER = struct.Struct('>I') # length prefix of each record
+
+
+def checkpointFilename(participant, startTime):
+    '''Checkpoint file of a session (same prefix as its csv files).'''
+    return "{:03d}-{}-checkpoint.pkl".format(int(participant), startTime)
+
+
+def readRecords(filename):
+    '''Records in checkpoint file filename; a partly written last record (crash mid-write) is ignored.'''
+    records = []
+    if not os.path.isfile(filename):
+        return records
+    with open(filename, 'rb') as f:
+        while True:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                break
+            payload = f.read(HEADER.unpack(header)[0])
+            try:
+                records.append(pickle.loads(payload))
+            except Exception:
+                break
+    return records
+
+
+class RestoredSession(object):
+    '''State of a session rebuilt from its checkpoint records.'''
+
+    def __init__(self, records):
+        self.info = {}
+        self.blocks = [] # per block index: dict with name, plan, randomState, trials (index -> row), finished
+        self.finished = False
+        for record in records:
+            kind = record[0]
+            if kind == 'info':
+                self.info.update(record[1])
+            elif kind == 'block':
+                index, name, plan, randomState = record[1:]
+                del self.blocks[index:] # block was restarted (e.g., resumed before)
+                self.blocks.append({'name': name, 'plan': plan, 'randomState': randomState, 'trials': {}, 'finished': False})
+            elif kind == 'trial':
+                self.blocks[record[1]]['trials'][record[2]] = record[3]
+            elif kind == 'end':
+                self.blocks[record[1]]['finished'] = True
+            elif kind == 'sessionEnd':
+                self.finished = True
+
+    def completedBlocks(self):
+        '''No. of blocks (from the start of the session) that were finished.'''
+        n = 0
+        for block in self.blocks:
+            if not block['finished']:
+                break
+            n += 1
+        return n
+
+    def trialsCompleted(self):
+        '''No. of trials completed over all blocks.'''
+        return sum(len(block['trials']) for block in self.blocks)
+
+    def elapsedTime(self):
+        '''Largest elapsedTime of the completed trials (0 if there are none): the session clock time to carry on from.'''
+        times = [0.0]
+        for block in self.blocks:
+            for row in block['trials'].values():
+                if hasattr(row, 'toDataFrame'): # saved as TrialRows
+                    row = row.toDataFrame()
+                if 'elapsedTime' in row.columns:
+                    times.extend(float(t) for t in row['elapsedTime'] if not pd.isnull(t))
+        return max(times)
+
+
+def findCheckpoint(participant, directory='.'):
+    '''Most recent checkpoint file of participant whose session didn't finish (None if there isn't one).'''
+    pattern = os.path.join(directory, "{:03d}-*-checkpoint.pkl".format(int(participant)))
+    for filename in sorted(glob.glob(pattern), reverse=True): # file names start with startTime, so newest first
+        if not RestoredSession(readRecords(filename)).finished:
+            return filename
+    return None
+
+
+class SessionCheckpoint(object):
+    '''Append-only checkpoint of one session.
+
+    filename: checkpoint file (see checkpointFilename)
+    resume: if True, restore the session saved in filename (see restored) and keep appending to it
+    '''
+
+    def __init__(self, filename, resume=False):
+        self.filename = filename
+        self.restored = RestoredSession(readRecords(filename)) if resume else None
+        self.savedInfo = dict(self.restored.info) if resume else {} # info entries as of the last checkpoint
+        self.blockIndex = 0 # index of the next top-level block
+        self.active = None # BlockCheckpoint of the block that's running
+        self.file = open(filename, 'ab' if resume else 'wb')
+        self.lock = threading.Lock() # trial records are written by the ledger's writer thread
+
+    def _write(self, record):
+        payload = pickle.dumps(record, PROTOCOL)
+        with self.lock:
+            self.file.write(HEADER.pack(len(payload)) + payload)
+            self.file.flush()
+
+    def restoreInfo(self, info):
+        '''Update info with the entries saved in the checkpoint (e.g., startTime, so csv files are appended to).'''
+        if self.restored is not None:
+            info.update(self.restored.info)
+
+    def saveInfo(self, info):
+        '''Save entries of info that changed since the last checkpoint (dataframes are skipped).'''
+        delta = {}
+        for key, value in info.items():
+            if isinstance(value, pd.DataFrame):
+                continue
+            try:
+                changed = key not in self.savedInfo or pickle.dumps(self.savedInfo[key], PROTOCOL) != pickle.dumps(value, PROTOCOL)
+            except Exception: # not picklable
+                continue
+            if changed:
+                delta[key] = value
+        if delta:
+            self._write(('info', delta))
+            self.savedInfo.update(delta)
+
+    def fastForwarding(self):
+        '''Whether a resumed session is still skipping blocks that were finished before (e.g., to skip their instructions).'''
+        return self.restored is not None and self.blockIndex < self.restored.completedBlocks()
+
+    def startBlock(self, name, trialsDf, info=None):
+        '''Checkpoint the start of a block with its planned trials trialsDf and return its BlockCheckpoint.'''
+        if self.active is not None and not self.active.finished: # runner called from inside another block
+            return BlockCheckpoint(self, None, name, trialsDf)
+        if info is not None:
+            self.saveInfo(info)
+        index = self.blockIndex
+        self.blockIndex += 1
+        restored = None
+        if self.restored is not None and index < len(self.restored.blocks) and self.restored.blocks[index]['name'] == name:
+            restored = self.restored.blocks[index]
+        if restored is None:
+            self._write(('block', index, name, trialsDf, (random.getstate(), np.random.get_state())))
+            self.active = BlockCheckpoint(self, index, name, trialsDf)
+        else:
+            random.setstate(restored['randomState'][0])
+            np.random.set_state(restored['randomState'][1])
+            self.active = BlockCheckpoint(self, index, name, restored['plan'].copy(), restored)
+        return self.active
+
+    def close(self):
+        '''Mark the session as finished and close the file (after ledger.close(), so that every trial record has been written).'''
+        if self.file is not None:
+            self._write(('sessionEnd',))
+            self.file.close()
+            self.file = None
+
+
+class BlockCheckpoint(object):
+    '''Checkpoint of one block; trialsDf holds the block's trials (with completed trials restored when resuming).'''
+
+    def __init__(self, checkpoint, index, name, trialsDf, restored=None):
+        self.checkpoint = checkpoint
+        self.index = index # None for a block run from inside another block (not checkpointed)
+        self.name = name
+        self.trialsDf = trialsDf
+        self.completed = set()
+        self.finished = False
+        self.ledger = None # records wait for the rows of filename queued on ledger (see writeAfter)
+        self.filename = None
+        if restored is not None:
+            for i, row in restored['trials'].items():
+                if hasattr(row, 'toDataFrame'): # saved as TrialRows
+                    row = row.toDataFrame()
+                for column in row.columns:
+                    self.trialsDf.loc[i, column] = row[column].iloc[0]
+                self.completed.add(i)
+            self.finished = restored['finished']
+
+    def isCompleted(self, i):
+        '''Whether trial i was completed before the session was resumed.'''
+        return i in self.completed
+
+    def writeAfter(self, ledger, filename):
+        '''Write the trial and end records only once the rows appended to filename before them are in the file, so that
+        a crash never leaves trials checkpointed (and skipped when resuming) whose rows were still queued on ledger's writer.'''
+        self.ledger = ledger
+        self.filename = filename
+
+    def _record(self, record):
+        if self.index is None:
+            return
+        if self.ledger is not None:
+            self.ledger.afterWrite(self.filename, self.checkpoint._write, record)
+        else:
+            self.checkpoint._write(record)
+
+    def trialDone(self, i, row):
+        '''Checkpoint completed trial i (row: trialsDf[i:i+1] or TrialRows).'''
+        self._record(('trial', self.index, i, row))
+
+    def finish(self):
+        '''Checkpoint the end of the block.'''
+        if not self.finished:
+            self._record(('end', self.index))
+        self.finished = True
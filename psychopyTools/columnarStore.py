@@ -0,0 +1,179 @@
+'''Optional columnar copy of the csv outputs (NumPy .npz plus a JSON schema sidecar).
+
+Every csv row repeats the session constants (participant, age, gender, scriptDate, startTime,
+expCondition, taskOrder, ...), and parsing thousands of sessions' csv files back is slow. A columnar
+copy stores those fields once in the JSON sidecar and every other column as a typed NumPy array:
+    001-2018-02-15-12-31-52-stroop.csv -> 001-2018-02-15-12-31-52-stroop.npz + 001-2018-02-15-12-31-52-stroop.json
+
+Turn it on in a script by giving the ledger a ColumnarStore; the columnar files are written when the
+ledger is closed (end of session or backslash quit):
+    ledger = SessionLedger(columnar=ColumnarStore())
+
+readColumnar() loads a columnar file as a dataframe with the csv's columns; toCsv() writes it back in the
+csv layout the R scripts (e.g., checkData.R) read; fromCsv() converts existing csv files. From the command line:
+    python columnarStore.py tocsv 001-2018-02-15-12-31-52-stroop.npz [...]
+    python columnarStore.py fromcsv 001-2018-02-15-12-31-52-stroop.csv [...]
+'''
+
+from __future__ import print_function
+import os
+import sys
+import json
+import numbers
+import numpy as np
+import pandas as pd
+
+SESSIONFIELDS = ['participant', 'age', 'gender', 'handedness', 'ethnicity', 'ses', 'scriptDate', 'startTime', 'expCondition', 'taskOrder']
+FORMATVERSION = 1
+
+
+def columnarFilenames(filename):
+    '''(.npz, .json) files that belong to csv (or .npz/.json) filename.'''
+    base = os.path.splitext(filename)[0]
+    return base + '.npz', base + '.json'
+
+
+def _isMissing(value):
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def _jsonValue(value):
+    if isinstance(value, np.generic):
+        value = value.item()
+    if _isMissing(value):
+        return None
+    return value
+
+
+def _text(value):
+    '''Cell of an object column as it appears in the csv.'''
+    if _isMissing(value):
+        return u''
+    if isinstance(value, float):
+        return u'{!r}'.format(value)
+    if isinstance(value, bytes) and not isinstance(value, str): # python 3 bytes
+        return value.decode('utf-8')
+    try:
+        return value if isinstance(value, unicode) else str(value).decode('utf-8') # python 2
+    except NameError:
+        return str(value)
+
+
+def _typedColumn(values, kinds, integer=False):
+    '''Return (array, integer) for one column; kinds are the numpy dtype kinds the column had in the written rows.'''
+    missing = values.isnull().values
+    if kinds <= set('iu') and not missing.any():
+        return values.values.astype(np.int64), False
+    if kinds <= set('b') and not missing.any():
+        return values.values.astype(bool), False
+    if kinds <= set('iuf'):
+        return values.values.astype(np.float64), integer or kinds <= set('iu')
+    present = [v for v in values if not _isMissing(v)]
+    if all(isinstance(v, numbers.Number) and not isinstance(v, bool) for v in present):
+        return values.values.astype(np.float64), all(isinstance(v, numbers.Integral) for v in present)
+    return np.array([_text(v) for v in values], dtype='U'), False
+
+
+def writeColumnar(chunks, filename, sessionFields=SESSIONFIELDS, integerColumns=()):
+    '''Write dataframes chunks (rows in the order they were appended to csv filename) as filename's columnar files.
+
+    integerColumns: float columns that hold whole numbers which the csv shows without decimals
+    '''
+    chunks = [c for c in chunks if c.shape[0] > 0]
+    if not chunks:
+        return None
+    columns = []
+    for chunk in chunks:
+        for column in chunk.columns:
+            if column not in columns:
+                columns.append(column)
+    df = pd.concat(chunks, ignore_index=True).reindex(columns=columns)
+
+    session = {}
+    arrays = {}
+    schema = {}
+    for column in columns:
+        values = df[column]
+        if column in sessionFields and values.shape[0] > 0 and values.astype(object).map(_text).nunique() == 1 and not _isMissing(values.iloc[0]):
+            session[column] = _jsonValue(values.iloc[0]) # same on every row: store once
+            continue
+        kinds = set(c[column].dtype.kind for c in chunks if column in c.columns)
+        array, integer = _typedColumn(values, kinds, column in integerColumns)
+        arrays[column] = array
+        schema[column] = {'dtype': array.dtype.str, 'integer': integer}
+
+    npzFilename, jsonFilename = columnarFilenames(filename)
+    np.savez_compressed(npzFilename, **dict((str(k), v) for k, v in arrays.items()))
+    sidecar = {'formatVersion': FORMATVERSION, 'csv': os.path.basename(filename), 'rows': int(df.shape[0]),
+               'csvColumns': columns, 'session': session, 'columns': schema}
+    with open(jsonFilename, 'w') as f:
+        json.dump(sidecar, f, indent=1)
+    return npzFilename
+
+
+def readColumnar(filename):
+    '''Dataframe with the content and column order of the csv that columnar file filename (.npz or .json) was made from.'''
+    npzFilename, jsonFilename = columnarFilenames(filename)
+    with open(jsonFilename, 'r') as f:
+        sidecar = json.load(f)
+    arrays = np.load(npzFilename)
+    data = {}
+    for column in sidecar['csvColumns']:
+        if column in sidecar['session']:
+            data[column] = [sidecar['session'][column]] * sidecar['rows']
+        elif sidecar['columns'][column]['integer']: # whole numbers shown without decimals, blanks stay blank
+            data[column] = pd.Series([None if np.isnan(v) else int(v) for v in arrays[column]], dtype=object)
+        else:
+            data[column] = arrays[column]
+    return pd.DataFrame(data, columns=sidecar['csvColumns'])
+
+
+def toCsv(filename, csvFilename=None, overwrite=False):
+    '''Write columnar file filename back to csv (default: the csv it was made from; an existing file is only replaced if overwrite).'''
+    if csvFilename is None:
+        csvFilename = os.path.splitext(filename)[0] + '.csv'
+    if os.path.exists(csvFilename) and not overwrite:
+        raise IOError('{} already exists (use overwrite=True to replace it)'.format(csvFilename))
+    readColumnar(filename).to_csv(csvFilename, index=False)
+    return csvFilename
+
+
+def fromCsv(csvFilename, sessionFields=SESSIONFIELDS):
+    '''Write the columnar files of an existing csv file.'''
+    df = pd.read_csv(csvFilename)
+    text = pd.read_csv(csvFilename, dtype=str, keep_default_na=False)
+    integerColumns = [c for c in df.columns if df[c].dtype.kind == 'f' and not text[c].str.contains(r'[.eEnN]').any()]
+    return writeColumnar([df], csvFilename, sessionFields, integerColumns)
+
+
+class ColumnarStore(object):
+    '''Rows appended to each csv file this session, written as columnar files by save().
+
+    sessionFields: columns stored once in the JSON sidecar when they have the same value on every row
+    '''
+
+    def __init__(self, sessionFields=SESSIONFIELDS):
+        self.sessionFields = sessionFields
+        self.chunks = {} # csv filename -> list of dataframes appended to it
+
+    def addRows(self, df, filename):
+        '''Keep a copy of rows in df (dataframe or TrialRows) appended to csv filename.'''
+        self.chunks.setdefault(filename, []).append(df if hasattr(df, 'toDataFrame') else df.copy()) # TrialRows are already a copy
+
+    def save(self, filename=None):
+        '''Write the columnar files of csv filename (all files if None).'''
+        filenames = list(self.chunks) if filename is None else [filename]
+        for f in filenames:
+            chunks = [c.toDataFrame() if hasattr(c, 'toDataFrame') else c for c in self.chunks.get(f, [])]
+            writeColumnar(chunks, f, self.sessionFields)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3 or sys.argv[1] not in ('tocsv', 'fromcsv'):
+        print('usage: python columnarStore.py tocsv|fromcsv file [file ...]')
+        sys.exit(1)
+    for name in sys.argv[2:]:
+        if sys.argv[1] == 'tocsv':
+            print('{} -> {}'.format(name, toCsv(name)))
+        else:
+            print('{} -> {}'.format(name, fromCsv(name)))
@@ -0,0 +1,221 @@
+'''Index the csv files in a Data folder and load selected tasks/participants into one dataframe.
+
+Every script names its outputs {participant:03d}-{startTime}-{taskName}.csv (block backups end with
+-backup.csv; rows of an unfinished section that a resumed session moved aside end with -incomplete.csv, and
+are left out unless asked for). A DataIndex scans the folder once, parses the file names and keeps the result in
+<directory>/_index.json, so later scans only stat the files. load() reads the selected files in a
+process pool and concatenates them; each parsed file is cached in <directory>/_cache/ together with the
+size and modification time it was read at, so files that didn't change are unpickled instead of parsed:
+    index = DataIndex('Data')
+    index.tasks() # task names found
+    df = index.load(tasks=['effortTraining'], participants=range(1, 50))
+
+On Windows, call load() from inside an if __name__ == '__main__': block (the pool starts new processes).
+From the command line:
+    python dataLoader.py Data [taskName ...]
+'''
+
+from __future__ import print_function
+import os
+import re
+import sys
+import json
+from multiprocessing import Pool, cpu_count
+try:
+    import cPickle as pickle # python 2
+except ImportError:
+    import pickle
+import numpy as np
+import pandas as pd
+try:
+    from pandas.errors import EmptyDataError
+except ImportError: # pandas < 0.20
+    from pandas.io.common import EmptyDataError
+
+PROTOCOL = 2 # readable by python 2 and 3
+INDEXFILE = '_index.json'
+CACHEDIR = '_cache'
+FILENAME = re.compile(r'^(\d{3,})-(\d{4}-\d{2}-\d{2}-\d{2}-\d{2}-\d{2})-(.+?)(-backup)?(-incomplete)?\.csv$')
+
+
+def parseFilename(filename):
+    '''Dict with participant, startTime, taskName, backup and incomplete of a data file name (None if it isn't one).'''
+    match = FILENAME.match(os.path.basename(filename))
+    if match is None:
+        return None
+    participant, startTime, taskName, backup, incomplete = match.groups()
+    return {'participant': int(participant), 'startTime': startTime, 'taskName': taskName, 'backup': backup is not None,
+            'incomplete': incomplete is not None}
+
+
+def _cacheFilename(directory, filename):
+    return os.path.join(directory, CACHEDIR, os.path.splitext(filename)[0] + '.pkl')
+
+
+def _readFile(job):
+    '''Parse one csv file, or unpickle it from the cache if it hasn't changed (runs in a pool process).'''
+    directory, entry = job
+    cacheFilename = _cacheFilename(directory, entry['file'])
+    try:
+        with open(cacheFilename, 'rb') as f:
+            cached = pickle.load(f)
+        if cached['size'] == entry['size'] and cached['mtime'] == entry['mtime']:
+            return cached['df'], True
+    except Exception: # no cache yet, or unreadable
+        pass
+    try:
+        df = pd.read_csv(os.path.join(directory, entry['file']))
+    except EmptyDataError: # no header either (e.g., left by a crash)
+        df = pd.DataFrame()
+    try:
+        with open(cacheFilename + '.tmp', 'wb') as f:
+            pickle.dump({'size': entry['size'], 'mtime': entry['mtime'], 'df': df}, f, PROTOCOL)
+        if os.path.exists(cacheFilename):
+            os.remove(cacheFilename)
+        os.rename(cacheFilename + '.tmp', cacheFilename)
+    except (IOError, OSError): # read-only folder: just don't cache
+        pass
+    return df, False
+
+
+def _typed(df):
+    '''Make object columns numeric where every value is (files that were all blank in a column read it as object).'''
+    for column in df.columns:
+        if df[column].dtype != object:
+            continue
+        converted = pd.to_numeric(df[column], errors='coerce')
+        if converted.notnull().sum() == df[column].notnull().sum():
+            df[column] = converted
+    return df
+
+
+class DataIndex(object):
+    '''Index of the data files in directory.
+
+    directory: folder with the csv files (e.g., a task's Data folder)
+    scan: if True, update the index when it is created (see scan())
+    '''
+
+    def __init__(self, directory='Data', scan=True):
+        self.directory = directory
+        self.entries = {} # file name -> dict with participant, startTime, taskName, backup, incomplete, size, mtime
+        self.lastLoad = {'files': 0, 'cached': 0} # no. of files read by the last load() and how many came from the cache
+        path = os.path.join(directory, INDEXFILE)
+        if os.path.isfile(path):
+            try:
+                with open(path, 'r') as f:
+                    self.entries = dict((e['file'], e) for e in json.load(f)['files'])
+            except (ValueError, KeyError): # damaged index: rebuild it
+                self.entries = {}
+        if scan:
+            self.scan()
+
+    def scan(self):
+        '''Update the index with the files currently in the directory and save it; return the no. of new or changed files.'''
+        entries = {}
+        changed = 0
+        for filename in os.listdir(self.directory):
+            parsed = parseFilename(filename)
+            if parsed is None:
+                continue
+            stat = os.stat(os.path.join(self.directory, filename))
+            entry = self.entries.get(filename)
+            if entry is None or entry['size'] != stat.st_size or entry['mtime'] != stat.st_mtime or any(entry.get(k) != v for k, v in parsed.items()):
+                entry = dict(parsed, file=filename, size=stat.st_size, mtime=stat.st_mtime)
+                changed += 1
+            entries[filename] = entry
+        self.entries = entries
+        self.save()
+        return changed
+
+    def save(self):
+        path = os.path.join(self.directory, INDEXFILE)
+        with open(path + '.tmp', 'w') as f:
+            json.dump({'files': sorted(self.entries.values(), key=lambda e: e['file'])}, f, indent=1)
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(path + '.tmp', path)
+
+    def tasks(self):
+        '''Task names in the index.'''
+        return sorted(set(e['taskName'] for e in self.entries.values()))
+
+    def participants(self, tasks=None):
+        '''Participant numbers in the index (with files for any of tasks, if given).'''
+        return sorted(set(e['participant'] for e in self.select(tasks)))
+
+    def select(self, tasks=None, participants=None, backups=False, incomplete=False):
+        '''Index entries of the files of tasks and participants (None: all), ordered by participant, startTime and task.
+
+        backups, incomplete: also select -backup files and the -incomplete files of resumed sessions; empty (0-byte) files are never selected
+        '''
+        if tasks is not None:
+            tasks = set([tasks] if hasattr(tasks, 'strip') else tasks) # one task name or a list
+        if participants is not None:
+            participants = set(int(p) for p in participants)
+        selected = [e for e in self.entries.values()
+                    if (tasks is None or e['taskName'] in tasks) and (participants is None or e['participant'] in participants) and (backups or not e['backup'])
+                    and (incomplete or not e['incomplete']) and e['size'] > 0]
+        return sorted(selected, key=lambda e: (e['participant'], e['startTime'], e['taskName'], e['backup'], e['incomplete']))
+
+    def summary(self):
+        '''Dataframe with the no. of files per participant (rows) and task (columns).'''
+        df = pd.DataFrame(self.select())
+        if df.shape[0] == 0:
+            return df
+        return df.pivot_table(index='participant', columns='taskName', values='file', aggfunc='count').fillna(0).astype(int)
+
+    def load(self, tasks=None, participants=None, backups=False, incomplete=False, processes=None):
+        '''One dataframe with the rows of the selected files (see select()).
+
+        Rows keep their csv columns (missing ones are NaN) plus file, fileParticipant, fileStartTime and
+        fileTask from the file name. processes: size of the process pool (default: no. of CPUs; 1 reads in
+        this process).
+        '''
+        selected = self.select(tasks, participants, backups, incomplete)
+        if not selected:
+            return pd.DataFrame()
+        cacheDir = os.path.join(self.directory, CACHEDIR)
+        if not os.path.exists(cacheDir):
+            os.mkdir(cacheDir)
+        jobs = [(self.directory, e) for e in selected]
+        if processes == 1 or len(jobs) == 1:
+            results = [_readFile(job) for job in jobs]
+        else:
+            processes = processes or cpu_count()
+            pool = Pool(processes)
+            try:
+                results = pool.map(_readFile, jobs, chunksize=max(1, len(jobs) // (4 * processes)))
+            finally:
+                pool.close()
+                pool.join()
+        self.lastLoad = {'files': len(results), 'cached': sum(cached for _, cached in results)}
+
+        frames = []
+        for entry, (df, _) in zip(selected, results):
+            df = df.copy()
+            df['file'] = entry['file']
+            df['fileParticipant'] = entry['participant']
+            df['fileStartTime'] = entry['startTime']
+            df['fileTask'] = entry['taskName']
+            frames.append(df)
+        columns = []
+        for df in frames:
+            columns.extend(c for c in df.columns if c not in columns)
+        df = _typed(pd.concat(frames, ignore_index=True).reindex(columns=columns))
+        for column in ['file', 'fileStartTime', 'fileTask']:
+            df[column] = df[column].astype('category')
+        df['fileParticipant'] = df['fileParticipant'].astype(np.int64)
+        return df
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print('usage: python dataLoader.py directory [taskName ...]')
+        sys.exit(1)
+    index = DataIndex(sys.argv[1])
+    if len(sys.argv) == 2:
+        print(index.summary())
+    else:
+        df = index.load(tasks=sys.argv[2:])
+        print('{} rows from {} files ({} from the cache)'.format(df.shape[0], index.lastLoad['files'], index.lastLoad['cached']))
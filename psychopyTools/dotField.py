@@ -0,0 +1,176 @@
+'''Random-dot motion field allocated once per block, reconfigured for each trial and drawn as one element array.
+
+runDotMotionBlock made a new visual.DotStim (up to nDots=500) on every trial, and on every frame DotStim
+updated its dots in Python before drawing them. A DotField allocates the dots of the block once (the
+largest nDots of the block), configure() sets each trial's direction, coherence, dot life, speed and field
+size, and draw() moves all dots with a few numpy operations and draws them with one ElementArrayStim:
+
+    dotField = DotField(win, visual.ElementArrayStim, int(trialsDf['nDots'].max()), scale=normToPix(win.size))
+    ...
+    dotField.configure(nDots, dir, coherence, speed, dotLife, fieldSize, dotSize=dotSize) # before the trial
+    for frameN in range(targetFramesCurrentTrial):
+        dotField.draw() # move the dots, then draw them (unlike DotStim, not with setAutoDraw)
+        win.flip()
+
+The dots move as DotStim's do (Scase et al., 1996): with signalDots='different' a new set of
+int(coherence * nDots) dots is picked on every frame to move speed (field units per frame) in direction
+dir (degrees, 0 = right, 90 = up), with signalDots='same' the signal dots stay the same; noise dots are
+replotted at random (noiseDots='position'), keep a random direction ('direction') or take a new one on
+every frame ('walk'). Dots are replotted when their life (dotLife frames; 0: unlimited) ends or they
+leave the field (circle or square of fieldSize, around fieldPos).
+
+The field is in the units DotStim had (the window's units, e.g., norm); scale converts them to the units
+the array is drawn in ('pix', so that dotSize is in pixels, as DotStim's).
+
+Run as a script to see the per-frame cost of moving and drawing (a simulated element array) 25 to 2000 dots,
+against the frame budget:
+    python dotField.py [refresh rate]
+'''
+
+from __future__ import print_function
+import sys
+import timeit
+import numpy as np
+
+
+def normToPix(winSize):
+    '''(x, y) factors from norm to pix units for a window of winSize pixels.'''
+    return (winSize[0] / 2.0, winSize[1] / 2.0)
+
+
+class DotField(object):
+    '''Dots of a random-dot motion stimulus (up to maxDots), moved with numpy and drawn by one element array.
+
+    win: the window; factory: e.g., visual.ElementArrayStim
+    maxDots: no. of dots allocated (the largest nDots a trial will ask for)
+    units: units the array is drawn in; scale: (x, y) factors from field units to them
+    dotSize, color, colorSpace: of the dots (dotSize in units)
+    '''
+
+    def __init__(self, win, factory, maxDots, units='pix', scale=(1.0, 1.0), dotSize=3, color=(0.9, 0.9, 0.9), colorSpace='rgb'):
+        self.maxDots = maxDots
+        self.scale = np.asarray(scale, dtype=float)
+        self.xys = np.zeros((maxDots, 2)) # field units, relative to fieldPos
+        self.life = np.zeros(maxDots)
+        self.noiseDirs = np.zeros(maxDots) # radians, noiseDots='direction'
+        self.signal = np.zeros(maxDots, dtype=bool)
+        self.nDots = 0
+        self.stim = factory(win=win, units=units, nElements=maxDots, xys=np.zeros((maxDots, 2)), sizes=dotSize, colors=color, colorSpace=colorSpace,
+                            opacities=np.zeros(maxDots), elementTex=None, elementMask='circle')
+
+    def configure(self, nDots, dir, coherence, speed, dotLife, fieldSize, fieldPos=(0.0, 0.0), fieldShape='circle', signalDots='different', noiseDots='position', dotSize=None):
+        '''Set up a trial: nDots dots (at most maxDots) at random positions in the field.'''
+        if nDots > self.maxDots:
+            raise ValueError('DotField was allocated for {} dots, not {}'.format(self.maxDots, nDots))
+        if noiseDots not in ('position', 'direction', 'walk'):
+            raise ValueError("noiseDots has to be 'position', 'direction' or 'walk'")
+        self.nDots = nDots
+        self.nSignal = int(coherence * nDots)
+        self.dir = np.radians(dir)
+        self.step = speed * np.array([np.cos(self.dir), np.sin(self.dir)])
+        self.speed = speed
+        self.dotLife = dotLife
+        self.radius = fieldSize / 2.0
+        self.fieldPos = np.asarray(fieldPos, dtype=float)
+        self.fieldShape = fieldShape
+        self.signalDots = signalDots
+        self.noiseDots = noiseDots
+
+        self.xys[:nDots] = self.newXYs(nDots)
+        self.life[:nDots] = abs(dotLife) * np.random.rand(nDots) # as DotStim: staggered so that the dots don't all die together
+        self.noiseDirs[:nDots] = np.random.rand(nDots) * 2 * np.pi
+        self.signal[:] = False
+        self.signal[:self.nSignal] = True
+
+        opacities = np.zeros(self.maxDots)
+        opacities[:nDots] = 1 # dots beyond nDots aren't shown
+        self.stim.setOpacities(opacities)
+        if dotSize is not None:
+            self.stim.setSizes(dotSize)
+
+    def newXYs(self, n):
+        '''n random positions in the field (uniform).'''
+        if self.fieldShape == 'circle':
+            r = self.radius * np.sqrt(np.random.rand(n))
+            theta = np.random.rand(n) * 2 * np.pi
+            return np.column_stack([r * np.cos(theta), r * np.sin(theta)])
+        return np.random.uniform(-self.radius, self.radius, (n, 2))
+
+    def update(self):
+        '''Move the dots one frame.'''
+        n = self.nDots
+        xys = self.xys[:n]
+        if self.signalDots == 'different': # signal and noise dots change identity on every frame
+            signal = np.zeros(n, dtype=bool)
+            signal[np.random.permutation(n)[:self.nSignal]] = True
+        else:
+            signal = self.signal[:n]
+        noise = ~signal
+
+        xys[signal] += self.step
+        if self.noiseDots == 'position':
+            xys[noise] = self.newXYs(int(noise.sum()))
+        else:
+            if self.noiseDots == 'walk':
+                self.noiseDirs[:n][noise] = np.random.rand(int(noise.sum())) * 2 * np.pi
+            noiseDirs = self.noiseDirs[:n][noise]
+            xys[noise] += self.speed * np.column_stack([np.cos(noiseDirs), np.sin(noiseDirs)])
+
+        replot = np.zeros(n, dtype=bool)
+        if self.dotLife > 0:
+            life = self.life[:n]
+            life -= 1
+            replot = life <= 0
+            life[replot] = self.dotLife
+        if self.fieldShape == 'circle':
+            replot |= (xys ** 2).sum(axis=1) > self.radius ** 2
+        else:
+            replot |= (np.abs(xys) > self.radius).any(axis=1)
+        if replot.any():
+            xys[replot] = self.newXYs(int(replot.sum()))
+
+    def draw(self):
+        '''Move the dots one frame and draw them.'''
+        self.update()
+        self.stim.setXYs((self.xys + self.fieldPos) * self.scale)
+        self.stim.draw()
+
+
+def benchmark(dotCounts=(25, 100, 500, 1000, 2000), frames=180, repeats=5):
+    '''Per-frame cost (microseconds) of DotField.draw() by no. of dots (signalDots='different', noiseDots='position',
+    the script's settings), with a simulated element array (the GPU's share of the single draw call isn't included).'''
+
+    class SimulatedArray(object):
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+        def setOpacities(self, opacities):
+            self.opacities = opacities
+
+        def setSizes(self, sizes):
+            self.sizes = sizes
+
+        def setXYs(self, xys):
+            self.xys = np.asarray(xys, dtype=float) # ElementArrayStim copies the positions
+
+        def draw(self):
+            pass
+
+    results = []
+    for nDots in dotCounts:
+        dotField = DotField(None, SimulatedArray, nDots, scale=normToPix((900, 600)))
+
+        def trial():
+            dotField.configure(nDots, 90, 0.2, 0.01, 3, 1)
+            for frameN in range(frames):
+                dotField.draw()
+
+        results.append((nDots, min(timeit.repeat(trial, number=1, repeat=repeats)) / frames * 1e6))
+    return results
+
+
+if __name__ == '__main__':
+    refreshRate = float(sys.argv[1]) if len(sys.argv) > 1 else 60.0
+    frameBudget = 1e6 / refreshRate
+    for nDots, perFrame in benchmark():
+        print('{:5d} dots  {:8.1f} us per frame  ({:4.1f}% of a {:.0f} Hz frame)'.format(nDots, perFrame, perFrame / frameBudget * 100, refreshRate))
@@ -0,0 +1,54 @@
+'''Durations in seconds, converted to frames for the refresh rate the window actually runs at.
+
+Frame counts were written for 60 Hz (info['targetFrames'] = 180, info['fixationFrames'] = 30,
+core.StaticPeriod(screenHz=60), titration steps of "-3 frames (50 ms)", ...), so on a 120 or 144 Hz
+display every duration was silently halved or worse. The scripts now state durations in seconds and
+convert them once, after the window has opened and its refresh rate has been measured:
+
+    frameRate = FrameRate(win) # measured with win.getActualFrameRate(); 60 Hz if it can't be measured
+    screenRefreshRate = frameRate.refreshRate
+    info['fixationFrames'] = frameRate.frames(info['fixationS'])
+    ...
+    for frameN in range(frameRate.frames(0.5)):
+        win.flip()
+'''
+
+from __future__ import print_function
+import numbers
+import numpy as np
+
+
+def measureRefreshRate(win, nominal=60.0, nIdentical=20, nMaxFrames=120, nWarmUpFrames=20, threshold=1):
+    '''Refresh rate (Hz) of win from win.getActualFrameRate(); nominal if it can't be measured reliably.'''
+    try:
+        rate = win.getActualFrameRate(nIdentical=nIdentical, nMaxFrames=nMaxFrames, nWarmUpFrames=nWarmUpFrames, threshold=threshold)
+    except Exception:
+        rate = None
+    if rate is None or not rate > 0:
+        print("Couldn't measure the refresh rate; assuming {} Hz".format(nominal))
+        return float(nominal)
+    return float(rate)
+
+
+class FrameRate(object):
+    '''Seconds to frames at the window's refresh rate.
+
+    win: window to measure (None: use refreshRate)
+    refreshRate: refresh rate (Hz) if win is None, or the fallback if it can't be measured
+    '''
+
+    def __init__(self, win=None, refreshRate=60.0):
+        self.refreshRate = measureRefreshRate(win, refreshRate) if win is not None else float(refreshRate)
+        self.frameDuration = 1.0 / self.refreshRate
+
+    def frames(self, seconds):
+        '''seconds as a whole no. of frames; sequences/arrays are converted elementwise; None stays None.'''
+        if seconds is None:
+            return None
+        if isinstance(seconds, numbers.Real):
+            return int(round(seconds * self.refreshRate))
+        return np.round(np.asarray(seconds, dtype=float) * self.refreshRate).astype(int)
+
+    def seconds(self, frames):
+        '''Duration (seconds) of frames frames.'''
+        return frames * self.frameDuration
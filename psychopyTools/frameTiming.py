@@ -0,0 +1,144 @@
+'''Flip times of each trial phase, to check that frame-defined durations were shown as planned.
+
+Durations are set in frames (fixationFrames, targetFrames, testDigitFrames, postTestDigitBlankFrames, ...),
+but nothing recorded whether win.flip() hit every refresh. A FrameTimer wraps the window's flip() and
+close(): each flip is timed (clock.getTime() as soon as flip() returns) and counted towards the current
+phase of the trial, and closing the window prints a timing report for the session. The trial loop marks
+the phases:
+
+    frameTimer.startTrial()
+    frameTimer.phase('fixation')
+    ... fixation flips ...
+    frameTimer.phase('stimulus')
+    ... response window flips ...
+    frameTimer.phase(None) # the next flip (clear screen) ends the stimulus
+    ...
+    for column, value in frameTimer.endTrial().items():
+        trials[i, column] = value
+
+For each phase, endTrial() gives
+    <phase>Onset: time of the phase's first flip (clock, e.g., globalClock, like elapsedTime)
+    <phase>Duration: time from that flip to the flip that ended the phase (or one frame after its last flip)
+    <phase>DroppedFrames: refreshes missed between consecutive flips of the phase
+(NaN for phases the trial didn't have). A disabled FrameTimer (enabled=False) doesn't touch the window and
+endTrial() returns {}.
+
+A block run within a trial (e.g., the mental math trial embedded in each effort/reward choice trial) times its
+own trials: suspend() sets the unfinished trial aside and restore() takes it up again after the block, so
+neither trial's columns get the other's flips.
+'''
+
+from __future__ import print_function
+from collections import OrderedDict
+import numpy as np
+
+
+class FrameTimer(object):
+    '''Time the flips of win by trial phase.
+
+    win: the window (its flip and close methods are wrapped)
+    refreshRate: nominal refresh rate (Hz)
+    clock: clock the flips are timed with (e.g., globalClock)
+    enabled: False: record nothing
+    '''
+
+    phases = ('fixation', 'stimulus', 'feedback')
+
+    def __init__(self, win, refreshRate, clock, enabled=True):
+        self.enabled = enabled
+        self.frameDuration = 1.0 / refreshRate
+        self.clock = clock
+        self.columns = [phase + column for phase in self.phases for column in ('Onset', 'Duration', 'DroppedFrames')]
+        self.session = OrderedDict((phase, {'flips': 0, 'dropped': 0, 'maxInterval': 0.0}) for phase in self.phases)
+        self.trialCount = 0
+        self.untracked = 0 # flips outside the phases (instructions, ITI, ...)
+        self.startTrial()
+        if enabled:
+            self._flip = win.flip
+            self._close = win.close
+            win.flip = self.flip
+            win.close = self.close
+
+    def startTrial(self):
+        '''Forget the flips of the previous (unfinished) trial.'''
+        self.trial = {}
+        self.current = None # phase of the next flips
+        self.ending = None # phase whose last frame is shown until the next flip
+        self.lastFlip = None
+        self.lastPhase = None
+
+    def suspend(self):
+        '''Set the unfinished trial aside (e.g., for a block run within it); returns its state for restore().'''
+        state = (self.trial, self.current, self.ending)
+        self.startTrial()
+        return state
+
+    def restore(self, state):
+        '''Take up a trial set aside by suspend(); the flips in between don't count as dropped frames.'''
+        self.trial, self.current, self.ending = state
+        self.lastFlip = None
+        self.lastPhase = None
+
+    def phase(self, name):
+        '''Count the next flips towards phase name (None: outside the phases); the next flip ends the current phase.'''
+        if self.current is not None and self.current in self.trial:
+            self.ending = self.current
+        self.current = name
+
+    def flip(self, *args, **kwargs):
+        '''win.flip(), timed.'''
+        result = self._flip(*args, **kwargs)
+        t = self.clock.getTime()
+        shown = self.ending if self.ending is not None else self.current # phase of the frame this flip replaces
+        if shown is not None and shown == self.lastPhase:
+            interval = t - self.lastFlip
+            dropped = max(int(round(interval / self.frameDuration)) - 1, 0)
+            self.trial[shown]['dropped'] += dropped
+            self.session[shown]['dropped'] += dropped
+            self.session[shown]['maxInterval'] = max(self.session[shown]['maxInterval'], interval)
+        if self.ending is not None:
+            self.trial[self.ending]['end'] = t
+            self.ending = None
+        if self.current is None:
+            self.untracked += 1
+        else:
+            if self.current not in self.trial:
+                self.trial[self.current] = {'onset': t, 'end': None, 'dropped': 0}
+            self.trial[self.current]['last'] = t
+            self.session[self.current]['flips'] += 1
+        self.lastFlip = t
+        self.lastPhase = self.current
+        return result
+
+    def endTrial(self):
+        '''Timing columns of the trial (column -> value; {} if disabled).'''
+        if not self.enabled:
+            return {}
+        values = OrderedDict()
+        for phase in self.phases:
+            record = self.trial.get(phase)
+            if record is None:
+                onset, duration, dropped = np.nan, np.nan, np.nan
+            else:
+                end = record['end'] if record['end'] is not None else record['last'] + self.frameDuration
+                onset, duration, dropped = record['onset'], end - record['onset'], record['dropped']
+            values[phase + 'Onset'] = onset
+            values[phase + 'Duration'] = duration
+            values[phase + 'DroppedFrames'] = dropped
+        self.trialCount += 1
+        self.startTrial()
+        return values
+
+    def report(self):
+        '''Session timing report (string).'''
+        lines = ['Frame timing: {} trials, nominal frame {:.2f} ms'.format(self.trialCount, self.frameDuration * 1000),
+                 '  {:<10} {:>8} {:>8} {:>18}'.format('phase', 'flips', 'dropped', 'max interval (ms)')]
+        for phase, stats in self.session.items():
+            lines.append('  {:<10} {:>8} {:>8} {:>18.2f}'.format(phase, stats['flips'], stats['dropped'], stats['maxInterval'] * 1000))
+        lines.append('  {:<10} {:>8}'.format('other', self.untracked))
+        return '\n'.join(lines)
+
+    def close(self, *args, **kwargs):
+        '''win.close(), after printing the timing report.'''
+        print(self.report())
+        return self._close(*args, **kwargs)
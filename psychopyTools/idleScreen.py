@@ -0,0 +1,121 @@
+'''Screens that stay the same until the participant responds, flipped only when they change.
+
+showInstructions, showQuestionnaire and getDemographics waited for a response by drawing and flipping on
+every refresh (while not event.getKeys(...): ...; win.flip()), so a page of instructions read for a minute
+cost 3600 identical frames, a core busy waiting for vertical blanking and the GPU drawing the same text
+again. An IdleScreen flips once when it is shown and then only when its content changes (state() returns
+something else) or keepAlive seconds have passed since the last flip; in between it checks for input
+pollRate times per second and sleeps:
+
+    instructScreen = IdleScreen(win, lambda: (continueText.draw(), instructText.draw()), pollRate=100)
+    ...
+    response = instructScreen.wait(lambda: 'continue' if event.getKeys(keyList=['space']) else None)
+
+wait() returns the first response poll() gives (anything but None), or None after timeout seconds. poll() is
+called before state() on every check, so that the window's events (key presses, mouse) have been dispatched
+by event.getKeys() when state() reads them. The window (front buffer) keeps showing the last flip, and
+stimuli with autoDraw are drawn on every flip as before. With pollRate=None the screen is drawn and flipped
+on every refresh, as before.
+
+Key presses are queued by the window until event.getKeys() reads them, so none are lost between polls. A
+visual.RatingScale is different: it reads the mouse buttons when it is drawn, so a click pressed and released
+between two draws never reaches it. Rating scales (showQuestionnaire) are shown with pollRate=None.
+
+Run as a script to compare the flips and the CPU time of a simulated instructions page (read for seconds,
+at refreshRate Hz) flipped on every refresh with an IdleScreen:
+    python idleScreen.py [seconds] [refresh rate]
+'''
+
+from __future__ import print_function
+import sys
+import time
+import timeit
+
+
+class IdleScreen(object):
+    '''A screen flipped when it is shown, when state() changes and every keepAlive seconds, with input polled in between.
+
+    win: the window; draw: draw() draws the screen's stimuli (None: only stimuli with autoDraw)
+    state: state() -> anything that changes with what is on the screen (None: the screen doesn't change)
+    pollRate: input checks per second between flips (None: draw and flip on every refresh, as before)
+    keepAlive: seconds after which the screen is flipped again even if it didn't change (None: never)
+    sleep, clock: time.sleep and a clock in seconds (e.g., simulated ones)
+    '''
+
+    def __init__(self, win, draw=None, state=None, pollRate=100.0, keepAlive=1.0, sleep=time.sleep, clock=timeit.default_timer):
+        self.win = win
+        self.draw = draw
+        self.state = state
+        self.pollRate = pollRate
+        self.keepAlive = keepAlive
+        self.sleep = sleep
+        self.clock = clock
+        self.flips = 0
+        self.polls = 0
+
+    def flip(self):
+        if self.draw is not None:
+            self.draw()
+        self.win.flip()
+        self.flips += 1
+
+    def wait(self, poll, timeout=None):
+        '''Show the screen until poll() returns a response (anything but None; returned) or timeout seconds have passed (None returned).'''
+        start = self.clock()
+        shown = None # state of the last flip
+        lastFlip = None
+        while True:
+            now = self.clock()
+            if timeout is not None and now - start >= timeout:
+                return None
+            current = self.state() if self.state is not None else None
+            if self.pollRate is None or lastFlip is None or current != shown or (self.keepAlive is not None and now - lastFlip >= self.keepAlive):
+                self.flip() # waits for the refresh when flipped on every frame
+                shown, lastFlip = current, self.clock()
+            elif self.pollRate:
+                self.sleep(max(0.0, 1.0 / self.pollRate - (self.clock() - now)))
+            response = poll()
+            self.polls += 1
+            if response is not None:
+                return response
+
+
+def benchmark(seconds=30.0, refreshRate=60.0, pollRate=100.0, drawS=0.0002):
+    '''Flips and CPU time (process time, in ms) of an instructions page shown for seconds, flipped on every refresh vs
+    with an IdleScreen, with a simulated window (a flip waits for the next refresh, busy like vertical sync;
+    drawing takes drawS seconds) and a participant who presses space after seconds.'''
+
+    class SimulatedWindow(object):
+        def __init__(self):
+            self.nextRefresh = timeit.default_timer()
+
+        def flip(self):
+            self.nextRefresh += 1.0 / refreshRate
+            while timeit.default_timer() < self.nextRefresh: # the driver waits for the refresh
+                pass
+            self.nextRefresh = max(self.nextRefresh, timeit.default_timer())
+
+    def draw():
+        end = timeit.default_timer() + drawS
+        while timeit.default_timer() < end:
+            pass
+
+    cpuTime = getattr(time, 'process_time', None) or time.clock # python 2: time.clock
+    results = []
+    for name, rate in [('every refresh', None), ('IdleScreen', pollRate)]:
+        screen = IdleScreen(SimulatedWindow(), draw, pollRate=rate)
+        start = timeit.default_timer()
+        cpu = cpuTime()
+        response = screen.wait(lambda: 'space' if timeit.default_timer() - start >= seconds else None)
+        cpu = cpuTime() - cpu
+        if response != 'space':
+            raise AssertionError('the response was lost')
+        results.append((name, screen.flips, screen.polls, cpu * 1e3))
+    return results
+
+
+if __name__ == '__main__':
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 30.0
+    refreshRate = float(sys.argv[2]) if len(sys.argv) > 2 else 60.0
+    for name, flips, polls, cpuMs in benchmark(seconds, refreshRate):
+        print('{:<14} {:6d} flips  {:6d} input checks  {:9.1f} ms CPU ({:.0f} s page)'.format(name, flips, polls, cpuMs, seconds))
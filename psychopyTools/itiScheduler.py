@@ -0,0 +1,102 @@
+'''Work done inside the inter-trial interval.
+
+The trial loops called ISI.start(iti) and ISI.complete() with almost nothing in between, while the csv and
+backup writes, the stimulus setText/setColor/setPos calls of the next trial and the construction of feedback
+stimuli happened before or after the ITI, where they delayed the fixation cross. An ITIScheduler wraps the
+core.StaticPeriod and keeps a queue of deferred jobs; complete() runs the queued jobs that fit in what is
+left of the ITI, then waits for the rest of it like StaticPeriod.complete():
+
+    ISI = ITIScheduler(core.StaticPeriod(screenHz=screenRefreshRate), globalClock)
+    ...
+    ISI.start(iti)
+    ISI.defer('save', ledger.appendRows, trials.rows(i), filename)
+    ISI.defer('prepare', task.prepare, nextI, nextTrial, trials)
+    trials[i, 'itiOverrun'] = ISI.complete() # seconds the ITI ran over (0.0 if it ended on time)
+
+A job's cost is estimated from the slowest of its last runs (jobs are grouped by name); a job that doesn't
+fit stays queued for the next ITI, and so do the later jobs of the same name, so rows are still written in
+order. A job is put off at most maxDeferrals times; after that it runs even if the ITI overruns. run(name) runs the queued jobs (of name) right away, e.g., a trial's preparation that didn't fit, or
+the pending saves before a block ends.
+'''
+
+import collections
+
+
+class ITIScheduler(object):
+    '''Deferred jobs run within the inter-trial interval.
+
+    period: core.StaticPeriod of the ITI (start(duration)/complete())
+    clock: clock for the ITI budget (e.g., globalClock)
+    margin: seconds of the ITI kept free of jobs
+    history: no. of runs of a job the cost estimate is based on
+    maxDeferrals: no. of ITIs a job can be put off to
+    '''
+
+    def __init__(self, period, clock, margin=0.002, history=10, maxDeferrals=1):
+        self.period = period
+        self.clock = clock
+        self.margin = margin
+        self.frameTime = getattr(period, 'frameTime', 0.0) # StaticPeriod(screenHz=...) ends one frame early
+        self.jobs = collections.deque()
+        self.costs = {}
+        self.history = history
+        self.maxDeferrals = maxDeferrals
+        self.end = None
+        self.overrun = 0.0 # of the last ITI (seconds)
+        self.deferred = 0 # jobs left for the next ITI by the last complete()
+
+    def start(self, duration):
+        '''Start an ITI of duration seconds.'''
+        self.end = self.clock.getTime() + duration - self.frameTime
+        self.period.start(duration)
+
+    def defer(self, name, job, *args, **kwargs):
+        '''Queue job(*args, **kwargs) for the next ITI (name groups jobs for cost estimates and run()).'''
+        self.jobs.append([name, job, args, kwargs, 0])
+
+    def estimate(self, name):
+        '''Estimated cost (seconds) of a job (0 for jobs that haven't run yet).'''
+        costs = self.costs.get(name)
+        return max(costs) if costs else 0.0
+
+    def _run(self, name, job, args, kwargs, deferrals=0):
+        t0 = self.clock.getTime()
+        job(*args, **kwargs)
+        if name not in self.costs:
+            self.costs[name] = collections.deque(maxlen=self.history)
+        self.costs[name].append(self.clock.getTime() - t0)
+
+    def complete(self):
+        '''Run the queued jobs that fit in the rest of the ITI, then end it; return the overrun (seconds).'''
+        left = collections.deque()
+        skipped = set() # names with a job left over (their later jobs wait too)
+        while self.jobs:
+            queued = self.jobs.popleft()
+            name = queued[0]
+            remaining = self.end - self.clock.getTime() - self.margin
+            if queued[4] < self.maxDeferrals and (name in skipped or self.estimate(name) > remaining):
+                skipped.add(name)
+                queued[4] += 1
+                left.append(queued)
+            else:
+                self._run(*queued)
+        self.jobs = left
+        self.deferred = len(left)
+        self.overrun = max(self.clock.getTime() - self.end, 0.0) # 0 if the period can still end on time
+        self.period.complete()
+        return self.overrun
+
+    def run(self, name=None):
+        '''Run the queued jobs (only those of name if given) now.'''
+        left = collections.deque()
+        while self.jobs:
+            queued = self.jobs.popleft()
+            if name is None or queued[0] == name:
+                self._run(*queued)
+            else:
+                left.append(queued)
+        self.jobs = left
+
+    def discard(self, name=None):
+        '''Drop the queued jobs (only those of name if given).'''
+        self.jobs = collections.deque(queued for queued in self.jobs if name is not None and queued[0] != name)
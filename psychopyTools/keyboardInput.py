@@ -0,0 +1,201 @@
+'''Timestamped key presses for the response windows.
+
+RTs used to be respClock.getTime() on the first frame where event.getKeys(keyList=[...]) returned a key,
+i.e., the time of the flip after the key press (rounded up to the frame, 16.7 ms at 60 Hz) plus polling
+jitter. A KeyboardInput takes the RT from the time stamp of the key event itself, relative to the flip that
+showed the stimulus, and caches the first response so the frame loop only checks a flag:
+
+    keyboard.start(win, ['f', 'j']) # before the first flip of the response window
+    for frameN in range(targetFramesCurrentTrial):
+        if keyboard.ready():
+            key, rt = keyboard.getResponse()
+            ...
+        win.flip()
+
+For loops that still look like event.getKeys, keyboard.getKeys(keyList) returns [key] once a key was
+pressed (else []) and keyboard.rt its RT.
+
+Backends:
+    HardwareBackend: psychopy.hardware.keyboard (PsychoPy >= 3.1; psychtoolbox/ioHub time stamps)
+    EventBackend: psychopy.event with timeStamped=clock (time stamp of the key event, older PsychoPy)
+    SimulatedBackend: scripted (key, rt) responses on a simulated clock, for headless tests
+defaultBackend() picks the hardware keyboard if this PsychoPy has one, else psychopy.event.
+
+Run as a script to compare frame-polled and timestamped RTs on a simulated 60 Hz window (no display needed):
+    python keyboardInput.py [trials]
+'''
+
+from __future__ import print_function
+import sys
+import random
+import numpy as np
+
+
+class EventBackend(object):
+    '''Key presses from psychopy.event, time stamped by clock (a core.Clock instance, reset on the stimulus flip).'''
+
+    def __init__(self, event, clock):
+        self.event = event
+        self.clock = clock
+
+    def clear(self):
+        self.event.clearEvents()
+
+    def markOnset(self):
+        self.clock.reset()
+
+    def poll(self, keyList=None):
+        '''(key, rt) of the first key in keyList pressed since clear(), or None.'''
+        keys = self.event.getKeys(keyList=keyList, timeStamped=self.clock)
+        if len(keys) == 0:
+            return None
+        return keys[0][0], keys[0][1]
+
+
+class HardwareBackend(object):
+    '''Key presses from psychopy.hardware.keyboard (raises ImportError if this PsychoPy doesn't have it).'''
+
+    def __init__(self):
+        from psychopy.hardware import keyboard
+        self.keyboard = keyboard.Keyboard()
+
+    def clear(self):
+        self.keyboard.clearEvents()
+
+    def markOnset(self):
+        self.keyboard.clock.reset()
+
+    def poll(self, keyList=None):
+        keys = self.keyboard.getKeys(keyList=keyList, waitRelease=False)
+        if len(keys) == 0:
+            return None
+        return keys[0].name, keys[0].rt
+
+
+class SimulatedBackend(object):
+    '''Scripted key presses for headless tests.
+
+    responses: one (key, rt) per response window, in order (None: no response in that window)
+    clock: function returning the current (simulated) time in seconds, e.g., SimulatedWindow.getTime
+    '''
+
+    def __init__(self, responses, clock):
+        self.responses = list(responses)
+        self.clock = clock
+        self.window = -1
+        self.onset = None
+
+    def clear(self):
+        self.window += 1 # next response window
+        self.onset = None
+
+    def markOnset(self):
+        self.onset = self.clock()
+
+    def poll(self, keyList=None):
+        if self.onset is None or self.window >= len(self.responses) or self.responses[self.window] is None:
+            return None
+        key, rt = self.responses[self.window]
+        if keyList is not None and key not in keyList:
+            return None
+        if self.clock() - self.onset < rt: # not pressed yet
+            return None
+        return key, rt
+
+
+def defaultBackend(event, clock):
+    '''The hardware keyboard if this PsychoPy has one (3.1+), else psychopy.event time stamped by a new clock (clock: core.Clock).'''
+    try:
+        return HardwareBackend()
+    except ImportError:
+        return EventBackend(event, clock())
+
+
+class KeyboardInput(object):
+    '''First key pressed in a response window, with its RT from the stimulus flip.'''
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.keyList = None
+        self.response = None
+
+    def start(self, win, keyList=None):
+        '''Start a response window: discard earlier key presses now and time RTs from the next flip.'''
+        self.keyList = keyList
+        self.response = None
+        self.backend.clear()
+        win.callOnFlip(self.backend.markOnset)
+
+    def ready(self, keyList=None):
+        '''Whether a key (in keyList, else the one given to start) has been pressed in this response window.'''
+        if self.response is None:
+            self.response = self.backend.poll(self.keyList if keyList is None else keyList)
+        return self.response is not None
+
+    def getResponse(self):
+        '''(key, rt) of the response (None before ready()).'''
+        return self.response
+
+    def getKeys(self, keyList=None):
+        '''[key] once a key has been pressed, else [] (drop-in for event.getKeys(keyList=...) in the trial loops).'''
+        return [self.response[0]] if self.ready(keyList) else []
+
+    @property
+    def rt(self):
+        '''RT (seconds from the stimulus flip to the key event) of the response.'''
+        return None if self.response is None else self.response[1]
+
+
+class SimulatedWindow(object):
+    '''Window stand-in whose flips advance a simulated clock by one frame (callOnFlip functions run at the flip).'''
+
+    def __init__(self, refreshRate=60.0):
+        self.frameDuration = 1.0 / refreshRate
+        self.time = 0.0
+        self.onFlip = []
+
+    def getTime(self):
+        return self.time
+
+    def callOnFlip(self, function, *args, **kwargs):
+        self.onFlip.append((function, args, kwargs))
+
+    def flip(self):
+        self.time += self.frameDuration # wait for the next refresh
+        onFlip, self.onFlip = self.onFlip, []
+        for function, args, kwargs in onFlip:
+            function(*args, **kwargs)
+        return self.time
+
+
+def compare(trials=200, refreshRate=60.0, deadlineFrames=90):
+    '''Mean and max error (ms) of frame-polled and timestamped RTs for random scripted RTs on a SimulatedWindow.'''
+    rts = [random.uniform(0.2, 1.2) for trial in range(trials)]
+    responses = [('f', rt) for rt in rts]
+
+    win = SimulatedWindow(refreshRate)
+    keyboard = KeyboardInput(SimulatedBackend(responses, win.getTime))
+    polled, stamped = [], []
+    for trial in range(trials):
+        keyboard.start(win, ['f', 'j'])
+        onset = [None]
+        win.callOnFlip(lambda: onset.__setitem__(0, win.getTime())) # respClock.reset
+        win.flip() # stimulus on
+        for frameN in range(deadlineFrames):
+            if keyboard.ready():
+                polled.append(win.getTime() - onset[0]) # respClock.getTime() when the key is noticed
+                stamped.append(keyboard.getResponse()[1])
+                break
+            win.flip()
+
+    errors = {}
+    for name, measured in [('frame-polled', polled), ('timestamped', stamped)]:
+        error = np.abs(np.array(measured) - np.array(rts[:len(measured)])) * 1000
+        errors[name] = (error.mean(), error.max())
+    return errors
+
+
+if __name__ == '__main__':
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for name, (meanError, maxError) in sorted(compare(trials).items()):
+        print('{:<15} RT error: mean {:6.2f} ms, max {:6.2f} ms'.format(name, meanError, maxError))
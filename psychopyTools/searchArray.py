@@ -0,0 +1,125 @@
+'''The items of a visual search display drawn as one element array, laid out from numpy arrays.
+
+runVisualSearchBlock made nStimuli TextStims ('L') through exec() and, on every trial, set the position
+and orientation of each and turned its autoDraw on and off, so every frame of the search display cost one
+draw call per item and the per-trial setup grew with the set size. A SearchArray draws every L as two
+bars (vertical stroke and foot) of a single ElementArrayStim: one draw call whatever the no. of items, and
+each trial's layout is set in one go from the block's arrays of positions and orientations:
+
+    searchArray = SearchArray(win, visual.ElementArrayStim, nStimuli, height=0.05, scale=normToHeight(win.size))
+    ...
+    searchArray.setLayout(thisTrial['stimulusPositions'], thisTrial['stimulusOris']) # prepare(): items x (x, y), items
+    searchArray.setAutoDraw(True) # showStimulus()
+
+The array is drawn in 'height' units, so that rotated items keep their shape on a non-square window;
+scale converts the layout coordinates (e.g., norm, as in coordinatesX/coordinatesY) to them.
+
+Run as a script to compare the per-trial layout cost of setting each item (simulated TextStims) with
+setLayout() for 20 to 200 items:
+    python searchArray.py
+'''
+
+from __future__ import print_function
+import sys
+import timeit
+import numpy as np
+
+
+def normToHeight(winSize):
+    '''(x, y) factors from norm to height units for a window of winSize pixels.'''
+    return (0.5 * winSize[0] / float(winSize[1]), 0.5)
+
+
+class SearchArray(object):
+    '''nItems L shapes as one element array (2 elements, the stroke and the foot, per item).
+
+    win: the window; factory: e.g., visual.ElementArrayStim
+    height: height of an L (in units); width, stroke: its width and stroke thickness as proportions of height
+    scale: (x, y) factors from layout coordinates to units (e.g., normToHeight(win.size))
+    '''
+
+    def __init__(self, win, factory, nItems, height=0.05, width=0.6, stroke=0.16, units='height', scale=(1.0, 1.0), color=(1, 1, 1), colorSpace='rgb'):
+        self.nItems = nItems
+        self.scale = np.asarray(scale, dtype=float)
+        width, stroke = width * height, stroke * height
+        self.offsets = np.array([[(stroke - width) / 2.0, 0.0], [0.0, (stroke - height) / 2.0]]) # centres of the stroke and the foot, relative to the item
+        sizes = np.tile([[stroke, height], [width, stroke]], (nItems, 1))
+        self.stim = factory(win=win, units=units, nElements=2 * nItems, xys=np.zeros((2 * nItems, 2)), oris=np.zeros(2 * nItems), sizes=sizes,
+                            colors=color, colorSpace=colorSpace, elementTex=None, elementMask=None)
+
+    def layout(self, positions, oris):
+        '''Element positions and orientations for items at positions (items x (x, y), layout coordinates) rotated by oris (degrees, clockwise).'''
+        positions = np.asarray(positions, dtype=float) * self.scale
+        oris = np.asarray(oris, dtype=float)
+        theta = np.radians(oris)[:, np.newaxis]
+        cos, sin = np.cos(theta), np.sin(theta)
+        dx, dy = self.offsets[:, 0], self.offsets[:, 1]
+        x = positions[:, 0:1] + dx * cos + dy * sin # items x elements, offsets rotated clockwise
+        y = positions[:, 1:2] - dx * sin + dy * cos
+        return np.column_stack([x.ravel(), y.ravel()]), np.repeat(oris, 2) # both elements of an item rotated with it
+
+    def setLayout(self, positions, oris):
+        '''Move and rotate all items (the first nItems rows of positions and oris).'''
+        xys, elementOris = self.layout(positions[:self.nItems], oris[:self.nItems])
+        self.stim.setXYs(xys)
+        self.stim.setOris(elementOris)
+
+    def setAutoDraw(self, value):
+        self.stim.setAutoDraw(value)
+
+    def draw(self):
+        self.stim.draw()
+
+
+def benchmark(setSizes=(20, 50, 100, 200), trials=100, repeats=5):
+    '''Per-trial layout cost (microseconds) and draw calls per frame, by set size: setPos/setOri/setAutoDraw of a
+    (simulated) TextStim per item vs SearchArray.setLayout().'''
+
+    class SimulatedStim(object):
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+        def setPos(self, pos):
+            self.pos = (float(pos[0]), float(pos[1]))
+
+        def setOri(self, ori):
+            self.ori = ori
+
+        def setXYs(self, xys):
+            self.xys = xys
+
+        def setOris(self, oris):
+            self.oris = oris
+
+        def setAutoDraw(self, value):
+            self.autoDraw = value
+
+    results = []
+    for nStimuli in setSizes:
+        positions = np.random.uniform(-0.8, 0.8, (trials, nStimuli, 2))
+        oris = np.random.randint(30, 321, (trials, nStimuli))
+
+        def textStims():
+            targetList = [SimulatedStim(text='L') for stimuliI in range(nStimuli)]
+            for t in range(trials):
+                for stimuliI in range(nStimuli):
+                    targetList[stimuliI].setPos((float(positions[t, stimuliI, 0]), float(positions[t, stimuliI, 1])))
+                    targetList[stimuliI].setOri(int(oris[t, stimuliI]))
+                    targetList[stimuliI].setAutoDraw(True)
+
+        def searchArray():
+            array = SearchArray(None, SimulatedStim, nStimuli)
+            for t in range(trials):
+                array.setLayout(positions[t], oris[t])
+                array.setAutoDraw(True)
+
+        results.append((nStimuli, [(name, min(timeit.repeat(function, number=1, repeat=repeats)) / trials * 1e6, calls)
+                                   for name, function, calls in [('TextStims', textStims, nStimuli), ('SearchArray', searchArray, 1)]]))
+    return results
+
+
+if __name__ == '__main__':
+    setSizes = [int(n) for n in sys.argv[1:]] or [20, 50, 100, 200]
+    for nStimuli, costs in benchmark(setSizes):
+        for name, perTrial, calls in costs:
+            print('{:4d} items  {:<12} {:8.1f} us per trial  {:4d} draw calls per frame'.format(nStimuli, name, perTrial, calls))
@@ -0,0 +1,127 @@
+'''Time budgets for blocks, tasks and the whole session.
+
+experimentMaxTimeSeconds used to be enforced by parsing the task's csv file twice per trial (head and tail)
+and blockMaxTimeSeconds by indexing trialsDf.loc[0, 'elapsedTime'] inside try/except. SessionClock answers
+the same questions in constant time from the first/last elapsedTime kept by the SessionLedger, and each
+block gets a BlockTimer that can also be polled every frame to end a block exactly at its deadline.
+'''
+
+
+class SessionClock(object):
+    '''Session-wide time keeper shared by all block runners.
+
+    clock: clock that elapsedTime is measured with (e.g., globalClock = core.Clock())
+    ledger: SessionLedger the runners save their rows through
+    '''
+
+    def __init__(self, clock, ledger):
+        self.clock = clock
+        self.ledger = ledger
+
+    def now(self):
+        '''Current time (seconds) on the session clock.'''
+        return self.clock.getTime()
+
+    def taskElapsed(self, filename):
+        '''Seconds between first and last trial saved to filename (0 if nothing saved yet).'''
+        first = self.ledger.firstElapsedTime(filename)
+        if first is None:
+            return 0.0
+        return self.ledger.lastElapsedTime(filename) - first
+
+    def taskRemaining(self, filename, maxSeconds):
+        '''Seconds left of maxSeconds for the task saved to filename (None if maxSeconds is None).'''
+        if maxSeconds is None:
+            return None
+        return maxSeconds - self.taskElapsed(filename)
+
+    def sessionElapsed(self):
+        '''Seconds since the first trial of the session was saved (0 if nothing saved yet).'''
+        if self.ledger.sessionFirstElapsedTime is None:
+            return 0.0
+        return self.now() - self.ledger.sessionFirstElapsedTime
+
+    def sessionRemaining(self, maxSeconds):
+        '''Seconds left of maxSeconds for the whole session (None if maxSeconds is None).'''
+        if maxSeconds is None:
+            return None
+        return maxSeconds - self.sessionElapsed()
+
+    def startBlock(self, filename, blockMaxTimeSeconds=None, experimentMaxTimeSeconds=None):
+        '''Return a BlockTimer for a block saving its trials to filename.'''
+        return BlockTimer(self, filename, blockMaxTimeSeconds, experimentMaxTimeSeconds)
+
+
+class BlockTimer(object):
+    '''Time limits of one block.
+
+    blockMaxTimeSeconds: block ends once this many seconds have passed since the end of its first trial
+    experimentMaxTimeSeconds: block ends once this many seconds have passed since the first trial saved to the task's csv file
+    '''
+
+    def __init__(self, sessionClock, filename, blockMaxTimeSeconds=None, experimentMaxTimeSeconds=None):
+        self.sessionClock = sessionClock
+        self.filename = filename
+        self.blockMaxTimeSeconds = blockMaxTimeSeconds
+        self.experimentMaxTimeSeconds = experimentMaxTimeSeconds
+        self.firstTrialTime = None # elapsedTime of the block's first trial
+        self.lastTrialTime = None # elapsedTime of the block's most recent trial
+
+    def trialEnded(self, elapsedTime):
+        '''Record elapsedTime (session clock) at the end of a trial.'''
+        if self.firstTrialTime is None:
+            self.firstTrialTime = elapsedTime
+        self.lastTrialTime = elapsedTime
+
+    def blockDeadline(self):
+        '''Session clock time at which blockMaxTimeSeconds runs out (None if no limit or no trial yet).'''
+        if self.blockMaxTimeSeconds is None or self.firstTrialTime is None:
+            return None
+        return self.firstTrialTime + self.blockMaxTimeSeconds
+
+    def experimentDeadline(self):
+        '''Session clock time at which experimentMaxTimeSeconds runs out (None if no limit or nothing saved yet).'''
+        if self.experimentMaxTimeSeconds is None:
+            return None
+        first = self.sessionClock.ledger.firstElapsedTime(self.filename)
+        if first is None: # nothing saved yet: the task started with this block (its first row may still be queued)
+            first = self.firstTrialTime
+        if first is None:
+            return None
+        return first + self.experimentMaxTimeSeconds
+
+    def deadline(self):
+        '''Earliest of the block and experiment deadlines (None if neither applies yet).'''
+        deadlines = [d for d in (self.blockDeadline(), self.experimentDeadline()) if d is not None]
+        if not deadlines:
+            return None
+        return min(deadlines)
+
+    def remaining(self):
+        '''Seconds left before the block has to end (None if there is no deadline yet).'''
+        deadline = self.deadline()
+        if deadline is None:
+            return None
+        return deadline - self.sessionClock.now()
+
+    def deadlinePassed(self):
+        '''Whether the session clock is past the deadline right now; cheap enough to call every frame.'''
+        deadline = self.deadline()
+        return deadline is not None and self.sessionClock.now() >= deadline
+
+    def expiredLimit(self):
+        ''''block' or 'experiment' if the session clock is past that deadline right now, else None.'''
+        now = self.sessionClock.now()
+        blockDeadline = self.blockDeadline()
+        if blockDeadline is not None and now >= blockDeadline:
+            return 'block'
+        experimentDeadline = self.experimentDeadline()
+        if experimentDeadline is not None and now >= experimentDeadline:
+            return 'experiment'
+        return None
+
+    def timeUp(self):
+        '''Check between trials: 'block' or 'experiment' if that limit has run out on the session clock, else None.
+
+        Not based on the last row saved, which can still be queued (BlockRunner saves a trial in the next ITI).'''
+        return self.expiredLimit()
@@ -0,0 +1,177 @@
+'''Session-scoped bookkeeping for the csv files written by the experiment scripts.
+
+Every block runner used to re-read its whole csv file (pd.read_csv) at the top of every trial to work out
+whether to write a header, the next blockNumber and the overallTrialNum. SessionLedger owns each output
+file for the whole session and keeps that state in memory, so a file is read at most once (when a session
+touches a file that already exists on disk) and never again.
+
+Rows can be given as dataframes (trialsDf[i:i+1]) or as TrialRows snapshots of a TrialBuffer; TrialRows are
+only turned into dataframes when they are written (by the writer thread if there is one) or read back.
+'''
+
+import os
+from collections import deque
+import pandas as pd
+
+
+def _columnValues(df, column):
+    '''Values of column in a dataframe or TrialRows.'''
+    if hasattr(df, 'toDataFrame'):
+        return df.column(column)
+    return df[column].values
+
+
+class SessionLedger(object):
+    '''Keep track of every csv file written during a session.
+
+    One ledger is created at the start of a script and shared by all block runners:
+        ledger = SessionLedger()
+        blockNumber = ledger.nextBlockNumber(filename)
+        trialsDf.loc[i, 'overallTrialNum'] = ledger.overallTrialNum(filename)
+        ledger.appendRows(trialsDf[i:i+1], filename)
+
+    A runner that saves a trial's row later (e.g., in the next trial's ITI) reserves its number when the trial
+    starts, so the next trial is numbered after it even if the row hasn't been written yet:
+        trials[i, 'overallTrialNum'] = ledger.reserveTrialNum(filename)
+        ... # appendRows() of the row uses up the reservation; release() gives it back if the row is never written
+
+    keepRows: no. of most recently written rows kept in memory per file (see lastRows)
+    writer: TrialWriter that appends rows on a background thread (None: write synchronously with to_csv)
+    columnar: ColumnarStore that also saves every file as .npz + .json when the ledger is closed (None: csv only)
+    '''
+
+    def __init__(self, keepRows=5, writer=None, columnar=None):
+        self.keepRows = keepRows
+        self.writer = writer
+        self.columnar = columnar
+        self.files = {} # filename -> dict with rows, maxBlockNumber, first/last elapsedTime and lastRows
+        self.sessionFirstElapsedTime = None # elapsedTime of the first row written to any file this session
+
+    def _entry(self, filename):
+        '''Return state of filename, reading the file from disk only the first time it is seen.'''
+        entry = self.files.get(filename)
+        if entry is None:
+            entry = {'rows': 0, 'reserved': 0, 'maxBlockNumber': 0, 'lastBlockNumber': None, 'firstElapsedTime': None, 'lastElapsedTime': None,
+                     'lastRows': pd.DataFrame(), 'recentRows': deque()}
+            if os.path.isfile(filename) and os.path.getsize(filename) > 0: # file from an earlier run of this session
+                try:
+                    existing = pd.read_csv(filename)
+                    entry['rows'] = existing.shape[0]
+                    if 'blockNumber' in existing.columns and existing.shape[0] > 0:
+                        entry['maxBlockNumber'] = int(existing['blockNumber'].max())
+                        entry['lastBlockNumber'] = existing['blockNumber'].iloc[-1]
+                    if 'elapsedTime' in existing.columns and existing.shape[0] > 0:
+                        entry['firstElapsedTime'] = existing['elapsedTime'].iloc[0]
+                        entry['lastElapsedTime'] = existing['elapsedTime'].iloc[-1]
+                        if self.sessionFirstElapsedTime is None or entry['firstElapsedTime'] < self.sessionFirstElapsedTime:
+                            self.sessionFirstElapsedTime = entry['firstElapsedTime']
+                    entry['lastRows'] = existing.tail(self.keepRows).reset_index(drop=True)
+                except:
+                    pass
+            self.files[filename] = entry
+        return entry
+
+    def writeHeader(self, filename):
+        '''Whether the next rows written to filename need a header (i.e., nothing has been written yet).'''
+        return self._entry(filename)['rows'] == 0
+
+    def rows(self, filename):
+        '''No. of data rows in filename.'''
+        return self._entry(filename)['rows']
+
+    def nextBlockNumber(self, filename):
+        '''Largest blockNumber written to filename plus 1 (1 if no rows yet).'''
+        return self._entry(filename)['maxBlockNumber'] + 1
+
+    def overallTrialNum(self, filename):
+        '''Overall trial number of the next row written to filename (after the rows reserved but not written yet).'''
+        entry = self._entry(filename)
+        return entry['rows'] + entry['reserved'] + 1
+
+    def reserveTrialNum(self, filename):
+        '''Overall trial number of a row that will be written to filename later; later trials are numbered after it.'''
+        number = self.overallTrialNum(filename)
+        self._entry(filename)['reserved'] += 1
+        return number
+
+    def release(self, filename, n=None):
+        '''Give back n (None: all) reserved trial numbers whose rows won't be written (e.g., at the end of a block cut short by a time limit, or run with saveData=False).'''
+        entry = self._entry(filename)
+        entry['reserved'] = 0 if n is None else max(entry['reserved'] - n, 0)
+
+    def firstElapsedTime(self, filename):
+        '''elapsedTime of the first row in filename (None if no rows or no elapsedTime column).'''
+        return self._entry(filename)['firstElapsedTime']
+
+    def lastElapsedTime(self, filename):
+        '''elapsedTime of the last row in filename (None if no rows or no elapsedTime column).'''
+        return self._entry(filename)['lastElapsedTime']
+
+    def lastRows(self, filename, n=1):
+        '''Last n rows written to filename (at most keepRows) as a dataframe with a fresh index.'''
+        entry = self._entry(filename)
+        if entry['recentRows']: # rows appended since lastRows was last asked for
+            chunks = [entry['lastRows']] + [c.toDataFrame() if hasattr(c, 'toDataFrame') else c for c in entry['recentRows']]
+            entry['lastRows'] = pd.concat(chunks, ignore_index=True).tail(self.keepRows).reset_index(drop=True)
+            entry['recentRows'].clear()
+        return entry['lastRows'].tail(n).reset_index(drop=True)
+
+    def appendRows(self, df, filename):
+        '''Append rows in df (dataframe or TrialRows) to filename (header written only if the file is still empty) and update the ledger.'''
+        entry = self._entry(filename)
+        if df.shape[0] == 0:
+            return
+        if self.writer is None:
+            (df.toDataFrame() if hasattr(df, 'toDataFrame') else df).to_csv(filename, header=entry['rows'] == 0, mode='a', index=False)
+        else:
+            if 'blockNumber' in df.columns and entry['lastBlockNumber'] is not None:
+                if _columnValues(df, 'blockNumber')[0] != entry['lastBlockNumber']: # first row of a new block: previous block is complete
+                    self.writer.endBlock(filename)
+            self.writer.write(filename, df if hasattr(df, 'toDataFrame') else df.copy(), header=entry['rows'] == 0) # TrialRows are already a copy
+        if self.columnar is not None:
+            self.columnar.addRows(df, filename)
+        self.recordRows(df, filename)
+
+    def afterWrite(self, filename, function, *args):
+        '''Call function(*args) once the rows appended to filename so far are in the file (now without a writer).'''
+        if self.writer is None:
+            function(*args)
+        else:
+            self.writer.after(filename, function, *args)
+
+    def flush(self):
+        '''Wait until rows queued on the writer are in their files (no-op without a writer).'''
+        if self.writer is not None:
+            self.writer.flush()
+
+    def close(self):
+        '''Write out all queued rows and close the files (call before quitting).'''
+        if self.columnar is not None:
+            self.columnar.save()
+        if self.writer is not None:
+            self.writer.close()
+
+    def recordRows(self, df, filename):
+        '''Update the ledger for rows in df that have been (or are about to be) written to filename elsewhere.'''
+        entry = self._entry(filename)
+        entry['rows'] += df.shape[0]
+        entry['reserved'] = max(entry['reserved'] - df.shape[0], 0) # rows of reserved trial numbers
+        if 'blockNumber' in df.columns:
+            blockNumbers = _columnValues(df, 'blockNumber')
+            entry['lastBlockNumber'] = blockNumbers[-1]
+            try:
+                entry['maxBlockNumber'] = max(entry['maxBlockNumber'], int(max(blockNumbers)))
+            except (TypeError, ValueError):
+                pass
+        if 'elapsedTime' in df.columns:
+            elapsedTimes = _columnValues(df, 'elapsedTime')
+            if entry['firstElapsedTime'] is None:
+                entry['firstElapsedTime'] = elapsedTimes[0]
+            if self.sessionFirstElapsedTime is None:
+                self.sessionFirstElapsedTime = elapsedTimes[0]
+            entry['lastElapsedTime'] = elapsedTimes[-1]
+        # keep the rows for lastRows without building dataframes now; keepRows chunks hold at least keepRows rows
+        entry['recentRows'].append(df if hasattr(df, 'toDataFrame') else df.copy())
+        if len(entry['recentRows']) > self.keepRows:
+            entry['recentRows'].popleft()
+            entry['lastRows'] = pd.DataFrame()
@@ -0,0 +1,278 @@
+'''Running tallies of the session's trials for the pause rule, showCredit and an experimenter monitor.
+
+pauseAfterMissingNTrials sliced the last N rts of the block out of trialsDf (later the trial buffer) on every
+trial, the runners appended acc and rt to runningTallyAcc/runningTallyRt lists nobody read, and showCredit
+added up the session at the end by reading csv files or backup journals back in. A SessionMetrics registry
+is created once per script; the runners publish each trial to it and it keeps, per task and per condition
+(e.g., congruent/incongruent, baseline/effortful), the count, sum and a rolling window of every value
+published, plus the no. of trials missed in a row. All updates and queries are O(1):
+
+    metrics = SessionMetrics(window=20)
+    metrics.startBlock(taskName) # missed-in-a-row count starts again at 0
+    ...
+    metrics.record(taskName, thisTrial['congruency'], acc=trials[i, 'acc'], rt=trials[i, 'rt'])
+    if metrics.missedInARow(taskName) >= pauseAfterMissingNTrials: # rt NaN/None counts as missed
+        ...
+    overallAcc = metrics.mean('effortRewardChoice', 'accUpdating') * 100 # showCredit
+
+metrics.serve(8765) serves a read-only JSON snapshot (accuracy, rt, miss rates, overall and over the last
+window trials) at http://127.0.0.1:8765 on a background thread, so the experimenter can watch the session
+from another terminal or a browser on the same computer:
+    python sessionMetrics.py watch 8765
+
+Run as a script to compare the per-trial cost of the slice-based pause rule with missedInARow():
+    python sessionMetrics.py [trials]
+'''
+
+from __future__ import print_function
+import sys
+import json
+import time
+import timeit
+import threading
+import collections
+import numbers
+import numpy as np
+import pandas as pd
+try:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler # python 2
+    from urllib2 import urlopen
+except ImportError:
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from urllib.request import urlopen
+
+
+def _missing(value):
+    '''Whether value is None or NaN (not published, e.g., no rt on a missed trial).'''
+    return value is None or (isinstance(value, numbers.Real) and value != value)
+
+
+def _jsonNumber(value):
+    '''value for json.dumps (NaN isn't valid JSON: None).'''
+    if value is None or value != value:
+        return None
+    return float(value)
+
+
+class RollingWindow(object):
+    '''Mean and no. of missing values (None/NaN) of the last size values added; add() is O(1).'''
+
+    def __init__(self, size):
+        self.values = collections.deque(maxlen=size)
+        self.total = 0.0 # of the values present
+        self.count = 0 # no. of values present
+
+    def add(self, value):
+        if len(self.values) == self.values.maxlen:
+            oldest = self.values[0]
+            if not _missing(oldest):
+                self.total -= oldest
+                self.count -= 1
+        self.values.append(value)
+        if not _missing(value):
+            self.total += value
+            self.count += 1
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else np.nan
+
+    @property
+    def missing(self):
+        return len(self.values) - self.count
+
+    def __len__(self):
+        return len(self.values)
+
+
+class Tally(object):
+    '''One published value (e.g., acc) of a task or condition: no. of trials, count and sum of the values present, and a rolling window.'''
+
+    def __init__(self, window=20):
+        self.n = 0 # trials published
+        self.count = 0 # ... with a value (not None/NaN)
+        self.total = 0.0
+        self.window = RollingWindow(window)
+
+    def add(self, value):
+        self.n += 1
+        if not _missing(value):
+            self.count += 1
+            self.total += value
+        self.window.add(value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else np.nan
+
+    @property
+    def missing(self):
+        return self.n - self.count
+
+    def snapshot(self):
+        '''Summary for the monitor (JSON-ready).'''
+        return collections.OrderedDict([('n', self.n), ('count', self.count), ('total', _jsonNumber(self.total)), ('mean', _jsonNumber(self.mean)),
+                                        ('missingRate', _jsonNumber(float(self.missing) / self.n if self.n else np.nan)),
+                                        ('rollingMean', _jsonNumber(self.window.mean)),
+                                        ('rollingMissingRate', _jsonNumber(float(self.window.missing) / len(self.window) if len(self.window) else np.nan))])
+
+
+class SessionMetrics(object):
+    '''Tallies of every value published for each task, overall and by condition.
+
+    window: no. of trials of the rolling windows (rolling accuracy, miss rate, ...)
+    '''
+
+    def __init__(self, window=20):
+        self.window = window
+        self.tallies = collections.OrderedDict() # (task, condition) -> OrderedDict(name -> Tally); condition None: all trials of the task
+        self.streaks = {} # task -> no. of trials missed in a row in its current block
+        self.lock = threading.Lock() # the monitor thread reads while the trial loop writes
+        self.server = None
+        self.started = time.time()
+
+    def startBlock(self, task):
+        '''A block of task starts: the missed-in-a-row count starts again at 0.'''
+        self.streaks[task] = 0
+
+    def record(self, task, condition=None, **values):
+        '''Publish a trial of task (and condition, e.g., thisTrial['congruency']); values: name -> value (None/NaN: missing).
+
+        A missing rt counts the trial as missed (missedInARow).'''
+        with self.lock:
+            keys = [(task, None)] if condition is None else [(task, None), (task, condition)]
+            for key in keys:
+                tallies = self.tallies.get(key)
+                if tallies is None:
+                    tallies = self.tallies[key] = collections.OrderedDict()
+                for name, value in values.items():
+                    tally = tallies.get(name)
+                    if tally is None:
+                        tally = tallies[name] = Tally(self.window)
+                    tally.add(value)
+            if 'rt' in values:
+                self.streaks[task] = self.streaks.get(task, 0) + 1 if _missing(values['rt']) else 0
+
+    def missedInARow(self, task):
+        '''No. of trials of task's current block missed in a row, up to the last one published.'''
+        return self.streaks.get(task, 0)
+
+    def tally(self, task, name, condition=None):
+        '''Tally of value name of task (of condition; None: all trials), an empty one if nothing was published.'''
+        tally = self.tallies.get((task, condition), {}).get(name)
+        return tally if tally is not None else Tally(self.window)
+
+    def mean(self, task, name, condition=None):
+        '''Mean of the values present (NaN if there are none).'''
+        return self.tally(task, name, condition).mean
+
+    def total(self, task, name, condition=None):
+        '''Sum of the values present (0 if there are none).'''
+        return self.tally(task, name, condition).total
+
+    def count(self, task, name, condition=None):
+        '''No. of values present.'''
+        return self.tally(task, name, condition).count
+
+    def snapshot(self):
+        '''All tallies as nested dicts (task -> condition ('all': all trials) -> name -> summary), JSON-ready.'''
+        with self.lock:
+            tasks = collections.OrderedDict()
+            for (task, condition), tallies in self.tallies.items():
+                if task not in tasks:
+                    tasks[task] = collections.OrderedDict([('missedInARow', self.streaks.get(task, 0)), ('conditions', collections.OrderedDict())])
+                tasks[task]['conditions']['all' if condition is None else str(condition)] = collections.OrderedDict((name, tally.snapshot()) for name, tally in tallies.items())
+            return collections.OrderedDict([('elapsed', time.time() - self.started), ('window', self.window), ('tasks', tasks)])
+
+    def serve(self, port=8765, host='127.0.0.1'):
+        '''Serve snapshot() as JSON at http://host:port on a daemon thread (read-only: any GET returns it); return the port.'''
+        metrics = self
+
+        class SnapshotHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(metrics.snapshot()).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args): # keep the console for the script's own messages
+                pass
+
+        self.close()
+        self.server = HTTPServer((host, port), SnapshotHandler)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True # doesn't keep the script alive
+        thread.start()
+        return self.server.server_address[1]
+
+    def close(self):
+        '''Stop serving snapshots.'''
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+def fetchSnapshot(port=8765, host='127.0.0.1', timeout=2.0):
+    '''Snapshot served by SessionMetrics.serve() (dict).'''
+    return json.loads(urlopen('http://{}:{}'.format(host, port), timeout=timeout).read().decode('utf-8'))
+
+
+def watch(port=8765, host='127.0.0.1', interval=2.0):
+    '''Print accuracy, rt and miss rates of every task and condition every interval seconds (Ctrl+C to stop).'''
+    def percent(value):
+        return '   -' if value is None else '{:3.0f}%'.format(value * 100)
+
+    while True:
+        try:
+            snapshot = fetchSnapshot(port, host)
+        except Exception as e:
+            print('No snapshot at {}:{} ({})'.format(host, port, e))
+        else:
+            print('--- {:.0f} s'.format(snapshot['elapsed']))
+            for task, summary in snapshot['tasks'].items():
+                for condition, tallies in summary['conditions'].items():
+                    acc, rt = tallies.get('acc'), tallies.get('rt')
+                    print('{:<28} {:<12} n {:4d}  acc {} (last {}: {})  missed {} (last: {})  rt {}  missed in a row {}'.format(
+                        task, condition, (acc or rt or {'n': 0})['n'],
+                        percent(acc and acc['mean']), snapshot['window'], percent(acc and acc['rollingMean']),
+                        percent(rt and rt['missingRate']), percent(rt and rt['rollingMissingRate']),
+                        '   -' if not rt or rt['mean'] is None else '{:.3f}'.format(rt['mean']), summary['missedInARow']))
+        time.sleep(interval)
+
+
+def benchmark(trials=300, n=3, repeats=5):
+    '''Per-trial cost (microseconds) of the pause rule over a block: slicing the last n rts vs SessionMetrics.missedInARow().'''
+    rts = np.where(np.random.rand(trials) < 0.1, np.nan, np.random.uniform(0.3, 1.5, trials))
+
+    def sliceRule():
+        trialsDf = pd.DataFrame({'rt': rts})
+        pauses = []
+        for i in range(trials):
+            pauses.append(i >= n - 1 and trialsDf.loc[i-(n-1):i, 'rt'].isnull().sum() == n)
+        return pauses
+
+    def metricsRule():
+        metrics = SessionMetrics()
+        metrics.startBlock('task')
+        pauses = []
+        for i in range(trials):
+            metrics.record('task', acc=1, rt=rts[i])
+            pauses.append(metrics.missedInARow('task') >= n)
+        return pauses
+
+    if sliceRule() != metricsRule():
+        raise AssertionError('missedInARow() differs from the slice rule')
+    return dict((name, min(timeit.repeat(function, number=1, repeat=repeats)) / trials * 1e6)
+                for name, function in [('trialsDf slice', sliceRule), ('SessionMetrics', metricsRule)])
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'watch':
+        watch(int(sys.argv[2]) if len(sys.argv) > 2 else 8765)
+    else:
+        trials = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+        for name, perTrial in sorted(benchmark(trials).items()):
+            print('{:<16} {:8.1f} us per trial ({} trials)'.format(name, perTrial, trials))
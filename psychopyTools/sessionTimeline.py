@@ -0,0 +1,202 @@
+'''Resume a crashed session at the first incomplete section of the top-level timeline.
+
+The top-level timeline of a script is split into named sections. After each section, SessionTimeline
+saves a small state file ({participant:03d}-{startTime}-session.pkl) with the info dict (condition
+assignment, startTime, demographics, ...), the random number generator states, remembered globals
+(e.g., randomColourAssignmentToStimulus) and the sections completed so far. When the script is started
+again for a participant with an unfinished session, the old session is resumed: the same startTime is
+used, so the SessionLedger picks up blockNumber/overallTrialNum from the existing csv files, and completed
+sections are skipped:
+    timeline = SessionTimeline(timelineFilename(info['participant'], info['startTime']), info, ledger=ledger, clock=globalClock)
+    randomColourAssignmentToStimulus = timeline.remember('randomColourAssignmentToStimulus', randomColourAssignmentToStimulus)
+    if timeline.pending('choiceTaskPre'):
+        choiceTaskPre()
+        timeline.completed('choiceTaskPre')
+    ...
+    timeline.close() # end of session
+
+The section that was running when the session crashed is run again from its start, so the rows it had
+written would be in the csv files twice and count toward blockNumber/overallTrialNum. completed() also saves
+the no. of rows in each of the session's data files (csv files and backup journals with the state file's
+prefix); when resuming, the rows written after the last completed section are moved aside into
+<file>-incomplete.csv (or .jsonl) before anything reads the files. It also saves the time on the session
+clock, which a resumed session starts its clock from, so that elapsedTime (and the experiment time limit,
+see sessionClock.py) carries on from the kept rows instead of starting again at 0:
+    if timeline.resumed:
+        globalClock.reset(-timeline.elapsed)
+'''
+
+from __future__ import print_function
+import os
+import glob
+import random
+try:
+    import cPickle as pickle # python 2
+except ImportError:
+    import pickle
+import numpy as np
+import pandas as pd
+
+PROTOCOL = 2 # readable by python 2 and 3
+INCOMPLETE = '-incomplete' # suffix of the files rows of an unfinished section are moved into
+
+
+def timelineFilename(participant, startTime):
+    '''State file of a session (same prefix as its csv files).'''
+    return "{:03d}-{}-session.pkl".format(int(participant), startTime)
+
+
+def loadTimeline(filename):
+    '''State saved in filename (None if the file can't be read).'''
+    try:
+        with open(filename, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def findTimeline(participant, directory='.'):
+    '''Most recent state file of participant whose session didn't finish (None if there isn't one).'''
+    pattern = os.path.join(directory, "{:03d}-*-session.pkl".format(int(participant)))
+    for filename in sorted(glob.glob(pattern), reverse=True): # file names start with startTime, so newest first
+        state = loadTimeline(filename)
+        if state is not None and not state['finished']:
+            return filename
+    return None
+
+
+def _replace(tmp, filename):
+    '''Move tmp onto filename.'''
+    if hasattr(os, 'replace'):
+        os.replace(tmp, filename)
+    else: # python 2
+        if os.path.exists(filename):
+            os.remove(filename)
+        os.rename(tmp, filename)
+
+
+def _readRows(filename):
+    '''Data rows of a session file: a dataframe of strings for a csv file (written back as read), lines for a journal.'''
+    if filename.endswith('.jsonl'):
+        with open(filename, 'r') as f:
+            return [line for line in f if line.strip()]
+    if os.path.getsize(filename) == 0:
+        return pd.DataFrame()
+    return pd.read_csv(filename, dtype=str, keep_default_na=False)
+
+
+def _countRows(filename):
+    '''No. of data rows in a session file.'''
+    return len(_readRows(filename))
+
+
+def _truncateRows(filename, n):
+    '''Keep the first n data rows of a session file and append the others to its -incomplete file; return the no. moved.'''
+    rows = _readRows(filename)
+    if len(rows) <= n:
+        return 0
+    base, extension = os.path.splitext(filename)
+    aside = base + INCOMPLETE + extension
+    if extension == '.jsonl':
+        with open(aside, 'a') as f:
+            f.writelines(rows[n:])
+        kept = rows[:n]
+    else:
+        rows.iloc[n:].to_csv(aside, mode='a', header=not os.path.isfile(aside), index=False)
+        kept = rows.iloc[:n]
+    if n == 0: # the file was started by the unfinished section: a new one (with header) is written when it runs again
+        os.remove(filename)
+        return len(rows)
+    tmp = filename + '.tmp'
+    if extension == '.jsonl':
+        with open(tmp, 'w') as f:
+            f.writelines(kept)
+    else:
+        kept.to_csv(tmp, index=False)
+    _replace(tmp, filename)
+    return len(rows) - n
+
+
+class SessionTimeline(object):
+    '''Completed sections of a session's top-level timeline and the state needed to resume after them.
+
+    filename: state file (see timelineFilename)
+    info: the script's info dict; saved after every section and updated from the state file when resuming
+    resume: if True, continue the session saved in filename
+    ledger: the script's SessionLedger; its queued rows are written before completed() counts the rows in the files
+    clock: clock that elapsedTime is measured with (globalClock); completed() saves its time
+    '''
+
+    def __init__(self, filename, info, resume=False, ledger=None, clock=None):
+        self.filename = filename
+        self.info = info
+        self.ledger = ledger
+        self.clock = clock
+        self.elapsed = 0.0 # session clock time at the end of the last completed section
+        self.done = [] # names of completed sections, in order
+        self.remembered = {} # globals that have to stay the same when resuming
+        self.rows = {} # data file -> no. of rows after the last completed section
+        self.resumed = False
+        state = loadTimeline(filename) if resume else None
+        if state is not None:
+            info.update(state['info'])
+            self.done = state['done']
+            self.remembered = state['remembered']
+            self.elapsed = state.get('elapsed', 0.0) # state files saved before the time was kept: 0
+            random.setstate(state['randomState'][0])
+            np.random.set_state(state['randomState'][1])
+            self.resumed = True
+            if 'rows' in state: # state files saved before rows were counted: files are left as they are
+                self.rows = state['rows']
+                for dataFile in self.dataFiles():
+                    moved = _truncateRows(dataFile, self.rows.get(os.path.basename(dataFile), 0))
+                    if moved:
+                        print('{}: {} rows written after the last completed section moved aside'.format(dataFile, moved))
+        else:
+            self.countRows()
+        self.save()
+
+    def dataFiles(self):
+        '''csv files and backup journals of the session (names starting with the state file's prefix), except -incomplete files.'''
+        prefix = self.filename[:-len('-session.pkl')] if self.filename.endswith('-session.pkl') else os.path.splitext(self.filename)[0]
+        files = glob.glob(prefix + '-*.csv') + glob.glob(prefix + '-*.jsonl')
+        return sorted(f for f in files if not os.path.splitext(f)[0].endswith(INCOMPLETE))
+
+    def countRows(self):
+        '''Save the no. of rows in each data file, i.e., the rows to keep if the session is resumed after this point.'''
+        if self.ledger is not None:
+            self.ledger.flush()
+        self.rows = dict((os.path.basename(f), _countRows(f)) for f in self.dataFiles())
+
+    def remember(self, name, value):
+        '''Value of a global (e.g., a random condition assignment) that is kept when resuming: the saved one if there is one, else value.'''
+        if name not in self.remembered:
+            self.remembered[name] = value
+            self.save()
+        return self.remembered[name]
+
+    def pending(self, name):
+        '''Whether section name still has to be run.'''
+        return name not in self.done
+
+    def completed(self, name):
+        '''Mark section name as completed and save the state to resume from.'''
+        if name not in self.done:
+            self.done.append(name)
+        if self.clock is not None:
+            self.elapsed = self.clock.getTime()
+        self.countRows()
+        self.save()
+
+    def save(self, finished=False):
+        info = dict((k, v) for k, v in self.info.items() if not isinstance(v, pd.DataFrame))
+        state = {'info': info, 'done': self.done, 'remembered': self.remembered, 'rows': self.rows, 'elapsed': self.elapsed, 'finished': finished,
+                 'randomState': (random.getstate(), np.random.get_state())}
+        tmp = self.filename + '.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(state, f, PROTOCOL)
+        _replace(tmp, self.filename)
+
+    def close(self):
+        '''Mark the session as finished (it won't be offered for resuming).'''
+        self.save(finished=True)
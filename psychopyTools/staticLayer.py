@@ -0,0 +1,157 @@
+'''Stimuli that stay the same while they're on screen, captured into one image and drawn as one quad.
+
+The choice screens (constantOptionEffort, constantOptionReward, keyF, keyJ), the mental math response
+screen (the four answers and keyD/F/J/K), the Stroop cues (cueText1-3) and getDemographics' response
+lists were drawn as separate TextStims on every frame they were shown (one draw call each, up to 10 per
+frame). A StaticLayer captures its member stimuli into a single image (e.g., a BufferImageStim) and draws
+that instead:
+
+    cueLayer = StaticLayer(lambda stimuli: visual.BufferImageStim(win, stim=stimuli, rect=rect, pos=pos), [cueText1, cueText2, cueText3])
+    ...
+    cueText1.setColor('red') # e.g., in prepare()
+    cueLayer.update() # captured again, as a member changed (or a capture of this state is reused)
+    ...
+    cueLayer.setAutoDraw(True) # showStimulus(): one image instead of 3 stimuli
+
+The layer notices changes to its members (text, position, colour, opacity, orientation, size, ...) by
+itself: update(), draw() and setAutoDraw(True) capture the members again if any of them differs from the
+last capture. Captures of the last maxImages states are kept, so a state that comes back (e.g., a cue
+highlighted on some trials) isn't captured again. A capture draws to the back buffer (and BufferImageStim
+clears it), so update() is best called when nothing else has been drawn for the next flip, e.g., when the
+task is set up or in prepare() (during the ITI). The image is given a depth of 1 so that, with autoDraw,
+it is drawn behind the other stimuli (depth 0) on screen.
+
+Run as a script to compare the per-frame cost and draw calls of the members with the layer's (simulated
+stimuli, each draw call set to take drawS seconds):
+    python staticLayer.py [frames]
+'''
+
+from __future__ import print_function
+import sys
+import time
+import timeit
+from collections import OrderedDict
+
+
+# attributes of a member that make a difference to the captured image
+ATTRIBUTES = ('text', 'pos', 'color', 'colorSpace', 'opacity', 'ori', 'height', 'size', 'font', 'wrapWidth', 'units')
+
+
+def _frozen(value):
+    '''value as a dict key (lists and arrays as tuples).'''
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(v) for v in value)
+    if hasattr(value, 'tolist'): # numpy array/scalar
+        return _frozen(value.tolist())
+    return value
+
+
+def _state(stimulus):
+    '''The attributes of stimulus the image depends on, as a dict key.'''
+    return tuple(_frozen(getattr(stimulus, attribute, None)) for attribute in ATTRIBUTES)
+
+
+class StaticLayer(object):
+    '''Member stimuli captured into one image, captured again when any of them changes.
+
+    capture: capture(stimuli) -> image stimulus showing the stimuli (e.g., a BufferImageStim)
+    stimuli: the members, in drawing order
+    maxImages: no. of captures kept (of the members' last states)
+    depth: depth of the image (drawn before stimuli of lower depth with autoDraw)
+    '''
+
+    def __init__(self, capture, stimuli, maxImages=8, depth=1):
+        self.capture = capture
+        self.stimuli = list(stimuli)
+        self.maxImages = maxImages
+        self.depth = depth
+        self.images = OrderedDict() # members' state -> image, least recently used first
+        self.image = None
+        self.autoDraw = False
+        self.captures = 0
+
+    def state(self):
+        return tuple(_state(stimulus) for stimulus in self.stimuli)
+
+    def update(self):
+        '''The image of the members as they are now (captured now if none of the kept images shows them).'''
+        state = self.state()
+        image = self.images.pop(state, None)
+        if image is None:
+            image = self.capture(self.stimuli)
+            image.depth = self.depth
+            self.captures += 1
+            while len(self.images) >= self.maxImages:
+                self.images.popitem(last=False)
+        self.images[state] = image
+        if image is not self.image:
+            if self.autoDraw and self.image is not None:
+                self.image.setAutoDraw(False)
+                image.setAutoDraw(True)
+            self.image = image
+        return image
+
+    def invalidate(self):
+        '''Drop all captures (e.g., after a change the layer doesn't see); a layer on screen is captured again now.'''
+        autoDraw = self.autoDraw
+        self.setAutoDraw(False)
+        self.images.clear()
+        self.image = None
+        if autoDraw:
+            self.setAutoDraw(True)
+
+    def draw(self):
+        self.update().draw()
+
+    def setAutoDraw(self, value):
+        '''Draw the image on every flip (after updating it) or stop drawing it.'''
+        if value:
+            self.update().setAutoDraw(True)
+        elif self.image is not None:
+            self.image.setAutoDraw(False)
+        self.autoDraw = value
+
+
+def benchmark(frames=120, repeats=5, drawS=0.00005):
+    '''Per-frame cost (microseconds) and draw calls of the screens with constant labels: their members drawn
+    one by one vs a StaticLayer (simulated stimuli; each draw call takes drawS seconds).'''
+
+    class SimulatedStim(object):
+        def __init__(self, text='', pos=(0, 0), color=(1, 1, 1)):
+            self.text, self.pos, self.color = text, pos, color
+
+        def draw(self):
+            end = time.time() + drawS
+            while time.time() < end:
+                pass
+
+    screens = [('choice options', ['1 stroop', '10 credits', 'F', 'J']),
+               ('math answers', ['1234', '2345', '3456', '4567', 'D', 'F', 'J', 'K']),
+               ('stroop cues', ['red:R', 'green:G', 'yellow:Y']),
+               ('demographics', ['Indicate your ethnicity (use keyboard)'] + ['{}. option'.format(i) for i in range(1, 10)])]
+    results = []
+    for name, texts in screens:
+        stimuli = [SimulatedStim(text, (0, -0.1 * n)) for n, text in enumerate(texts)]
+
+        def members():
+            for frameN in range(frames):
+                for stimulus in stimuli:
+                    stimulus.draw()
+
+        layer = StaticLayer(lambda stimuli: SimulatedStim(), stimuli)
+        layer.update() # captured when the task is set up, not timed
+
+        def layered():
+            for frameN in range(frames):
+                layer.image.draw() # with autoDraw, the window draws the image
+
+        results.append((name, [(method, min(timeit.repeat(function, number=1, repeat=repeats)) / frames * 1e6, calls)
+                               for method, function, calls in [('stimuli', members, len(stimuli)), ('StaticLayer', layered, 1)]]))
+    return results
+
+
+if __name__ == '__main__':
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    for name, costs in benchmark(frames):
+        for method, perFrame, calls in costs:
+            print('{:<16} {:<12} {:8.1f} us per frame  {:3d} draw calls'.format(name, method, perFrame, calls))
@@ -0,0 +1,156 @@
+'''TextStims kept by the window and reused, instead of constructed on every call and every trial.
+
+showInstructions built its continueText and instructText on every call, the choice and training runners
+built feedbackText1 (and pointsFeedback) on every trial, and showQuestionnaire a questionText for every
+item; each construction allocates the stimulus' GL resources and renders its font texture again. A
+StimulusPool, one per window, keeps the stimuli it has made, keyed by name and style (font, height,
+wrapWidth, colorSpace, units, ...). get() returns the pooled stimulus if there is one, with only the
+attributes that changed (text, pos, color, opacity, ori) set again, or makes it with the factory:
+
+    stimulusPool = poolFor(win, visual.TextStim)
+    ...
+    feedbackText1 = stimulusPool.get('feedbackText1', units='norm', colorSpace='rgb', color=[1, 1, 1], font='Verdana', text='', height=0.07, wrapWidth=1.4, pos=[0.0, 0.0])
+
+Stimuli drawn on the same screen need different names (e.g., feedbackText1 and pointsFeedback have the same
+style). The pool holds at most maxSize stimuli: the least recently used one is dropped (and its autoDraw
+turned off) to make room. stats() gives the hits, misses and evictions so far.
+
+Run as a script to compare the cost of constructing a (simulated) stimulus per trial with the pool:
+    python stimulusPool.py [trials]
+'''
+
+from __future__ import print_function
+import sys
+import time
+import timeit
+import weakref
+from collections import OrderedDict
+
+
+# attributes that can change between uses of a pooled stimulus (set again on a hit if they differ from the stimulus')
+MUTABLE = ('text', 'pos', 'color', 'opacity', 'ori')
+
+_pools = weakref.WeakKeyDictionary() # window -> StimulusPool
+
+
+def _frozen(value):
+    '''value as a dict key (lists and arrays as tuples).'''
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(v) for v in value)
+    if hasattr(value, 'tolist'): # numpy array/scalar
+        return _frozen(value.tolist())
+    return value
+
+
+class StimulusPool(object):
+    '''Stimuli of one window, made by factory(win=win, **kwargs) and reused by name and style.
+
+    win: the window the stimuli are drawn on
+    factory: e.g., visual.TextStim
+    maxSize: no. of stimuli kept (least recently used are dropped)
+    '''
+
+    def __init__(self, win, factory, maxSize=32):
+        self.win = win
+        self.factory = factory
+        self.maxSize = maxSize
+        self.stimuli = OrderedDict() # key -> stimulus, least recently used first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, name, kwargs):
+        '''Name and style (all keyword arguments but the MUTABLE ones) of a stimulus.'''
+        return (name, tuple(sorted((k, _frozen(v)) for k, v in kwargs.items() if k not in MUTABLE)))
+
+    def get(self, name=None, **kwargs):
+        '''Stimulus name with kwargs (style and MUTABLE attributes): the pooled one, updated, or a new one.'''
+        key = self.key(name, kwargs)
+        stimulus = self.stimuli.pop(key, None)
+        if stimulus is None:
+            self.misses += 1
+            stimulus = self.factory(win=self.win, **kwargs)
+            while len(self.stimuli) >= self.maxSize:
+                self.evict()
+        else:
+            self.hits += 1
+            for attribute in MUTABLE:
+                # set again only what differs from the stimulus as it was left (callers may have changed it since)
+                if attribute in kwargs and _frozen(getattr(stimulus, attribute, None)) != _frozen(kwargs[attribute]):
+                    getattr(stimulus, 'set' + attribute[0].upper() + attribute[1:])(kwargs[attribute])
+        self.stimuli[key] = stimulus
+        return stimulus
+
+    def evict(self):
+        '''Drop the least recently used stimulus.'''
+        key, stimulus = self.stimuli.popitem(last=False)
+        if hasattr(stimulus, 'setAutoDraw'):
+            stimulus.setAutoDraw(False)
+        self.evictions += 1
+
+    def clear(self):
+        '''Drop all stimuli (e.g., before closing the window).'''
+        while self.stimuli:
+            self.evict()
+
+    def stats(self):
+        '''Hits, misses, evictions, hit rate and no. of stimuli pooled.'''
+        requests = self.hits + self.misses
+        return OrderedDict([('hits', self.hits), ('misses', self.misses), ('evictions', self.evictions),
+                            ('hitRate', float(self.hits) / requests if requests else float('nan')), ('size', len(self.stimuli))])
+
+    def __len__(self):
+        return len(self.stimuli)
+
+
+def poolFor(win, factory, maxSize=32):
+    '''The StimulusPool of win (made on the first call; it lives as long as the window).'''
+    pool = _pools.get(win)
+    if pool is None:
+        pool = _pools[win] = StimulusPool(win, factory, maxSize)
+    return pool
+
+
+def benchmark(trials=300, repeats=5, constructionS=0.0002):
+    '''Per-trial cost (microseconds) of a feedback stimulus constructed on every trial vs taken from the pool,
+    with a simulated stimulus whose construction takes constructionS seconds (GL resources, font texture).'''
+
+    class Window(object):
+        pass
+
+    class SimulatedStim(object):
+        def __init__(self, win, **kwargs):
+            end = time.time() + constructionS
+            while time.time() < end:
+                pass
+            self.__dict__.update(kwargs)
+
+        def setText(self, text):
+            self.text = text
+
+        def setPos(self, pos):
+            self.pos = pos
+
+    win = Window()
+    feedbackTexts = ['correct', 'wrong', 'respond faster']
+    style = dict(units='norm', colorSpace='rgb', color=[1, 1, 1], font='Verdana', height=0.07, wrapWidth=1.4, pos=[0.0, 0.0])
+
+    def constructed():
+        for i in range(trials):
+            SimulatedStim(win=win, text='', **style).setText(feedbackTexts[i % 3])
+
+    def pooled():
+        pool = StimulusPool(win, SimulatedStim)
+        for i in range(trials):
+            pool.get('feedbackText1', text='', **style).setText(feedbackTexts[i % 3])
+        if pool.stats()['misses'] != 1:
+            raise AssertionError('the pool made more than one feedback stimulus')
+
+    return dict((name, min(timeit.repeat(function, number=1, repeat=repeats)) / trials * 1e6)
+                for name, function in [('constructed', constructed), ('StimulusPool', pooled)])
+
+
+if __name__ == '__main__':
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    for name, perTrial in sorted(benchmark(trials).items()):
+        print('{:<16} {:8.1f} us per trial ({} trials)'.format(name, perTrial, trials))
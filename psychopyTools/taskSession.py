@@ -0,0 +1,141 @@
+'''Tasks set up once and run many times, e.g., the effortful task embedded in each trial of a choice block.
+
+runEffortRewardChoiceBlock ran a whole runStroopBlock() after every choice, runSwitchTrainingBlock a whole
+runShiftingLetterNumberBlock(trials=10) and runUpdateTrainingBlock a whole runMentalMathBlock(trials=1): each
+call built its trial table one column at a time, created the task's 6-12 TextStims and TrialTask again,
+rewrote the backup csv and left the caller to work out accuracy and rt from the dataframe it returned. A
+TaskSession creates the TrialTask (with its stimuli) once, on its first run, and keeps it for every block
+and embedded run of the task:
+
+    stroop = TaskSession(blockRunner, setupStroopTask, generateStroopTrials, filename, dataStroopAll, filenamebackup, taskName)
+    trialsDf = stroop.run(stroop.generate(90, congruentTrials=60), params, feedback=True) # a block (runStroopBlock)
+    ...
+    summary = stroop.runTrials(effort, {'blockType': overallTrialNum, 'incongruentTrials': effort}, pauseAfterMissingNTrials=3)
+    trials[i, 'accEffortTask'], trials[i, 'rtEffortTask'] = summary.acc, summary.rt
+    ...
+    stroop.close() # end of the choice block: write the backup csv
+
+params are passed to generate(n, **params) and to the task's configure(**params) (they become attributes of
+the TrialTask, e.g., self.rewardSchedule, self.blockType); the other keyword arguments go to BlockRunner.run().
+generate() functions can build the table in one go with trialTable(n, columns).
+
+Run as a script to compare the cost of building a trial table one column at a time with trialTable():
+    python taskSession.py [trials]
+'''
+
+from __future__ import print_function
+import sys
+import timeit
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+
+def trialTable(n, columns):
+    '''Dataframe of n trials with columns ((name, value) pairs, in order; value: the same for every trial or a list of n values), built in one go.'''
+    return pd.DataFrame(OrderedDict(columns), index=np.arange(n))
+
+
+def _mean(trialsDf, column):
+    '''Mean of column leaving out NaN (NaN if there are no values).'''
+    values = pd.to_numeric(trialsDf[column], errors='coerce').values
+    values = values[~np.isnan(values)]
+    return values.mean() if values.size else np.nan
+
+
+class TrialsSummary(object):
+    '''Outcome of TaskSession.runTrials().
+
+    trialsDf: results (None if the run timed out or was skipped)
+    trials: no. of trials run
+    acc, rt: mean accuracy and rt (NaN if the run timed out or was skipped, or no trial was scored)
+    '''
+
+    def __init__(self, trialsDf):
+        self.trialsDf = trialsDf
+        self.trials = 0 if trialsDf is None else trialsDf.shape[0]
+        if trialsDf is None or trialsDf['acc'].isnull().all():
+            self.acc = self.rt = np.nan
+        else:
+            self.acc = _mean(trialsDf, 'acc')
+            self.rt = _mean(trialsDf, 'rt')
+
+
+class TaskSession(object):
+    '''A task's TrialTask and stimuli, set up once and run one block (or a few embedded trials) at a time.
+
+    runner: the script's BlockRunner
+    setup: setup() -> the TrialTask, with its stimuli (called before the first run)
+    generate: generate(n, **params) -> trialsDf of n trials
+    filename, journal, backupFilename: csv file of the task, its BackupJournal and -backup.csv file
+    taskName: name the trials are published to the runner's metrics under
+    '''
+
+    def __init__(self, runner, setup, generate, filename, journal, backupFilename, taskName=None):
+        self.runner = runner
+        self.setup = setup
+        self.generate = generate
+        self.filename = filename
+        self.journal = journal
+        self.backupFilename = backupFilename
+        self.taskName = taskName if taskName is not None else filename
+        self.task = None
+        self.runs = 0
+
+    def setUp(self):
+        '''The TrialTask (set up on the first call).'''
+        if self.task is None:
+            self.task = self.setup()
+        return self.task
+
+    def run(self, trialsDf, params=None, blockMaxTimeSeconds=None, experimentMaxTimeSeconds=None, compact=True, **runOptions):
+        '''Run trialsDf as a block: params go to the task's configure(), runOptions (saveData, feedback, titrate, ...) to
+        BlockRunner.run(). Return the results (None if the block timed out or was skipped); compact: write the backup csv after the block.'''
+        params = params or {}
+        task = self.setUp()
+        task.configure(**params)
+        self.journal.open(self.backupFilename) # no-op unless the journal was used for another task in between
+        self.runs += 1
+        trialsDf = self.runner.run(task, trialsDf, self.filename, self.journal, blockType=params.get('blockType', ''), taskName=self.taskName,
+                                   blockMaxTimeSeconds=blockMaxTimeSeconds, experimentMaxTimeSeconds=experimentMaxTimeSeconds, **runOptions)
+        if trialsDf is not None and compact:
+            self.journal.compact() # write all trials journalled so far to the backup file
+        return trialsDf
+
+    def runTrials(self, n, params=None, **runOptions):
+        '''Run n trials generated with params as an embedded block; return their TrialsSummary.
+
+        The trials are saved and journalled as usual, but the backup csv isn't rewritten after every run (close() does it).'''
+        params = params or {}
+        return TrialsSummary(self.run(self.generate(n, **params), params, compact=False, **runOptions))
+
+    def close(self):
+        '''Write all trials journalled so far to the backup file (e.g., at the end of the block the task is embedded in).'''
+        self.journal.compact()
+
+
+def benchmark(trials=10, repeats=200):
+    '''Cost (microseconds) of building a table of trials with 30 columns one column at a time and with trialTable().'''
+    values = [('column{}'.format(c), c if c % 3 else 'text') for c in range(28)]
+
+    def byColumn():
+        trialsDf = pd.DataFrame(index=np.arange(trials))
+        for name, value in values:
+            trialsDf[name] = value
+        trialsDf['trialNo'] = range(1, trials + 1)
+        trialsDf['resp'] = None
+        return trialsDf
+
+    def inOneGo():
+        return trialTable(trials, values + [('trialNo', list(range(1, trials + 1))), ('resp', None)])
+
+    if not byColumn().equals(inOneGo()):
+        raise AssertionError('trialTable() differs from the table built one column at a time')
+    return dict((name, min(timeit.repeat(function, number=1, repeat=repeats)) * 1e6)
+                for name, function in [('by column', byColumn), ('trialTable', inOneGo)])
+
+
+if __name__ == '__main__':
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for name, cost in sorted(benchmark(trials).items()):
+        print('{:<16} {:8.1f} us per table ({} trials)'.format(name, cost, trials))
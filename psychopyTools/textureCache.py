@@ -0,0 +1,130 @@
+'''Text stimuli of a closed set of strings and colours, each rendered once when the task is set up.
+
+The Stroop task set the word and ink colour of stroopStimulus (setText, setColor), the mental math task
+the text of testDigit for every digit of the stream and the shifting task the letter/number pair of
+letternumberStimulus (and its colour), so the text was laid out and rasterised again at (or just before)
+stimulus onset. The sets are small and known in advance: 9 Stroop word/colour combinations, the digits
+0-9 and the 48 letter/number pairs (in 2 cue colours). A TextureCache makes one stimulus per combination
+when the task is set up, with its text already rendered to a texture; at onset the trial picks the ready
+stimulus and drawing it is a textured quad, whatever the text:
+
+    stroopWords = TextureCache(lambda word, colour: visual.TextStim(win=win, text=word, color=colour, height=0.14, ...),
+                               zip(stroopCombi['word'], stroopCombi['colour']))
+    ...
+    self.stroopStimulus = stroopWords.get(thisTrial['word'], thisTrial['colour']) # prepare()
+    self.stroopStimulus.setAutoDraw(True) # showStimulus()
+
+A combination that wasn't rendered up front is made on first use (counted in stats() as a miss).
+
+Run as a script to compare the onset cost of setting the text and colour of one stimulus with picking a
+cached one (simulated stimuli; rendering set to take renderS seconds):
+    python textureCache.py [trials]
+'''
+
+from __future__ import print_function
+import sys
+import time
+import timeit
+from collections import OrderedDict
+
+
+def _key(text, colour):
+    '''(text, colour) as a dict key (colours given as lists as tuples).'''
+    return (text, tuple(colour) if isinstance(colour, list) else colour)
+
+
+class TextureCache(object):
+    '''One stimulus per (text, colour), made by factory(text, colour).
+
+    factory: factory(text, colour) -> stimulus (e.g., a TextStim with the task's font, height and position)
+    combinations: (text, colour) pairs to render now (e.g., when the task is set up)
+    '''
+
+    def __init__(self, factory, combinations=()):
+        self.factory = factory
+        self.stimuli = OrderedDict() # (text, colour) -> stimulus
+        self.hits = 0
+        self.misses = 0
+        self.render(combinations)
+
+    def render(self, combinations):
+        '''Make the stimuli of combinations ((text, colour) pairs) not made yet.'''
+        for text, colour in combinations:
+            key = _key(text, colour)
+            if key not in self.stimuli:
+                self.stimuli[key] = self.factory(text, colour)
+
+    def get(self, text, colour=None):
+        '''Stimulus showing text in colour (made now if it wasn't rendered up front).'''
+        key = _key(text, colour)
+        stimulus = self.stimuli.get(key)
+        if stimulus is None:
+            self.misses += 1
+            stimulus = self.stimuli[key] = self.factory(text, colour)
+        else:
+            self.hits += 1
+        return stimulus
+
+    def stats(self):
+        '''Hits, misses (combinations made on first use) and no. of stimuli rendered.'''
+        return OrderedDict([('hits', self.hits), ('misses', self.misses), ('size', len(self.stimuli))])
+
+    def __contains__(self, combination):
+        return _key(*combination) in self.stimuli
+
+    def __len__(self):
+        return len(self.stimuli)
+
+
+def benchmark(trials=300, repeats=5, renderS=0.0003):
+    '''Onset cost (microseconds per trial) of Stroop stimuli: setText/setColor of one stimulus vs TextureCache.get(),
+    with simulated stimuli whose text is rendered in renderS seconds when the text or colour changes.'''
+
+    class SimulatedStim(object):
+        def __init__(self, text='', color='white'):
+            self.text, self.color = text, color
+            self.render()
+
+        def render(self):
+            end = time.time() + renderS
+            while time.time() < end:
+                pass
+
+        def setText(self, text):
+            if text != self.text:
+                self.text = text
+                self.render()
+
+        def setColor(self, color):
+            if color != self.color:
+                self.color = color
+                self.render()
+
+        def draw(self):
+            return self.text, self.color
+
+    colours = ['red', 'green', 'yellow']
+    combinations = [(w, c) for c in colours for w in colours]
+    stream = [combinations[(i * 7) % len(combinations)] for i in range(trials)] # word and colour change from trial to trial
+
+    def setTextColour():
+        stroopStimulus = SimulatedStim()
+        for word, colour in stream:
+            stroopStimulus.setText(word)
+            stroopStimulus.setColor(colour)
+            stroopStimulus.draw()
+
+    cache = TextureCache(lambda word, colour: SimulatedStim(word, colour), combinations) # rendered at setup, not timed
+
+    def cached():
+        for word, colour in stream:
+            cache.get(word, colour).draw()
+
+    return dict((name, min(timeit.repeat(function, number=1, repeat=repeats)) / trials * 1e6)
+                for name, function in [('setText/setColor', setTextColour), ('TextureCache', cached)])
+
+
+if __name__ == '__main__':
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    for name, perTrial in sorted(benchmark(trials).items()):
+        print('{:<16} {:8.1f} us per trial ({} trials)'.format(name, perTrial, trials))
@@ -0,0 +1,166 @@
+'''Typed NumPy columns for the results a trial loop writes, instead of trialsDf.loc[i, column] = value.
+
+Each trialsDf.loc[i, 'rt'] = ... in the trial and frame loops cost tens to hundreds of microseconds, with
+10-20 of them per trial (some right after a keypress, before the screen is cleared). A TrialBuffer copies
+the generated trialsDf into one NumPy array per column once, before the loop; reads and writes are then
+plain array accesses. Columns are upcast the way pandas would upcast them (int -> float when a NaN is
+written, -> object when a string or None is written, new columns are created on first write), so the
+rows and the final dataframe have the same columns and dtypes trialsDf would have had:
+    trials = TrialBuffer(trialsDf)
+    for i, thisTrial in trialsDf.iterrows():
+        trials[i, 'rt'] = respClock.getTime()
+        ...
+        ledger.appendRows(trials.rows(i), filename) # TrialRows snapshot, turned into a dataframe by the writer thread
+    trialsDf = trials.dataFrame() # end of block
+
+SessionLedger, TrialWriter, BackupJournal, ColumnarStore and SessionCheckpoint accept TrialRows wherever
+they accept trialsDf[i:i+1].
+'''
+
+import numbers
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+
+def _fits(kind, value):
+    '''Whether value can be stored in an array of dtype kind without pandas upcasting the column.'''
+    if isinstance(value, (bool, np.bool_)):
+        return kind == 'b'
+    if kind in 'iu':
+        if isinstance(value, numbers.Integral):
+            return True
+        return isinstance(value, numbers.Real) and float(value).is_integer() # e.g., 1.0 stays an int
+    if kind == 'f':
+        return value is None or isinstance(value, numbers.Real) # None is stored as NaN
+    return False
+
+
+def _frame(columns, arrays, index):
+    '''Dataframe of column arrays (object arrays stay object columns, as they were in trialsDf).'''
+    return pd.DataFrame(OrderedDict((c, pd.Series(a, index=index, dtype=a.dtype, copy=False)) for c, a in zip(columns, arrays)), index=index, columns=columns)
+
+
+def _upcast(array, value):
+    '''array converted to the dtype pandas would give its column after value is written to it.'''
+    if array.dtype.kind in 'iu' and (value is None or (isinstance(value, numbers.Real) and not isinstance(value, (bool, np.bool_)))):
+        return array.astype(np.float64)
+    return array.astype(object)
+
+
+class TrialRows(object):
+    '''Snapshot of one or more rows of a TrialBuffer (what trialsDf[i:i+1] used to be).'''
+
+    __slots__ = ('columns', 'values', 'index')
+
+    def __init__(self, columns, values, index):
+        self.columns = columns # column names
+        self.values = values # one array per column
+        self.index = index # row labels
+
+    def __getstate__(self):
+        return (self.columns, self.values, self.index)
+
+    def __setstate__(self, state):
+        self.columns, self.values, self.index = state
+
+    @property
+    def shape(self):
+        return (len(self.index), len(self.columns))
+
+    def column(self, name):
+        '''Values of column name (KeyError if there is no such column).'''
+        try:
+            return self.values[self.columns.index(name)]
+        except ValueError:
+            raise KeyError(name)
+
+    def records(self):
+        '''Rows as tuples of values, in column order.'''
+        return list(zip(*self.values))
+
+    def toDataFrame(self):
+        '''The rows as a dataframe (same columns, dtypes and index as the slice of trialsDf would have).'''
+        return _frame(self.columns, self.values, self.index)
+
+
+class TrialBuffer(object):
+    '''Results of one block's trials in typed NumPy columns.
+
+    trialsDf: the block's generated trials (row labels as used by trialsDf.iterrows())
+    '''
+
+    def __init__(self, trialsDf):
+        self.columns = list(trialsDf.columns)
+        self.arrays = {}
+        for column in self.columns:
+            values = trialsDf[column]
+            if isinstance(values, pd.DataFrame):
+                raise ValueError('duplicate column {}'.format(column))
+            array = values.values
+            if isinstance(array, np.ndarray) and array.dtype.kind in 'biufO':
+                self.arrays[column] = array.copy()
+            else: # e.g., pandas string columns
+                self.arrays[column] = np.array(array, dtype=object)
+        self.index = trialsDf.index
+        self.n = trialsDf.shape[0]
+        if (self.index == np.arange(self.n)).all():
+            self.positions = None # labels are positions
+        else:
+            self.positions = dict((label, position) for position, label in enumerate(self.index))
+
+    def _position(self, i):
+        if self.positions is not None:
+            return self.positions[i]
+        if not 0 <= i < self.n: # like trialsDf.loc[-1, ...], instead of wrapping around
+            raise KeyError(i)
+        return i
+
+    def __getitem__(self, key):
+        i, column = key
+        return self.arrays[column][self._position(i)]
+
+    def __setitem__(self, key, value):
+        i, column = key
+        position = self._position(i)
+        if isinstance(value, np.ndarray) and value.size == 1: # e.g., np.random.normal(size=1): stored as a scalar, like .loc does
+            value = value.reshape(-1)[0]
+        array = self.arrays.get(column)
+        if array is None: # new column: NaN in every other row, like pandas
+            if isinstance(value, numbers.Real) and not isinstance(value, (bool, np.bool_)):
+                array = np.full(self.n, np.nan)
+            else:
+                array = np.empty(self.n, dtype=object)
+                array[:] = np.nan
+            self.arrays[column] = array
+            self.columns.append(column)
+        elif array.dtype.kind != 'O' and not _fits(array.dtype.kind, value):
+            array = _upcast(array, value)
+            self.arrays[column] = array
+        array[position] = np.nan if value is None and array.dtype.kind == 'f' else value
+
+    def fill(self, column, value):
+        '''Set column to value in every row (trialsDf.loc[:, column] = value).'''
+        for i in self.index:
+            self[i, column] = value
+
+    def column(self, name, start=None, stop=None):
+        '''Values of column name in rows start to stop - 1, clipped to the block (trialsDf.loc[start:stop - 1, name]).'''
+        if self.positions is not None: # row labels aren't positions: slice by label
+            return self.arrays[name][self.index.slice_indexer(start, None if stop is None else stop - 1)]
+        start = 0 if start is None else min(max(start, 0), self.n)
+        stop = self.n if stop is None else min(max(stop, 0), self.n)
+        return self.arrays[name][start:stop]
+
+    def rows(self, i, stop=None):
+        '''Snapshot of rows i to stop - 1 (default: row i only) as TrialRows.'''
+        start = self._position(i)
+        stop = start + 1 if stop is None else min(max(stop, start), self.n)
+        return TrialRows(list(self.columns), [self.arrays[c][start:stop].copy() for c in self.columns], self.index[start:stop])
+
+    def dataFrame(self):
+        '''All trials as a dataframe (what trialsDf would be after the loop).'''
+        return _frame(self.columns, [self.arrays[c] for c in self.columns], self.index)
+
+    def __len__(self):
+        return self.n
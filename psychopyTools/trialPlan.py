@@ -0,0 +1,173 @@
+'''Read-only, array-backed plan of a block's trials, compiled once before the trial loop.
+
+The trial loops used to iterate with trialsDf.iterrows(), which builds a pandas Series for every row, and
+then look up thisTrial['colour'], thisTrial['correctKey'], thisTrial['TTLStim'], ... in that Series. A
+TrialPlan copies the generated trials into one read-only NumPy array per column when the block starts, and
+resolves each trial's response deadline in frames (targetFrames, else the first of the fallbacks that is a
+number). Iterating over the plan yields the same (row label, trial) pairs, where a trial is a small
+immutable record, so the loop body doesn't change:
+    plan = TrialPlan(trialsDf, deadlineFrames=[rtMaxFrames, info.get('targetFrames'), 180])
+    for i, thisTrial in plan:
+        stroopStimulus.setText(thisTrial['word'])
+        ... thisTrial['deadlineFrames'] ...
+
+extra adds per-trial values that are worked out in advance (e.g., the stimulus positions of every visual
+search trial), as arrays whose first dimension is the no. of trials.
+
+Run as a script to compare the per-trial Python overhead of iterrows/.loc with TrialPlan/TrialBuffer:
+    python trialPlan.py [trials]
+'''
+
+from __future__ import print_function
+import sys
+import timeit
+import numpy as np
+import pandas as pd
+
+
+def _frames(value):
+    '''value as a whole no. of frames (None if it isn't a number, e.g., None or NaN).'''
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+class PlanTrial(object):
+    '''One trial of a TrialPlan; thisTrial['column'] reads the plan's arrays (there is no way to write).'''
+
+    __slots__ = ('plan', 'position')
+
+    def __init__(self, plan, position):
+        self.plan = plan
+        self.position = position
+
+    def __getitem__(self, name):
+        return self.plan.arrays[name][self.position]
+
+    def __contains__(self, name):
+        return name in self.plan.arrays
+
+    def get(self, name, default=None):
+        array = self.plan.arrays.get(name)
+        return default if array is None else array[self.position]
+
+
+class TrialPlan(object):
+    '''Everything the trial loop reads about the planned trials, in read-only arrays.
+
+    trialsDf: the block's generated trials
+    deadlineFrames: fallback response deadlines (frames) for trials without a targetFrames value; the first one that is a number is used
+    extra: dict of additional per-trial values (name -> sequence or array with one entry per trial)
+    '''
+
+    def __init__(self, trialsDf, deadlineFrames=(), extra=None):
+        self.index = list(trialsDf.index)
+        self.n = len(self.index)
+        self.arrays = {}
+        for column in trialsDf.columns:
+            array = trialsDf[column].values
+            if isinstance(array, np.ndarray) and array.dtype.kind in 'biufO':
+                array = array.copy()
+            else: # e.g., pandas string columns
+                array = np.array(array, dtype=object)
+            self.arrays[column] = self._readOnly(array)
+
+        fallback = None
+        for candidate in deadlineFrames:
+            fallback = _frames(candidate)
+            if fallback is not None:
+                break
+        deadlines = [_frames(f) for f in self.arrays.get('targetFrames', [None] * self.n)]
+        self.arrays['deadlineFrames'] = self._readOnly(np.array([fallback if f is None else f for f in deadlines], dtype=object))
+
+        for name, values in (extra or {}).items():
+            if name in self.arrays:
+                raise ValueError('extra {} is already a column of trialsDf'.format(name))
+            values = np.array(values)
+            if values.shape[0] != self.n:
+                raise ValueError('extra {} has {} entries for {} trials'.format(name, values.shape[0], self.n))
+            self.arrays[name] = self._readOnly(values)
+
+        self.trials = [PlanTrial(self, position) for position in range(self.n)]
+        self.positions = dict((label, position) for position, label in enumerate(self.index))
+
+    @staticmethod
+    def _readOnly(array):
+        array.flags.writeable = False
+        return array
+
+    def __iter__(self):
+        return iter(zip(self.index, self.trials))
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, label):
+        '''Trial with row label label.'''
+        return self.trials[self.positions[label]]
+
+    def column(self, name):
+        '''Read-only array of column name.'''
+        return self.arrays[name]
+
+
+def benchmark(trials=200, repeats=5):
+    '''Per-trial Python overhead (microseconds) of iterating over a stroop-like block and reading/writing
+    its fields, with iterrows/.loc versus TrialPlan/TrialBuffer (no drawing, no waiting).'''
+    try:
+        from psychopyTools.trialBuffer import TrialBuffer
+    except ImportError: # run from inside psychopyTools
+        from trialBuffer import TrialBuffer
+
+    colours = np.array(['red', 'green', 'yellow'])
+    trialsDf = pd.DataFrame({'participant': 1, 'word': colours[np.random.randint(0, 3, trials)],
+                             'colour': colours[np.random.randint(0, 3, trials)], 'TTLStim': np.random.randint(1, 10, trials)})
+    trialsDf['correctKey'] = trialsDf['colour'].str[0]
+    for column, value in [('targetFrames', 90), ('resp', None), ('rt', np.nan), ('acc', 0), ('responseTTL', np.nan),
+                          ('overallTrialNum', 0), ('elapsedTime', np.nan), ('endTime', ''), ('iti', np.nan)]:
+        trialsDf[column] = value
+
+    def before():
+        df = trialsDf.copy()
+        for i, thisTrial in df.iterrows():
+            df.loc[i, 'overallTrialNum'] = i + 1
+            deadline = int(df.loc[i, 'targetFrames'])
+            text, colour, ttl = thisTrial['word'], thisTrial['colour'], int(thisTrial['TTLStim'])
+            if df.loc[i, 'resp'] is None:
+                df.loc[i, 'rt'] = 0.5
+                df.loc[i, 'resp'] = thisTrial['correctKey']
+                df.loc[i, 'responseTTL'] = 15
+                df.loc[i, 'acc'] = 1
+            df.loc[i, 'elapsedTime'] = float(i)
+            df.loc[i, 'endTime'] = 'now'
+            df.loc[i, 'iti'] = 0.5
+            df[i:i+1]
+
+    def after():
+        plan = TrialPlan(trialsDf, deadlineFrames=[180])
+        buffer = TrialBuffer(trialsDf)
+        for i, thisTrial in plan:
+            buffer[i, 'overallTrialNum'] = i + 1
+            deadline = thisTrial['deadlineFrames']
+            text, colour, ttl = thisTrial['word'], thisTrial['colour'], int(thisTrial['TTLStim'])
+            if buffer[i, 'resp'] is None:
+                buffer[i, 'rt'] = 0.5
+                buffer[i, 'resp'] = thisTrial['correctKey']
+                buffer[i, 'responseTTL'] = 15
+                buffer[i, 'acc'] = 1
+            buffer[i, 'elapsedTime'] = float(i)
+            buffer[i, 'endTime'] = 'now'
+            buffer[i, 'iti'] = 0.5
+            buffer.rows(i)
+
+    results = {}
+    for name, function in [('iterrows + .loc', before), ('TrialPlan + TrialBuffer', after)]:
+        results[name] = min(timeit.repeat(function, number=1, repeat=repeats)) / trials * 1e6
+    return results
+
+
+if __name__ == '__main__':
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for name, microseconds in benchmark(trials).items():
+        print('{:<25} {:8.1f} us per trial'.format(name, microseconds))
@@ -0,0 +1,138 @@
+'''Write trial rows to csv files on a background thread.
+
+ledger.appendRows(trialsDf[i:i+1], filename) used to run to_csv synchronously between the response and
+ISI.complete(), so a slow disk could overrun the inter-trial interval. With a TrialWriter the ledger
+only queues a copy of the rows; a dedicated thread formats them and appends them to the file:
+    ledger = SessionLedger(writer=TrialWriter(flush='trial', fsync='block'))
+
+flush/fsync policies ('trial', 'block' or 'quit'; fsync can also be None):
+    'trial': after every queued write
+    'block': when the first row of the next block reaches the file, and at close()
+    'quit': only at close()
+close() (called by ledger.close() on the backslash quit path, and automatically when the interpreter
+exits, e.g., after core.quit()) waits until every queued row has been written.
+'''
+
+import os
+import io
+import sys
+import atexit
+import threading
+try:
+    import queue # python 3
+except ImportError:
+    import Queue as queue # python 2
+
+POLICIES = ('trial', 'block', 'quit')
+
+
+class TrialWriter(object):
+    '''Bounded queue of rows plus the thread that writes them.
+
+    maxQueue: max no. of queued writes; if the disk falls this far behind, write() blocks until there is room
+    flush: when file buffers are flushed to the operating system (see module docstring)
+    fsync: when flushed data is forced onto the disk (None: never, leave it to the operating system)
+    '''
+
+    def __init__(self, maxQueue=1000, flush='trial', fsync='block'):
+        if flush not in POLICIES or (fsync is not None and fsync not in POLICIES):
+            raise ValueError("flush and fsync have to be one of {} (fsync can also be None)".format(POLICIES))
+        self.flushPolicy = flush
+        self.fsyncPolicy = fsync
+        self.queue = queue.Queue(maxsize=maxQueue)
+        self.files = {} # filename -> open file
+        self.errors = [] # exceptions raised on the writer thread (the thread keeps going)
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name='TrialWriter')
+        self.thread.daemon = True
+        self.thread.start()
+        atexit.register(self.close)
+
+    def write(self, filename, df, header=False):
+        '''Queue rows in df (dataframe or TrialRows) to be appended to filename (pass a copy if df is modified afterwards).'''
+        if self.closed:
+            raise ValueError('TrialWriter is closed')
+        self.queue.put(('write', filename, df, header))
+
+    def after(self, filename, function, *args):
+        '''Call function(*args) on the writer thread once the rows queued for filename before it are written and flushed
+        (e.g., a checkpoint record that must not get ahead of the csv file).'''
+        if self.closed:
+            raise ValueError('TrialWriter is closed')
+        self.queue.put(('after', filename, (function, args), None))
+
+    def endBlock(self, filename=None):
+        '''Apply the 'block' flush/fsync policy to filename (all files if None).'''
+        self.queue.put(('endBlock', filename, None, None))
+
+    def flush(self):
+        '''Wait until every queued row has been written and flushed (e.g., before reading a file back).'''
+        if self.closed:
+            return
+        self.queue.put(('flush', None, None, None))
+        self.queue.join()
+
+    def close(self):
+        '''Drain the queue, flush and fsync (unless fsync is None) every file, and stop the thread.'''
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(('close', None, None, None))
+        self.thread.join()
+
+    def _run(self):
+        while True:
+            action, filename, df, header = self.queue.get()
+            try:
+                if action == 'write':
+                    self._write(filename, df, header)
+                elif action == 'after':
+                    if filename in self.files:
+                        self.files[filename].flush()
+                    df[0](*df[1])
+                elif action == 'endBlock':
+                    self._sync(filename, 'block')
+                elif action == 'flush':
+                    self._sync(None, 'flush')
+                elif action == 'close':
+                    self._sync(None, 'quit')
+                    for f in self.files.values():
+                        f.close()
+                    self.files = {}
+                    return
+            except Exception as e:
+                self.errors.append(e)
+                sys.stderr.write('TrialWriter: {}\n'.format(e))
+            finally:
+                self.queue.task_done()
+
+    def _write(self, filename, df, header):
+        if hasattr(df, 'toDataFrame'): # TrialRows: build the dataframe here rather than in the trial loop
+            df = df.toDataFrame()
+        text = df.to_csv(header=header, index=False)
+        if not isinstance(text, type(u'')): # python 2 returns a byte string
+            text = text.decode('utf-8')
+        f = self.files.get(filename)
+        if f is None:
+            f = io.open(filename, 'a', newline='', encoding='utf-8')
+            self.files[filename] = f
+        f.write(text)
+        self._sync(filename, 'trial')
+
+    def _sync(self, filename, event):
+        '''Flush/fsync filename (all files if None) if the policies ask for it on event.'''
+        if event == 'flush':
+            doFlush, doFsync = True, False
+        else:
+            doFlush = POLICIES.index(self.flushPolicy) <= POLICIES.index(event)
+            doFsync = self.fsyncPolicy is not None and POLICIES.index(self.fsyncPolicy) <= POLICIES.index(event)
+        if not (doFlush or doFsync):
+            return
+        if filename is None:
+            files = list(self.files.values())
+        else:
+            files = [self.files[filename]] if filename in self.files else []
+        for f in files:
+            f.flush()
+            if doFsync:
+                os.fsync(f.fileno())
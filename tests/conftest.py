@@ -0,0 +1,106 @@
+'''Headless stand-ins for the psychopy objects the psychopyTools classes are given (window, clocks, ITI period).'''
+
+import os
+import sys
+import pytest
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # repository root, as the scripts do
+
+from psychopyTools.keyboardInput import KeyboardInput, SimulatedBackend, SimulatedWindow
+from psychopyTools.sessionData import SessionLedger
+from psychopyTools.sessionClock import SessionClock
+from psychopyTools.blockRunner import BlockRunner, TrialTask
+from psychopyTools.itiScheduler import ITIScheduler
+from psychopyTools.backupJournal import BackupJournal
+from psychopyTools.taskSession import TaskSession, trialTable
+
+
+class SimulatedClock(object):
+    '''core.Clock stand-in on a SimulatedWindow's time.'''
+
+    def __init__(self, win):
+        self.win = win
+        self.t0 = win.time
+
+    def getTime(self):
+        return self.win.time - self.t0
+
+    def reset(self, newT=0.0):
+        self.t0 = self.win.time + newT # as core.Clock: the time is -newT afterwards
+
+
+class SimulatedPeriod(object):
+    '''core.StaticPeriod stand-in: complete() moves the simulated time to the end of the period.'''
+
+    def __init__(self, win):
+        self.win = win
+        self.end = None
+
+    def start(self, duration):
+        self.end = self.win.time + duration
+
+    def complete(self):
+        self.win.time = max(self.win.time, self.end)
+        return 1
+
+
+class KeyTask(TrialTask):
+    '''Task with two response keys and nothing to draw; records the hooks called.'''
+
+    responseKeys = ['f', 'j']
+
+    def __init__(self):
+        self.prepared = []
+
+    def prepare(self, i, thisTrial, trials):
+        self.prepared.append(i)
+
+
+class Quit(Exception):
+    pass
+
+
+def quit():
+    raise Quit()
+
+
+class SimulatedSession(object):
+    '''A script's session objects on a SimulatedWindow: ledger, clocks, ITI scheduler and BlockRunner.
+
+    responses: one (key, rt) per response window (None: no response)
+    '''
+
+    def __init__(self, directory, responses, refreshRate=60.0, itiDurations=(0.5,), ledger=None, **runnerOptions):
+        self.directory = directory
+        self.win = SimulatedWindow(refreshRate)
+        self.globalClock = SimulatedClock(self.win)
+        self.ledger = ledger if ledger is not None else SessionLedger()
+        self.sessionClock = SessionClock(self.globalClock, self.ledger)
+        self.keyboard = KeyboardInput(SimulatedBackend(responses, self.win.getTime))
+        ISI = ITIScheduler(SimulatedPeriod(self.win), self.globalClock)
+        self.runner = BlockRunner(self.win, None, quit, self.ledger, self.globalClock, ISI, list(itiDurations), lambda: SimulatedClock(self.win),
+                                  keyboard=self.keyboard, sessionClock=self.sessionClock, **runnerOptions)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def taskSession(self, taskName='keyTask', setup=KeyTask, generate=None):
+        '''TaskSession of a task saving to <taskName>.csv in the session's directory.'''
+        return TaskSession(self.runner, setup, generate or generateTrials, self.path(taskName + '.csv'), BackupJournal(),
+                           self.path(taskName + '-backup.csv'), taskName)
+
+
+def generateTrials(n, targetFrames=60, **params):
+    '''n trials of KeyTask ('f' correct on odd trials, 'j' on even ones) with the result columns the runners write.'''
+    return trialTable(n, [('participant', 1), ('trialNo', list(range(1, n + 1))), ('blockNumber', 0), ('correctKey', ['f' if t % 2 else 'j' for t in range(1, n + 1)]),
+                          ('targetFrames', targetFrames), ('resp', None), ('rt', np.nan), ('acc', 0), ('responseTTL', np.nan), ('overallTrialNum', 0),
+                          ('elapsedTime', np.nan), ('endTime', ''), ('iti', np.nan)])
+
+
+@pytest.fixture
+def simulatedSession(tmpdir):
+    '''Factory of SimulatedSessions writing to a temporary directory.'''
+    def make(responses, **kwargs):
+        return SimulatedSession(str(tmpdir), responses, **kwargs)
+    return make
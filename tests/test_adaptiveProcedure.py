@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+from psychopyTools.adaptiveProcedure import AccuracyRule, Staircase, Quest, SessionProcedures, benchmark
+from psychopyTools.trialBuffer import TrialBuffer
+
+
+def runOneTrialBlock(sessionProcedures, acc, default, planned=60):
+    '''A block of one trial with accuracy acc, titrated with sessionProcedures; the level the trial ran at.'''
+    trials = TrialBuffer(pd.DataFrame({'targetFrames': [planned], 'acc': [acc]}))
+    for procedure in sessionProcedures.forBlock('mentalMath', True, default):
+        procedure.apply(0, trials)
+        procedure.update(acc)
+    return trials[0, 'targetFrames']
+
+
+def testStaircaseCarriesOverOneTrialBlocks():
+    # down after a correct response, up after two errors in a row, even if each trial is a block of its own
+    sessionProcedures = SessionProcedures()
+    default = lambda: [Staircase('targetFrames', 6, nDown=1, nUp=2, minimum=24)]
+    levels = [runOneTrialBlock(sessionProcedures, acc, default) for acc in [0, 0, 1, 1, 0]]
+    assert levels == [60, 60, 66, 60, 54]
+
+
+def testAccuracyRuleKeepsLevelButStartsAccuracyOverEachBlock():
+    sessionProcedures = SessionProcedures()
+    default = lambda: [AccuracyRule('targetFrames', 3, 1, 6)]
+    assert runOneTrialBlock(sessionProcedures, 0, default) == 60 # block accuracy 0: up by 6
+    assert runOneTrialBlock(sessionProcedures, 1, default) == 66 # block accuracy 1 (not 0.5 over both blocks): down by 3
+    assert runOneTrialBlock(sessionProcedures, 1, default) == 63
+
+
+def testProceduresArePerTask():
+    sessionProcedures = SessionProcedures()
+    default = lambda: [Staircase('targetFrames', 6, nDown=1)]
+    first = sessionProcedures.forBlock('mentalMath', True, default)
+    assert sessionProcedures.forBlock('mentalMath', True, default) is first
+    assert sessionProcedures.forBlock('effortRewardChoice', True, default) is not first
+    assert sessionProcedures.forBlock('mentalMath', False, default) == []
+    staircase = Staircase('coherence', 0.02)
+    assert sessionProcedures.forBlock('mentalMath', staircase, default) == [staircase]
+
+
+def testBlockRunnerCarriesLevelOver(simulatedSession):
+    # correct responses at block accuracy 1: the deadline goes down by 50 ms (3 frames) after each one-trial block
+    session = simulatedSession([('f', 0.2)] * 3)
+    task = session.taskSession()
+    levels = [task.run(task.generate(1), titrate=True)['targetFrames'].iloc[0] for block in range(3)]
+    assert levels == [60, 57, 54]
+
+
+def testAccuracyRuleMatchesListRule():
+    benchmark(trials=100, repeats=1) # raises if the levels differ
+
+
+def testStaircaseReversalsAndBounds():
+    staircase = Staircase('targetFrames', 10, nDown=1, nUp=1, minimum=20, maximum=40, start=30)
+    for acc in [1, 1, 1, 0, 0, 0]:
+        staircase.update(acc)
+    assert staircase.level == 40
+    assert staircase.reversals == 1
+    staircase.update(np.nan) # not scored: no step
+    assert staircase.level == 40
+
+
+def testQuestConvergesOnThreshold():
+    np.random.seed(0)
+    threshold = 0.3
+    quest = Quest('coherence', 0.01, 1.0, pThreshold=0.8, gamma=0.25, start=0.5)
+    quest.begin()
+    scale = quest.scale
+    for trial in range(300):
+        pCorrect = 0.25 + 0.74 * (1 - np.exp(-(quest.level / threshold) ** 3.5))
+        quest.update(int(np.random.rand() < pCorrect))
+    assert abs(quest.threshold()[0] - threshold) < 0.05
+    assert abs(quest.level - threshold * scale) < 0.05
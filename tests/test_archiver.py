@@ -0,0 +1,83 @@
+import os
+import zipfile
+from psychopyTools.archiver import BUNDLEPREFIX, moveFiles, archiveData, changedFiles, loadManifest, verifyBundle
+from psychopyTools.checkpoint import SessionCheckpoint
+from psychopyTools.sessionTimeline import SessionTimeline
+
+FINISHED = '007-2019-01-01-10-00-00'
+UNFINISHED = '008-2019-01-02-10-00-00'
+
+
+def write(directory, name, text='trialNo\n1\n'):
+    with open(os.path.join(directory, name), 'w') as f:
+        f.write(text)
+
+
+def session(directory, prefix, finished):
+    '''A session's outputs: csv, -incomplete csv, backup journal, columnar copy, state file.'''
+    for suffix in ['-stroop.csv', '-stroop-incomplete.csv', '-stroop-backup.csv', '-stroop-backup.jsonl', '-stroop.npz', '-stroop.json']:
+        write(directory, prefix + suffix)
+    timeline = SessionTimeline(os.path.join(directory, prefix + '-session.pkl'), {'participant': int(prefix[:3])})
+    if finished:
+        timeline.close()
+
+
+def testMoveDataFilesOfFinishedSessions(tmpdir):
+    source = str(tmpdir)
+    session(source, FINISHED, True)
+    session(source, UNFINISHED, False)
+    write(source, 'Script1.py', '')
+    moved = moveFiles(sourceDir=source)
+    assert sorted(moved) == sorted(f for f in os.listdir(os.path.join(source, 'Data')))
+    assert len(moved) == 7 and all(f.startswith(FINISHED) for f in moved) # every output, state file included
+    left = sorted(os.listdir(source))
+    assert len([f for f in left if f.startswith(UNFINISHED)]) == 7 # still there to resume
+    assert 'Script1.py' in left
+
+
+def testMoveParticipantFiles(tmpdir):
+    source = str(tmpdir)
+    write(source, '007-a.csv')
+    write(source, '007-b.txt')
+    write(source, '070-a.csv')
+    checkpoint = SessionCheckpoint(os.path.join(source, '007-2019-checkpoint.pkl'))
+    checkpoint.file.close() # unfinished: 007-2019-* stays
+    write(source, '007-2019-stroop.csv')
+    assert moveFiles(sourceDir=source, participant=7) == ['007-a.csv', '007-b.txt']
+    assert sorted(os.listdir(source)) == ['007-2019-checkpoint.pkl', '007-2019-stroop.csv', '070-a.csv', 'Data']
+
+
+def testOnlyNewOrChangedFilesAreBundled(tmpdir):
+    dataDir = str(tmpdir)
+    session(dataDir, FINISHED, True)
+    first = archiveData(dataDir, workers=2)
+    with zipfile.ZipFile(first) as z:
+        assert len(z.namelist()) == 7
+        assert z.read(FINISHED + '-stroop.csv') == b'trialNo\n1\n'
+    assert sorted(loadManifest(dataDir)) == sorted(z.namelist())
+
+    assert archiveData(dataDir) is None # nothing changed
+    os.utime(os.path.join(dataDir, FINISHED + '-stroop.csv'), (0, 0))
+    assert changedFiles(dataDir) == [] # touched but not changed (same checksum)
+    write(dataDir, FINISHED + '-stroop.csv', 'trialNo\n1\n2\n')
+    write(dataDir, FINISHED + '-flanker.csv')
+    second = archiveData(dataDir)
+    with zipfile.ZipFile(second) as z:
+        assert sorted(z.namelist()) == [FINISHED + '-flanker.csv', FINISHED + '-stroop.csv']
+    assert os.path.isfile(os.path.join(dataDir, 'Archive', os.path.basename(first))) # the earlier bundle
+    assert [f for f in os.listdir(dataDir) if f.startswith(BUNDLEPREFIX)] == [os.path.basename(second)]
+
+
+def testVerifyBundle(tmpdir):
+    dataDir = str(tmpdir)
+    write(dataDir, 'a.csv')
+    bundle = archiveData(dataDir)
+    entry = loadManifest(dataDir)['a.csv']
+    verifyBundle(bundle, {'a.csv': entry})
+    for expected in [{'a.csv': dict(entry, crc=entry['crc'] ^ 1)}, {'a.csv': dict(entry, size=entry['size'] + 1)}, {'b.csv': entry}]:
+        try:
+            verifyBundle(bundle, expected)
+        except IOError:
+            pass
+        else:
+            raise AssertionError('{} matched'.format(expected))
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+from psychopyTools.backupJournal import BackupJournal, journalFilename, recoverBackup
+
+
+def trial(t):
+    return pd.DataFrame({'trialNo': [t], 'resp': ['f' if t % 2 else None], 'rt': [0.25 * t if t % 3 else np.nan], 'acc': [t % 2]})
+
+
+def testCompactionRoundTrip(tmpdir):
+    filename = str(tmpdir.join('stroop-backup.csv'))
+    journal = BackupJournal(compactEvery=4)
+    journal.open(filename)
+    expected = pd.concat([trial(t) for t in range(1, 11)], ignore_index=True)
+    for t in range(1, 11):
+        journal.append(trial(t))
+    assert pd.read_csv(filename).shape[0] == 8 # compacted after 4 and 8 trials
+    journal.close()
+
+    saved = pd.read_csv(filename)
+    assert list(saved.columns) == list(expected.columns)
+    assert list(saved['trialNo']) == list(expected['trialNo'])
+    assert list(saved['resp'].fillna('')) == list(expected['resp'].fillna(''))
+    assert np.allclose(saved['rt'], expected['rt'], equal_nan=True)
+    assert journal.dataFrame().shape == expected.shape
+
+
+def testRecoverAfterCrashBetweenCompactions(tmpdir):
+    filename = str(tmpdir.join('stroop-backup.csv'))
+    journal = BackupJournal(compactEvery=None)
+    journal.open(filename)
+    for t in range(1, 6):
+        journal.append(trial(t))
+    with open(journalFilename(filename), 'a') as f:
+        f.write('{"trialNo": 6, "re') # crash mid-write
+    # no compact(): the backup csv was never written
+
+    recovered = recoverBackup(filename)
+    assert list(recovered['trialNo']) == [1, 2, 3, 4, 5]
+    assert list(pd.read_csv(filename)['trialNo']) == [1, 2, 3, 4, 5]
+
+    # the next run continues the journal without the partly written line
+    journal = BackupJournal()
+    journal.open(filename)
+    journal.append(trial(6))
+    journal.close()
+    assert list(pd.read_csv(filename)['trialNo']) == [1, 2, 3, 4, 5, 6]
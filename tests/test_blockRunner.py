@@ -0,0 +1,214 @@
+import numpy as np
+import pandas as pd
+from conftest import KeyTask, Quit, generateTrials
+from psychopyTools.checkpoint import SessionCheckpoint
+from psychopyTools.frameTiming import FrameTimer
+
+
+def responses(n, rt=0.3):
+    '''Correct responses to n KeyTask trials.'''
+    return [('f' if t % 2 else 'j', rt) for t in range(1, n + 1)]
+
+
+def testBlockEndToEnd(simulatedSession):
+    session = simulatedSession(responses(6))
+    task = session.taskSession()
+    trialsDf = task.run(task.generate(6))
+    session.ledger.close()
+
+    assert list(trialsDf['acc']) == [1] * 6
+    assert np.allclose(trialsDf['rt'].astype(float), 0.3)
+    assert list(trialsDf['resp']) == ['f', 'j', 'f', 'j', 'f', 'j']
+    assert task.task.prepared == list(range(6)) # each trial prepared once
+    saved = pd.read_csv(task.filename)
+    assert saved.shape[0] == 6
+    assert list(saved['resp']) == list(trialsDf['resp'])
+    assert list(saved['blockNumber']) == [1] * 6
+
+
+def testOverallTrialNumIncreases(simulatedSession):
+    # rows are saved in the next trial's ITI: the next trial must not reuse the number of the row still queued
+    session = simulatedSession(responses(10))
+    task = session.taskSession()
+    first = task.run(task.generate(5))
+    second = task.run(task.generate(5))
+    session.ledger.close()
+
+    assert list(first['overallTrialNum']) == [1, 2, 3, 4, 5]
+    assert list(second['overallTrialNum']) == [6, 7, 8, 9, 10]
+    saved = pd.read_csv(task.filename)
+    assert list(saved['overallTrialNum']) == list(range(1, 11))
+    assert list(saved['blockNumber']) == [1] * 5 + [2] * 5
+
+
+def testMissedTrials(simulatedSession):
+    session = simulatedSession([None, ('j', 0.2), ('f', 0.2)])
+    task = session.taskSession()
+    trialsDf = task.run(task.generate(3, targetFrames=30))
+
+    assert list(trialsDf['acc']) == [0, 1, 1]
+    assert np.isnan(trialsDf['rt'].iloc[0])
+    assert list(trialsDf['overallTrialNum']) == [1, 2, 3]
+
+
+def testNumberingWithoutSaving(simulatedSession):
+    session = simulatedSession(responses(6))
+    task = session.taskSession()
+    unsaved = task.run(task.generate(3), saveData=False)
+    saved = task.run(task.generate(3))
+    session.ledger.close()
+
+    assert list(unsaved['overallTrialNum']) == [1, 2, 3]
+    assert list(saved['overallTrialNum']) == [1, 2, 3] # nothing was written before: the reservations were given back
+    assert list(pd.read_csv(task.filename)['overallTrialNum']) == [1, 2, 3]
+
+
+def testBlockTimeLimit(simulatedSession):
+    # each trial takes 0.3 s + a frame to respond and 0.5 s of ITI: the third trial starts after the 1 s limit
+    session = simulatedSession(responses(6))
+    task = session.taskSession()
+    assert task.run(task.generate(4), blockMaxTimeSeconds=1.0) is None
+    after = task.run(task.generate(2))
+    session.ledger.close()
+
+    saved = pd.read_csv(task.filename)
+    assert list(saved['overallTrialNum']) == list(range(1, saved.shape[0] + 1))
+    assert list(after['overallTrialNum']) == [saved.shape[0] - 1, saved.shape[0]]
+    assert (saved['blockNumber'] == 1).sum() < 4
+
+
+def testExperimentTimeLimitBeforeFirstRowIsWritten(simulatedSession):
+    # the task's first row is still queued when the second trial starts: the limit counts from the block's first trial
+    session = simulatedSession(responses(4))
+    task = session.taskSession()
+    assert task.run(task.generate(4), experimentMaxTimeSeconds=0.5) is None
+    session.ledger.close()
+    assert pd.read_csv(task.filename).shape[0] == 1
+
+
+def testSkipKeySavesTrialAndEndsBlock(simulatedSession):
+    session = simulatedSession([('f', 0.2), ('bracketright', 0.2), ('f', 0.2)])
+    task = session.taskSession()
+    assert task.run(task.generate(3)) is None
+    session.ledger.close()
+
+    saved = pd.read_csv(task.filename)
+    assert list(saved['overallTrialNum']) == [1, 2]
+    assert saved['resp'].iloc[1] == 'bracketright'
+    assert np.isnan(saved['acc'].iloc[1])
+
+
+def testQuitKeySavesTrialAndQuits(simulatedSession):
+    session = simulatedSession([('f', 0.2), ('backslash', 0.2)])
+    task = session.taskSession()
+    try:
+        task.run(task.generate(3))
+    except Quit:
+        pass
+    else:
+        raise AssertionError('backslash did not quit')
+
+    saved = pd.read_csv(task.filename)
+    assert list(saved['overallTrialNum']) == [1, 2]
+    assert pd.isnull(saved['resp'].iloc[1])
+
+
+class ChoiceTask(KeyTask):
+    '''Records a choice (not scored), draws on every frame and runs an embedded block after the ITI.'''
+
+    metricColumns = ('rt', 'embeddedAcc')
+    resultColumns = ('responseTTL', 'choice')
+    itiDurations = [0.25]
+
+    def __init__(self, embedded=None):
+        KeyTask.__init__(self)
+        self.embedded = embedded
+        self.frames = 0
+
+    def drawFrame(self, frameN, i, thisTrial, trials):
+        self.frames += 1
+
+    def respond(self, key, i, thisTrial, trials):
+        trials[i, 'choice'] = 'low' if key == 'f' else 'high'
+        return 15 if key == 'f' else 16
+
+    def noResponse(self, i, thisTrial, trials):
+        trials[i, 'choice'] = np.nan
+
+    def afterITI(self, i, thisTrial, trials):
+        if self.embedded is not None:
+            trials[i, 'embeddedAcc'] = self.embedded.runTrials(1).acc
+
+
+def choiceTrials(n, **params):
+    trialsDf = generateTrials(n, targetFrames=30)
+    trialsDf['choice'] = None
+    trialsDf['embeddedAcc'] = np.nan
+    return trialsDf
+
+
+def testChoiceTaskWithEmbeddedBlock(simulatedSession):
+    # choice, embedded trial ('f' is correct on its first trial), choice, embedded trial
+    session = simulatedSession([('f', 0.1), ('f', 0.2), ('j', 0.1), ('f', 0.2)])
+    embedded = session.taskSession('embedded')
+    choice = session.taskSession('choice', lambda: ChoiceTask(embedded), choiceTrials)
+    trialsDf = choice.run(choice.generate(2))
+    session.ledger.close()
+
+    assert list(trialsDf['choice']) == ['low', 'high']
+    assert list(trialsDf['responseTTL']) == [15, 16]
+    assert list(trialsDf['acc']) == [0, 0] # not scored: planned value kept
+    assert list(trialsDf['embeddedAcc']) == [1, 1]
+    assert list(trialsDf['iti']) == [0.25, 0.25] # the task's ITI durations
+    assert choice.task.prepared == [0, 1] # prepared once, although the embedded block ended in between
+    saved = pd.read_csv(choice.filename)
+    assert list(saved['embeddedAcc']) == [1, 1] # saved after afterITI()
+    assert session.runner.metrics.total('choice', 'embeddedAcc') == 2
+    assert pd.read_csv(embedded.filename).shape[0] == 2
+
+
+def testFrameTimingOfTrialWithEmbeddedBlock(simulatedSession):
+    # the embedded block times its own trial; the choice trial's timing is taken up again after it
+    session = simulatedSession([('f', 0.1), ('f', 0.2)])
+    session.win.close = lambda: None
+    session.runner.frameTimer = FrameTimer(session.win, 60.0, session.globalClock)
+    embedded = session.taskSession('embedded')
+    choice = session.taskSession('choice', lambda: ChoiceTask(embedded), choiceTrials)
+    trialsDf = choice.run(choice.generate(1))
+    session.ledger.close()
+
+    assert 0.1 < trialsDf['stimulusDuration'].iloc[0] < 0.1 + 3 / 60.0 # response after 0.1 s, seen on a later frame
+    assert 0.2 < pd.read_csv(embedded.filename)['stimulusDuration'].iloc[0] < 0.2 + 3 / 60.0
+    assert pd.read_csv(choice.filename)['stimulusOnset'].iloc[0] < pd.read_csv(embedded.filename)['stimulusOnset'].iloc[0]
+
+
+def testDrawFrameOnEveryFrameOfMissedTrial(simulatedSession):
+    session = simulatedSession([None])
+    choice = session.taskSession('choice', ChoiceTask, choiceTrials)
+    trialsDf = choice.run(choice.generate(1))
+    assert choice.task.frames == 30 # every flip of the response window
+    assert pd.isnull(trialsDf['choice'].iloc[0])
+    assert np.isnan(trialsDf['responseTTL'].iloc[0])
+    assert session.runner.metrics.missedInARow('choice') == 1
+
+
+def testCheckpointResumesAtFirstIncompleteTrial(simulatedSession, tmpdir):
+    filename = str(tmpdir.join('checkpoint.pkl'))
+    session = simulatedSession([('f', 0.2), ('j', 0.2), ('backslash', 0.2)])
+    task = session.taskSession()
+    checkpoint = SessionCheckpoint(filename)
+    block = checkpoint.startBlock('keyTask', task.generate(4))
+    try:
+        task.run(block.trialsDf, checkpoint=block)
+    except Quit:
+        pass
+
+    # the trial quit on is saved (resp empty) and checkpointed like the others
+    session = simulatedSession([('j', 0.2)])
+    task = session.taskSession()
+    checkpoint = SessionCheckpoint(filename, resume=True)
+    block = checkpoint.startBlock('keyTask', task.generate(4))
+    trialsDf = task.run(block.trialsDf, checkpoint=block)
+    assert task.task.prepared == [3]
+    assert list(trialsDf['resp']) == ['f', 'j', None, 'j']
+    assert block.finished
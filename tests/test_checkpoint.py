@@ -0,0 +1,131 @@
+import os
+import random
+import threading
+import numpy as np
+import pandas as pd
+from psychopyTools.checkpoint import RestoredSession, SessionCheckpoint, checkpointFilename, findCheckpoint, readRecords
+from psychopyTools.sessionData import SessionLedger
+from psychopyTools.trialWriter import TrialWriter
+from conftest import Quit
+
+
+def plan(n):
+    return pd.DataFrame({'trialNo': list(range(1, n + 1)), 'resp': [None] * n, 'rt': [np.nan] * n})
+
+
+def runTrials(block, stopAfter=None):
+    '''Complete the block's trials (only stopAfter of them: crash); responses are 'f' with rt 0.1 * trialNo.'''
+    done = 0
+    for i in block.trialsDf.index:
+        if block.isCompleted(i):
+            continue
+        if stopAfter is not None and done == stopAfter:
+            return
+        block.trialsDf.loc[i, 'resp'] = 'f'
+        block.trialsDf.loc[i, 'rt'] = 0.1 * block.trialsDf.loc[i, 'trialNo']
+        block.trialDone(i, block.trialsDf[i:i + 1])
+        done += 1
+    block.finish()
+
+
+def testResumeSkipsFinishedBlocksAndRestoresState(tmpdir):
+    filename = str(tmpdir.join(checkpointFilename(7, '2019-01-01-10-00-00')))
+    info = {'participant': 7, 'startTime': '2019-01-01-10-00-00'}
+    checkpoint = SessionCheckpoint(filename)
+    runTrials(checkpoint.startBlock('practice', plan(2), info))
+    info['taskOrder'] = 'BA'
+    random.seed(1)
+    np.random.seed(1)
+    block = checkpoint.startBlock('stroop', plan(4), info)
+    expected = (random.random(), np.random.rand())
+    runTrials(block, stopAfter=2) # crash
+    checkpoint.file.close()
+    assert findCheckpoint(7, str(tmpdir)) == filename
+
+    info = {'participant': 7, 'startTime': 'new'}
+    checkpoint = SessionCheckpoint(filename, resume=True)
+    checkpoint.restoreInfo(info)
+    assert info['startTime'] == '2019-01-01-10-00-00' and info['taskOrder'] == 'BA'
+    assert checkpoint.fastForwarding()
+    practice = checkpoint.startBlock('practice', plan(2), info)
+    assert practice.finished
+    assert not checkpoint.fastForwarding()
+    block = checkpoint.startBlock('stroop', plan(4), info)
+    assert (random.random(), np.random.rand()) == expected # random state of the block's start
+    assert [block.isCompleted(i) for i in range(4)] == [True, True, False, False]
+    assert list(block.trialsDf['resp'][:2]) == ['f', 'f']
+    runTrials(block)
+    checkpoint.close()
+    assert findCheckpoint(7, str(tmpdir)) is None
+    assert np.allclose(block.trialsDf['rt'], [0.1, 0.2, 0.3, 0.4])
+
+
+def testNestedBlockIsNotCheckpointed(tmpdir):
+    filename = str(tmpdir.join('checkpoint.pkl'))
+    checkpoint = SessionCheckpoint(filename)
+    outer = checkpoint.startBlock('choice', plan(1))
+    inner = checkpoint.startBlock('dotMotion', plan(1))
+    runTrials(inner)
+    runTrials(outer)
+    checkpoint.close()
+    kinds = [(record[0], record[1]) if len(record) > 1 else (record[0],) for record in readRecords(filename)]
+    assert kinds == [('block', 0), ('trial', 0), ('end', 0), ('sessionEnd',)]
+
+
+def testPartlyWrittenRecordIsIgnored(tmpdir):
+    filename = str(tmpdir.join('checkpoint.pkl'))
+    checkpoint = SessionCheckpoint(filename)
+    runTrials(checkpoint.startBlock('stroop', plan(2)), stopAfter=1)
+    checkpoint.file.close()
+    with open(filename, 'ab') as f:
+        f.write(b'\x00\x00\x01\x00partial') # crash mid-write
+    assert [record[0] for record in readRecords(filename)] == ['block', 'trial']
+
+
+def testTrialIsCheckpointedOnlyOnceItsRowIsInTheCsv(simulatedSession, tmpdir):
+    # the writer thread is held up: the session crashes with the rows still queued
+    filename = str(tmpdir.join('checkpoint.pkl'))
+    writer = TrialWriter(flush='quit', fsync=None)
+    stalled = threading.Event()
+    writer.after(None, stalled.wait)
+    session = simulatedSession([('f', 0.2), ('j', 0.2)], ledger=SessionLedger(writer=writer))
+    task = session.taskSession()
+    checkpoint = SessionCheckpoint(filename)
+    block = checkpoint.startBlock('keyTask', task.generate(2))
+    task.run(block.trialsDf, checkpoint=block)
+
+    try:
+        crashed = RestoredSession(readRecords(filename)) # what a resume would find now
+        assert crashed.trialsCompleted() == 0 and not crashed.blocks[0]['finished']
+        assert not os.path.isfile(task.filename)
+    finally:
+        stalled.set()
+    session.ledger.close()
+    assert [record[0] for record in readRecords(filename)] == ['block', 'trial', 'trial', 'end']
+    assert pd.read_csv(task.filename).shape[0] == 2
+
+
+def testResumedBlockKeepsItsBlockNumberAndTime(simulatedSession, tmpdir):
+    filename = str(tmpdir.join('checkpoint.pkl'))
+    session = simulatedSession([('f', 0.2), ('j', 0.2), ('f', 0.2), ('backslash', 0.2)])
+    task = session.taskSession()
+    checkpoint = SessionCheckpoint(filename)
+    for name, n in [('first', 2), ('second', 3)]:
+        block = checkpoint.startBlock(name, task.generate(n))
+        try:
+            task.run(block.trialsDf, checkpoint=block)
+        except Quit: # crash after the 2nd trial of the second block
+            pass
+    session.ledger.close()
+    checkpoint.file.close()
+    stoppedAt = pd.read_csv(task.filename)['elapsedTime'].iloc[-1]
+
+    session = simulatedSession([('f', 0.2)])
+    task = session.taskSession()
+    checkpoint = SessionCheckpoint(filename, resume=True)
+    assert checkpoint.restored.elapsedTime() == stoppedAt # the session clock carries on from the last checkpointed trial
+    assert checkpoint.startBlock('first', task.generate(2)).finished
+    block = checkpoint.startBlock('second', task.generate(3))
+    task.run(block.trialsDf, checkpoint=block)
+    session.ledger.close()
+    assert list(pd.read_csv(task.filename)['blockNumber']) == [1, 1, 2, 2, 2]
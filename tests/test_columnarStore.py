@@ -0,0 +1,48 @@
+import json
+import numpy as np
+import pandas as pd
+from psychopyTools.columnarStore import ColumnarStore, columnarFilenames, readColumnar, toCsv, fromCsv
+from psychopyTools.sessionData import SessionLedger
+
+
+def block(blockNumber, trialNums):
+    n = len(trialNums)
+    return pd.DataFrame({'participant': [7] * n, 'startTime': ['2018-02-15-12-31-52'] * n, 'blockNumber': [blockNumber] * n,
+                         'overallTrialNum': trialNums, 'resp': ['f', None][:n], 'rt': [0.4125, np.nan][:n], 'acc': [1, 0][:n]},
+                        columns=['participant', 'startTime', 'blockNumber', 'overallTrialNum', 'resp', 'rt', 'acc'])
+
+
+def csvText(filename):
+    return pd.read_csv(filename, dtype=str, keep_default_na=False)
+
+
+def testColumnarFilesMatchCsv(tmpdir):
+    filename = str(tmpdir.join('007-stroop.csv'))
+    ledger = SessionLedger(columnar=ColumnarStore())
+    ledger.appendRows(block(1, [1, 2]), filename)
+    ledger.appendRows(block(2, [3]), filename)
+    ledger.close()
+
+    npzFilename, jsonFilename = columnarFilenames(filename)
+    with open(jsonFilename) as f:
+        sidecar = json.load(f)
+    assert sidecar['session'] == {'participant': 7, 'startTime': '2018-02-15-12-31-52'} # stored once
+    assert sidecar['rows'] == 3
+    assert list(readColumnar(npzFilename).columns) == list(block(1, [1]).columns)
+
+    copy = toCsv(npzFilename, str(tmpdir.join('copy.csv')))
+    assert csvText(copy).equals(csvText(filename)) # the csv as written, cell for cell
+
+
+def testFromCsvRoundTrip(tmpdir):
+    filename = str(tmpdir.join('007-stroop.csv'))
+    pd.concat([block(1, [1, 2]), block(2, [3, 4])], ignore_index=True).to_csv(filename, index=False)
+    fromCsv(filename)
+    copy = toCsv(filename.replace('.csv', '.npz'), str(tmpdir.join('copy.csv')))
+    assert csvText(copy).equals(csvText(filename))
+    try:
+        toCsv(filename.replace('.csv', '.npz'))
+    except IOError:
+        pass
+    else:
+        raise AssertionError('the original csv was overwritten')
@@ -0,0 +1,74 @@
+import os
+import pandas as pd
+from psychopyTools.dataLoader import DataIndex, parseFilename
+
+START = '2019-01-01-10-00-00'
+
+
+def write(directory, name, text):
+    with open(os.path.join(directory, name), 'w') as f:
+        f.write(text)
+
+
+def testParseFilename():
+    assert parseFilename('007-{}-stroop.csv'.format(START)) == {'participant': 7, 'startTime': START, 'taskName': 'stroop', 'backup': False, 'incomplete': False}
+    assert parseFilename('007-{}-stroop-incomplete.csv'.format(START))['taskName'] == 'stroop'
+    parsed = parseFilename('007-{}-stroop-backup-incomplete.csv'.format(START))
+    assert (parsed['taskName'], parsed['backup'], parsed['incomplete']) == ('stroop', True, True)
+    assert parseFilename('007-{}-session.pkl'.format(START)) is None
+    assert parseFilename('_manifest.json') is None
+
+
+def dataFolder(directory):
+    write(directory, '001-{}-stroop.csv'.format(START), 'trialNo,rt\n1,0.5\n2,\n')
+    write(directory, '002-{}-stroop.csv'.format(START), 'trialNo,rt,resp\n1,0.6,f\n')
+    write(directory, '002-{}-stroop-incomplete.csv'.format(START), 'trialNo,rt,resp\n2,0.7,j\n') # moved aside by a resume
+    write(directory, '002-{}-stroop-backup.csv'.format(START), 'trialNo,rt,resp\n1,0.6,f\n')
+    write(directory, '003-{}-stroop.csv'.format(START), '') # crashed before the header was written
+    write(directory, '004-{}-stroop.csv'.format(START), '\n')
+    write(directory, '001-{}-flanker.csv'.format(START), 'trialNo,rt\n1,0.4\n')
+
+
+def testLoadLeavesOutIncompleteBackupAndEmptyFiles(tmpdir):
+    directory = str(tmpdir)
+    dataFolder(directory)
+    index = DataIndex(directory)
+    assert index.tasks() == ['flanker', 'stroop']
+    for processes in [1, 2]:
+        df = index.load(tasks='stroop', processes=processes)
+        assert list(df['fileParticipant']) == [1, 1, 2] # 003 (0 bytes) isn't read, 004 (no header) has no rows
+        assert list(df['trialNo']) == [1, 2, 1]
+        assert df['rt'].dtype.kind == 'f'
+    assert sorted(set(index.load(processes=2)['fileTask'])) == ['flanker', 'stroop'] # no task filter: still no incomplete rows
+    assert index.load(processes=1).shape[0] == 4
+    withIncomplete = index.load(tasks='stroop', incomplete=True, processes=1)
+    assert list(withIncomplete['trialNo']) == [1, 2, 1, 2]
+    assert index.load(participants=[2], backups=True, processes=1).shape[0] == 2
+
+
+def testCacheAndRescan(tmpdir):
+    directory = str(tmpdir)
+    dataFolder(directory)
+    DataIndex(directory).load(processes=1)
+    index = DataIndex(directory) # index and cache read back
+    assert index.scan() == 0
+    df = index.load(processes=1)
+    assert index.lastLoad == {'files': 4, 'cached': 4}
+    write(directory, '001-{}-stroop.csv'.format(START), 'trialNo,rt\n1,0.5\n2,0.3\n3,0.2\n')
+    assert index.scan() == 1
+    assert index.load(tasks='stroop', processes=1).shape[0] == df[df['fileTask'] == 'stroop'].shape[0] + 1
+    assert index.lastLoad['cached'] == 2 # 002 and 004
+
+
+def testOldIndexEntriesAreParsedAgain(tmpdir):
+    # an index written before -incomplete files were recognised had them as a task of their own
+    directory = str(tmpdir)
+    dataFolder(directory)
+    index = DataIndex(directory)
+    for entry in index.entries.values():
+        if entry['incomplete']:
+            entry['taskName'] = 'stroop-incomplete'
+            del entry['incomplete']
+    index.save()
+    assert DataIndex(directory).tasks() == ['flanker', 'stroop']
+    assert isinstance(DataIndex(directory, scan=False).summary(), pd.DataFrame)
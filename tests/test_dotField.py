@@ -0,0 +1,86 @@
+import numpy as np
+from psychopyTools.dotField import DotField, normToPix
+
+
+class RecordingArray(object):
+    '''ElementArrayStim stand-in that keeps what it was last given.'''
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+        self.draws = 0
+
+    def setOpacities(self, opacities):
+        self.opacities = opacities
+
+    def setSizes(self, sizes):
+        self.sizes = sizes
+
+    def setXYs(self, xys):
+        self.xys = np.array(xys, dtype=float)
+
+    def draw(self):
+        self.draws += 1
+
+
+def moved(dotField, before, step):
+    '''Whether each dot moved by step since before.'''
+    return np.isclose(dotField.xys[:dotField.nDots] - before, step).all(axis=1)
+
+
+def testCoherentDotsMoveInDirection():
+    np.random.seed(0)
+    dotField = DotField(None, RecordingArray, 200)
+    dotField.configure(200, 90, 1.0, 0.001, 0, 1.0, fieldShape='square', signalDots='same')
+    step = np.array([0.0, 0.001]) # up
+    for frameN in range(5):
+        before = dotField.xys[:200].copy()
+        dotField.draw()
+        inside = before[:, 1] + 0.001 <= 0.5 # dots that leave the field are replotted
+        assert moved(dotField, before, step)[inside].all()
+        assert (np.abs(dotField.xys[:200]) <= 0.5).all()
+    assert dotField.stim.draws == 5
+
+
+def testSignalDotsPickedOnEveryFrame():
+    np.random.seed(0)
+    dotField = DotField(None, RecordingArray, 500)
+    dotField.configure(500, 0, 0.2, 0.001, 0, 1.0)
+    for frameN in range(5):
+        before = dotField.xys[:500].copy()
+        dotField.update()
+        nMoved = moved(dotField, before, [0.001, 0.0]).sum()
+        assert 90 <= nMoved <= 100 # int(0.2 * 500) signal dots, less the few that left the field; noise dots are replotted
+        assert ((dotField.xys[:500] ** 2).sum(axis=1) <= 0.25).all()
+
+
+def testDotLife():
+    # staggered lives of up to 3 frames: every dot has been replotted after 3 frames
+    np.random.seed(0)
+    dotField = DotField(None, RecordingArray, 100)
+    dotField.configure(100, 0, 1.0, 0.0001, 3, 1.0, signalDots='same')
+    start = dotField.xys[:100].copy()
+    for frameN in range(3):
+        dotField.update()
+    assert not np.isclose(dotField.xys[:100] - start, [0.0003, 0.0]).all(axis=1).any()
+
+
+def testFewerDotsThanAllocatedAndDrawnPositions():
+    dotField = DotField(None, RecordingArray, 50, scale=normToPix((800, 600)))
+    dotField.configure(20, 0, 0.5, 0.01, 3, 0.5, fieldPos=(0.2, 0.0), dotSize=4)
+    assert list(dotField.stim.opacities) == [1] * 20 + [0] * 30
+    assert dotField.stim.sizes == 4
+    dotField.draw()
+    assert np.allclose(dotField.stim.xys, (dotField.xys + [0.2, 0.0]) * [400, 300]) # field units -> pix around fieldPos
+
+
+def testInvalidConfigurations():
+    dotField = DotField(None, RecordingArray, 50)
+    for kwargs in [{'nDots': 51}, {'noiseDots': 'random'}]:
+        settings = dict(nDots=50, dir=0, coherence=0.5, speed=0.01, dotLife=3, fieldSize=1.0)
+        settings.update(kwargs)
+        try:
+            dotField.configure(**settings)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('{} accepted'.format(kwargs))
@@ -0,0 +1,37 @@
+import numpy as np
+from psychopyTools.frameRate import FrameRate, measureRefreshRate
+
+
+class Window(object):
+    def __init__(self, rate):
+        self.rate = rate
+
+    def getActualFrameRate(self, **kwargs):
+        if isinstance(self.rate, Exception):
+            raise self.rate
+        return self.rate
+
+
+def testFramesRoundToTheNearestFrame():
+    frameRate = FrameRate(refreshRate=60)
+    assert frameRate.frames(0.5) == 30 and isinstance(frameRate.frames(0.5), int)
+    assert frameRate.frames(0.0083) == 0 # 0.498 frames
+    assert frameRate.frames(0.0084) == 1 # 0.504 frames
+    assert frameRate.frames(1 / 3.0) == 20 # 19.999... frames isn't truncated to 19
+    assert frameRate.frames(np.float64(0.25)) == 15
+    assert frameRate.frames(None) is None
+    assert list(frameRate.frames([0.5, 0.0084, 3])) == [30, 1, 180]
+    assert frameRate.frames(np.array([0.1, 0.2])).dtype.kind == 'i'
+    assert frameRate.seconds(30) == 0.5
+
+
+def testFramesAtOtherRefreshRates():
+    for rate, frames in [(120, 60), (144, 72), (59.94, 30)]:
+        assert FrameRate(refreshRate=rate).frames(0.5) == frames
+
+
+def testMeasuredRefreshRate():
+    assert FrameRate(Window(143.9)).refreshRate == 143.9
+    for rate in [None, 0, RuntimeError('no window')]: # fall back on the nominal rate
+        assert measureRefreshRate(Window(rate), 75) == 75.0
+    assert FrameRate(Window(None), 100).frames(0.5) == 50
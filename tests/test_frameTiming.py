@@ -0,0 +1,96 @@
+import numpy as np
+from psychopyTools.frameTiming import FrameTimer
+
+
+class Window(object):
+    '''Window whose flips take the next refresh, or a later one (a dropped frame) when late is set; it is its own clock.'''
+
+    def __init__(self, refreshRate=64.0):
+        self.frameDuration = 1.0 / refreshRate
+        self.time = 0.0
+        self.closed = False
+
+    def flip(self, late=0):
+        self.time += (1 + late) * self.frameDuration
+        return self.time
+
+    def close(self):
+        self.closed = True
+
+    def getTime(self):
+        return self.time
+
+
+def trial(win, timer, fixationLate=(0, 1, 0), stimulusLate=(0, 0, 2, 0)):
+    '''A trial of fixation and stimulus flips (late: refreshes missed before each flip); returns its timing columns.'''
+    timer.startTrial()
+    timer.phase('fixation')
+    for late in fixationLate:
+        win.flip(late)
+    timer.phase('stimulus')
+    for late in stimulusLate:
+        win.flip(late)
+    timer.phase(None)
+    win.flip() # clear screen
+    return timer.endTrial()
+
+
+def testDroppedFramesAreCountedPerPhase():
+    win = Window()
+    timer = FrameTimer(win, 64.0, win)
+    columns = trial(win, timer)
+    frame = win.frameDuration
+    assert (columns['fixationDroppedFrames'], columns['stimulusDroppedFrames']) == (1, 2)
+    assert columns['fixationOnset'] == frame
+    assert columns['fixationDuration'] == 4 * frame # 3 flips, one a frame late
+    assert columns['stimulusDuration'] == 6 * frame # 4 flips, one 2 frames late, up to the flip clearing the screen
+    assert np.isnan(columns['feedbackOnset']) and np.isnan(columns['feedbackDroppedFrames'])
+    assert list(columns) == timer.columns
+
+    trial(win, timer, (0, 0, 0), (0, 0, 0, 0))
+    assert timer.trialCount == 2
+    assert timer.session['fixation']['dropped'] == 1 and timer.session['stimulus']['dropped'] == 2
+    assert timer.session['stimulus']['maxInterval'] == 3 * frame
+    assert timer.untracked == 2 # the flips clearing the screen
+
+
+def testLateFlipBetweenPhasesCountsForThePhaseItEnds():
+    win = Window()
+    timer = FrameTimer(win, 64.0, win)
+    columns = trial(win, timer, (0, 0), (3, 0))
+    assert (columns['fixationDroppedFrames'], columns['stimulusDroppedFrames']) == (3, 0)
+
+
+def testSuspendedTrialIgnoresTheFlipsInBetween():
+    win = Window()
+    timer = FrameTimer(win, 64.0, win)
+    timer.startTrial()
+    timer.phase('fixation')
+    win.flip()
+    outer = timer.suspend()
+    inner = trial(win, timer) # a block run within the trial
+    timer.restore(outer)
+    win.flip(5) # first flip after the block: not a dropped frame
+    timer.phase(None)
+    win.flip()
+    columns = timer.endTrial()
+    assert inner['fixationDroppedFrames'] == 1
+    assert columns['fixationDroppedFrames'] == 0 and np.isnan(columns['stimulusOnset'])
+
+
+def testDisabledTimerLeavesTheWindowAlone():
+    win = Window()
+    flip = win.flip
+    timer = FrameTimer(win, 64.0, win, enabled=False)
+    assert win.flip == flip
+    assert trial(win, timer) == {}
+
+
+def testReportWhenTheWindowCloses(capsys):
+    win = Window()
+    timer = FrameTimer(win, 64.0, win)
+    trial(win, timer)
+    win.close()
+    assert win.closed
+    report = capsys.readouterr().out
+    assert 'Frame timing: 1 trials' in report and 'stimulus' in report
@@ -0,0 +1,71 @@
+from psychopyTools.idleScreen import IdleScreen
+
+
+class Time(object):
+    '''Simulated clock and time.sleep; a flip waits for the next refresh.'''
+
+    def __init__(self, refreshRate=60.0):
+        self.now = 0.0
+        self.frameDuration = 1.0 / refreshRate
+        self.flips = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def flip(self):
+        self.now += self.frameDuration
+        self.flips.append(self.now)
+
+
+def screen(time, **kwargs):
+    return IdleScreen(time, draw=lambda: None, sleep=time.sleep, clock=time.clock, **kwargs)
+
+
+def after(time, seconds, response='space'):
+    '''poll() that gives response once seconds have passed.'''
+    return lambda: response if time.now >= seconds else None
+
+
+def testUnchangedScreenIsFlippedOnce():
+    time = Time()
+    idle = screen(time, pollRate=100, keepAlive=None)
+    assert idle.wait(after(time, 5.0)) == 'space'
+    assert idle.flips == 1 and len(time.flips) == 1
+    assert 400 < idle.polls < 600 # ~100 input checks per second
+
+
+def testFlippedWhenTheStateChanges():
+    time = Time()
+    pages = [0]
+    def poll():
+        if time.now >= 1.0 and pages[0] == 0:
+            pages[0] = 1 # e.g., a key press moves a rating scale's marker
+        return 'done' if time.now >= 2.0 else None
+    idle = screen(time, state=lambda: pages[0], pollRate=100, keepAlive=None)
+    assert idle.wait(poll) == 'done'
+    assert idle.flips == 2 and 1.0 <= time.flips[1] < 1.03
+
+
+def testKeepAliveFlips():
+    time = Time()
+    idle = screen(time, pollRate=100, keepAlive=1.0)
+    idle.wait(after(time, 3.5))
+    assert idle.flips == 4 # when shown and after 1, 2 and 3 s
+    assert all(0.99 < b - a < 1.05 for a, b in zip(time.flips, time.flips[1:]))
+
+
+def testFlippedOnEveryRefreshWithoutPollRate():
+    time = Time(refreshRate=50.0)
+    idle = screen(time, pollRate=None)
+    idle.wait(after(time, 1.0))
+    assert idle.flips == idle.polls == 50
+
+
+def testTimeout():
+    time = Time()
+    idle = screen(time, pollRate=100, keepAlive=None)
+    assert idle.wait(lambda: None, timeout=0.5) is None
+    assert idle.flips == 1 and 0.5 <= time.now < 0.52
@@ -0,0 +1,61 @@
+from conftest import SimulatedClock, SimulatedPeriod
+from psychopyTools.itiScheduler import ITIScheduler
+from psychopyTools.keyboardInput import SimulatedWindow
+
+
+def scheduler(**options):
+    win = SimulatedWindow()
+    return win, ITIScheduler(SimulatedPeriod(win), SimulatedClock(win), margin=0.0, **options)
+
+
+def job(win, cost, log, name):
+    '''A job that takes cost seconds of simulated time.'''
+    def run():
+        win.time += cost
+        log.append(name)
+    return run
+
+
+def testJobsRunWithinITI():
+    win, ISI = scheduler()
+    log = []
+    ISI.start(0.5)
+    ISI.defer('save', job(win, 0.1, log, 'save1'))
+    ISI.defer('prepare', job(win, 0.1, log, 'prepare'))
+    assert ISI.complete() == 0.0
+    assert log == ['save1', 'prepare']
+    assert abs(win.time - 0.5) < 1e-9 # the ITI lasted as long as planned
+
+
+def testJobThatDoesNotFitWaitsForNextITI():
+    win, ISI = scheduler()
+    log = []
+    ISI.start(0.5)
+    ISI.defer('save', job(win, 0.3, log, 'save1'))
+    ISI.complete() # cost of a save is now known
+    ISI.start(0.5)
+    ISI.defer('prepare', job(win, 0.3, log, 'prepare'))
+    ISI.defer('save', job(win, 0.3, log, 'save2'))
+    ISI.defer('save', job(win, 0.0, log, 'save3')) # waits behind save2, so rows stay in order
+    assert ISI.complete() == 0.0
+    assert log == ['save1', 'prepare']
+    assert ISI.deferred == 2
+
+    # put off once (maxDeferrals=1): runs in the next ITI even if it overruns
+    ISI.start(0.1)
+    assert abs(ISI.complete() - 0.2) < 1e-9
+    assert log == ['save1', 'prepare', 'save2', 'save3']
+
+
+def testRunAndDiscard():
+    win, ISI = scheduler()
+    log = []
+    ISI.defer('save', job(win, 0.0, log, 'save'))
+    ISI.defer('prepare', job(win, 0.0, log, 'prepare'))
+    ISI.defer('feedback', job(win, 0.0, log, 'feedback'))
+    ISI.run('prepare')
+    assert log == ['prepare']
+    ISI.discard('feedback')
+    ISI.run()
+    assert log == ['prepare', 'save']
+    assert len(ISI.jobs) == 0
@@ -0,0 +1,60 @@
+from psychopyTools.keyboardInput import KeyboardInput, SimulatedBackend, SimulatedWindow, compare
+
+
+def responseWindow(win, keyboard, frames, keyList=None):
+    '''Run a response window of frames frames; (key, rt, time from the stimulus flip to the frame it was noticed on) or None.'''
+    keyboard.start(win, keyList)
+    onset = win.flip() # stimulus on
+    for frameN in range(frames):
+        if keyboard.ready():
+            key, rt = keyboard.getResponse()
+            return key, rt, win.getTime() - onset
+        win.flip()
+    return None
+
+
+def testRTIsTimeStampOfTheKeyEvent():
+    win = SimulatedWindow(60.0)
+    rts = [0.2, 0.2501, 0.31, 0.9999]
+    keyboard = KeyboardInput(SimulatedBackend([('f', rt) for rt in rts], win.getTime))
+    for rt in rts:
+        key, measured, noticed = responseWindow(win, keyboard, 90)
+        assert key == 'f' and measured == rt # not rounded up to the frame it was noticed on
+        assert rt <= noticed < rt + win.frameDuration
+        assert keyboard.rt == rt
+
+
+def testStartDropsEarlierPresses():
+    win = SimulatedWindow(60.0)
+    keyboard = KeyboardInput(SimulatedBackend([('f', 0.5), ('j', 0.3), None], win.getTime))
+    assert responseWindow(win, keyboard, 10) is None # pressed after this (1/6 s) window ended
+    assert responseWindow(win, keyboard, 90)[:2] == ('j', 0.3) # the next window has its own press
+    assert responseWindow(win, keyboard, 90) is None
+    assert keyboard.getResponse() is None and keyboard.rt is None
+
+
+def testNothingBeforeTheStimulusFlip():
+    win = SimulatedWindow(60.0)
+    keyboard = KeyboardInput(SimulatedBackend([('f', 0.0)], win.getTime))
+    keyboard.start(win, ['f'])
+    assert not keyboard.ready() # RTs are timed from the next flip
+    win.flip()
+    assert keyboard.getKeys() == ['f']
+
+
+def testKeyListFiltering():
+    win = SimulatedWindow(60.0)
+    keyboard = KeyboardInput(SimulatedBackend([('x', 0.1), ('x', 0.1), ('j', 0.1)], win.getTime))
+    assert responseWindow(win, keyboard, 30, ['f', 'j']) is None
+    keyboard.start(win, ['f', 'j'])
+    win.flip()
+    for frameN in range(30):
+        win.flip()
+    assert keyboard.getKeys() == [] and keyboard.getKeys(['x']) == ['x'] # keyList given to getKeys replaces start's
+    assert responseWindow(win, keyboard, 30, ['f', 'j'])[:2] == ('j', 0.1)
+
+
+def testTimestampedRTsBeatFramePolling():
+    errors = compare(trials=50)
+    assert errors['timestamped'] == (0.0, 0.0)
+    assert errors['frame-polled'][1] <= 1000 / 60.0 + 1e-6
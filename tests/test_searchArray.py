@@ -0,0 +1,36 @@
+import numpy as np
+from psychopyTools.searchArray import SearchArray, normToHeight
+
+
+class RecordingArray(object):
+    '''ElementArrayStim stand-in that keeps what it was last given.'''
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+    def setXYs(self, xys):
+        self.xys = xys
+
+    def setOris(self, oris):
+        self.oris = oris
+
+
+def testItemsAreTwoBarsRotatedClockwise():
+    array = SearchArray(None, RecordingArray, 3, height=1.0, width=0.6, stroke=0.2)
+    assert array.stim.nElements == 6
+    assert np.allclose(array.stim.sizes[:2], [[0.2, 1.0], [0.6, 0.2]]) # stroke, foot
+    positions = np.array([[0.0, 0.0], [1.0, 2.0], [-1.0, 0.5], [9.0, 9.0]]) # the 4th item isn't shown
+    array.setLayout(positions, np.array([0, 90, 180, 45]))
+    xys = array.stim.xys.reshape(3, 2, 2)
+    assert np.allclose(xys[0], [[-0.2, 0.0], [0.0, -0.4]]) # stroke left of the centre, foot below it
+    assert np.allclose(xys[1], [[1.0, 2.2], [0.6, 2.0]]) # 90 deg clockwise: stroke above, foot on the left
+    assert np.allclose(xys[2], [[-0.8, 0.5], [-1.0, 0.9]]) # upside down
+    assert list(array.stim.oris) == [0, 0, 90, 90, 180, 180]
+
+
+def testLayoutIsScaledToTheArrayUnits():
+    scale = normToHeight((800, 600))
+    assert np.allclose(scale, (2 / 3.0, 0.5))
+    array = SearchArray(None, RecordingArray, 1, height=0.0, scale=scale)
+    array.setLayout(np.array([[0.9, -0.6]]), np.array([30]))
+    assert np.allclose(array.stim.xys, [[0.6, -0.3], [0.6, -0.3]])
@@ -0,0 +1,93 @@
+import pandas as pd
+from psychopyTools.sessionClock import SessionClock
+
+
+class Clock(object):
+    def __init__(self):
+        self.t = 0.0
+
+    def getTime(self):
+        return self.t
+
+
+class Ledger(object):
+    '''SessionLedger stand-in: first elapsedTime written to each file.'''
+
+    def __init__(self):
+        self.first = {}
+        self.sessionFirstElapsedTime = None
+
+    def firstElapsedTime(self, filename):
+        return self.first.get(filename)
+
+
+def testExperimentDeadlineFallsBackToFirstTrialWhileItsRowIsQueued():
+    clock, ledger = Clock(), Ledger()
+    timer = SessionClock(clock, ledger).startBlock('task.csv', experimentMaxTimeSeconds=10.0)
+    assert timer.deadline() is None and timer.remaining() is None and not timer.deadlinePassed()
+    timer.trialEnded(2.0) # its row is queued, not written
+    assert timer.experimentDeadline() == 12.0
+    ledger.first['task.csv'] = 1.5 # written by an earlier block of the task
+    assert timer.experimentDeadline() == 11.5
+    ledger.first['other.csv'] = 0.0
+    assert timer.experimentDeadline() == 11.5 # per file
+
+
+def testDeadlineIsTheEarlierLimit():
+    clock, ledger = Clock(), Ledger()
+    ledger.first['task.csv'] = 0.0
+    timer = SessionClock(clock, ledger).startBlock('task.csv', blockMaxTimeSeconds=5.0, experimentMaxTimeSeconds=8.0)
+    assert timer.blockDeadline() is None and timer.deadline() == 8.0 # no trial of the block yet
+    timer.trialEnded(1.0)
+    timer.trialEnded(2.5)
+    assert (timer.blockDeadline(), timer.deadline()) == (6.0, 6.0) # from the end of the block's first trial
+    clock.t = 4.0
+    assert timer.remaining() == 2.0 and timer.expiredLimit() is None and timer.timeUp() is None
+    clock.t = 6.0 # exactly at the deadline
+    assert timer.deadlinePassed() and timer.remaining() == 0.0 and timer.expiredLimit() == 'block'
+    timer.blockMaxTimeSeconds = 7.0
+    clock.t = 8.0
+    assert timer.expiredLimit() == 'block' # both have run out: the block limit is reported
+    timer.blockMaxTimeSeconds = None
+    assert timer.expiredLimit() == 'experiment' and timer.timeUp() == 'experiment'
+
+
+def testTaskAndSessionElapsed():
+    clock, ledger = Clock(), Ledger()
+    sessionClock = SessionClock(clock, ledger)
+    assert sessionClock.taskRemaining('task.csv', None) is None and sessionClock.sessionElapsed() == 0.0
+    ledger.first['task.csv'] = 2.0
+    ledger.lastElapsedTime = lambda filename: 5.0
+    ledger.sessionFirstElapsedTime = 1.0
+    clock.t = 6.0
+    assert sessionClock.taskRemaining('task.csv', 10.0) == 7.0
+    assert sessionClock.sessionRemaining(10.0) == 5.0
+
+
+def trialTwoStart(simulatedSession):
+    '''(end of trial 1, start of trial 2's frame loop) on a 64 Hz window (frame times exact in binary).'''
+    session = simulatedSession([('f', 0.25), None], refreshRate=64.0)
+    task = session.taskSession()
+    trialsDf = task.run(task.generate(2, targetFrames=32))
+    session.ledger.close()
+    return trialsDf['elapsedTime'].iloc[0], trialsDf['elapsedTime'].iloc[1] - 33 / 64.0 # 32 frames + the flip clearing the screen
+
+
+def testBlockEndsExactlyAtTheDeadlineMidTrial(simulatedSession):
+    firstEnd, secondStart = trialTwoStart(simulatedSession)
+    deadline = secondStart + 10 / 64.0 # 10 frames into trial 2, which has no response
+    for limit in ['blockMaxTimeSeconds', 'experimentMaxTimeSeconds']: # the experiment limit counts from trial 1 too: its row is still queued
+        session = simulatedSession([('f', 0.25), None], refreshRate=64.0)
+        task = session.taskSession(limit)
+        assert task.run(task.generate(2, targetFrames=32), **{limit: deadline - firstEnd}) is None
+        assert session.win.time == deadline + 1 / 64.0 # ended on the frame of the deadline (plus the flip clearing the screen)
+        session.ledger.close()
+        assert list(pd.read_csv(task.filename)['trialNo']) == [1] # the unfinished trial isn't saved
+
+
+def testBlockRunsOnUntilTheDeadline(simulatedSession):
+    firstEnd, secondStart = trialTwoStart(simulatedSession)
+    session = simulatedSession([('f', 0.25), None], refreshRate=64.0)
+    task = session.taskSession()
+    trialsDf = task.run(task.generate(2, targetFrames=32), blockMaxTimeSeconds=secondStart + 33 / 64.0 - firstEnd + 1 / 64.0)
+    assert list(trialsDf['trialNo']) == [1, 2] # the deadline falls after trial 2 ended
@@ -0,0 +1,53 @@
+import pandas as pd
+from psychopyTools.sessionData import SessionLedger
+from psychopyTools.trialWriter import TrialWriter
+
+
+def block(blockNumber, trialNums):
+    return pd.DataFrame({'blockNumber': blockNumber, 'overallTrialNum': trialNums, 'elapsedTime': [float(t) for t in trialNums]})
+
+
+def testNumberingContinuesInResumedSession(tmpdir):
+    filename = str(tmpdir.join('stroop.csv'))
+    ledger = SessionLedger()
+    assert ledger.writeHeader(filename)
+    assert ledger.nextBlockNumber(filename) == 1
+    for t in [1, 2, 3]:
+        assert ledger.overallTrialNum(filename) == t
+        ledger.appendRows(block(1, [t]), filename)
+    ledger.close()
+
+    # a new ledger (script started again) reads the file once and carries on from it
+    ledger = SessionLedger()
+    assert not ledger.writeHeader(filename)
+    assert ledger.rows(filename) == 3
+    assert ledger.nextBlockNumber(filename) == 2
+    assert ledger.overallTrialNum(filename) == 4
+    assert ledger.firstElapsedTime(filename) == 1.0
+    ledger.appendRows(block(2, [4, 5]), filename)
+    assert list(ledger.lastRows(filename, 2)['overallTrialNum']) == [4, 5]
+    ledger.close()
+    saved = pd.read_csv(filename)
+    assert list(saved['overallTrialNum']) == [1, 2, 3, 4, 5]
+    assert list(saved['blockNumber']) == [1, 1, 1, 2, 2]
+
+
+def testReservedTrialNumbers(tmpdir):
+    filename = str(tmpdir.join('stroop.csv'))
+    ledger = SessionLedger()
+    assert ledger.reserveTrialNum(filename) == 1
+    assert ledger.reserveTrialNum(filename) == 2 # numbered after the row not written yet
+    ledger.appendRows(block(1, [1]), filename)
+    assert ledger.overallTrialNum(filename) == 3
+    ledger.release(filename)
+    assert ledger.overallTrialNum(filename) == 2
+
+
+def testNumberingWithWriter(tmpdir):
+    # rows queued on the writer thread count before they reach the file
+    filename = str(tmpdir.join('stroop.csv'))
+    ledger = SessionLedger(writer=TrialWriter(flush='quit', fsync=None))
+    ledger.appendRows(block(1, [1, 2]), filename)
+    assert ledger.overallTrialNum(filename) == 3
+    ledger.close()
+    assert SessionLedger().overallTrialNum(filename) == 3
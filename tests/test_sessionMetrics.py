@@ -0,0 +1,32 @@
+import numpy as np
+from psychopyTools.sessionMetrics import SessionMetrics, benchmark
+
+
+def testMissedInARow():
+    metrics = SessionMetrics(window=3)
+    metrics.startBlock('stroop')
+    streaks = []
+    for rt in [np.nan, None, 0.5, np.nan, np.nan, np.nan]:
+        metrics.record('stroop', acc=0 if rt is None or rt != rt else 1, rt=rt)
+        streaks.append(metrics.missedInARow('stroop'))
+    assert streaks == [1, 2, 0, 1, 2, 3]
+    assert metrics.missedInARow('flanker') == 0 # per task
+    metrics.startBlock('stroop')
+    assert metrics.missedInARow('stroop') == 0 # per block
+    tally = metrics.tally('stroop', 'rt')
+    assert (tally.n, tally.count, tally.missing, tally.window.missing) == (6, 1, 5, 3)
+
+
+def testPauseRuleMatchesSliceRule():
+    benchmark(trials=200, n=3, repeats=1) # raises if the pauses differ
+
+
+def testRunnerPausesAfterMissedTrials(simulatedSession):
+    # missed, missed, response, missed, missed, missed: pause after the 2nd, 5th and 6th trials
+    pauses = []
+    session = simulatedSession([None, None, ('f', 0.2), None, None, None], pause=lambda: pauses.append(session.runner.metrics.missedInARow('keyTask')))
+    task = session.taskSession()
+    task.run(task.generate(6, targetFrames=30), pauseAfterMissingNTrials=2)
+    assert pauses == [2, 2, 3]
+    assert session.runner.metrics.count('keyTask', 'acc') == 6
+    assert session.runner.metrics.mean('keyTask', 'acc') == 1 / 6.0
@@ -0,0 +1,86 @@
+import os
+import pandas as pd
+from psychopyTools.sessionTimeline import SessionTimeline, timelineFilename, findTimeline
+
+PREFIX = '001-2019-01-01-10-00-00'
+
+
+def responses(n, rt=0.3):
+    '''Correct responses to n KeyTask trials.'''
+    return [('f' if t % 2 else 'j', rt) for t in range(1, n + 1)]
+
+
+def info():
+    return {'participant': 1, 'startTime': '2019-01-01-10-00-00'}
+
+
+def testResumeMovesAsideRowsOfUnfinishedSection(simulatedSession, tmpdir):
+    filename = str(tmpdir.join(timelineFilename(1, '2019-01-01-10-00-00')))
+    session = simulatedSession(responses(5))
+    timeline = SessionTimeline(filename, info(), ledger=session.ledger)
+    task = session.taskSession(PREFIX + '-keyTask')
+    task.run(task.generate(3))
+    timeline.completed('first')
+    task.run(task.generate(2)) # crash before 'second' is completed
+    task.journal.close()
+    session.ledger.close()
+    assert findTimeline(1, str(tmpdir)) == filename
+
+    session = simulatedSession(responses(2))
+    timeline = SessionTimeline(filename, info(), resume=True, ledger=session.ledger)
+    assert not timeline.pending('first') and timeline.pending('second')
+    task = session.taskSession(PREFIX + '-keyTask')
+    trialsDf = task.run(task.generate(2))
+    timeline.completed('second')
+    task.journal.close()
+    session.ledger.close()
+
+    # the section run again is numbered as if the unfinished run hadn't happened
+    assert list(trialsDf['overallTrialNum']) == [4, 5]
+    saved = pd.read_csv(task.filename)
+    assert list(saved['overallTrialNum']) == [1, 2, 3, 4, 5]
+    assert list(saved['blockNumber']) == [1] * 3 + [2] * 2
+    assert len(task.journal) == 5 # the journal reloaded 3 rows
+    incomplete = pd.read_csv(str(tmpdir.join(PREFIX + '-keyTask-incomplete.csv')))
+    assert list(incomplete['overallTrialNum']) == [4, 5]
+    assert os.path.isfile(str(tmpdir.join(PREFIX + '-keyTask-backup-incomplete.jsonl')))
+
+
+def testFileStartedByUnfinishedSectionIsMovedAside(simulatedSession, tmpdir):
+    filename = str(tmpdir.join(timelineFilename(1, '2019-01-01-10-00-00')))
+    session = simulatedSession(responses(2))
+    SessionTimeline(filename, info(), ledger=session.ledger)
+    task = session.taskSession(PREFIX + '-keyTask')
+    task.run(task.generate(2))
+    session.ledger.close()
+
+    SessionTimeline(filename, info(), resume=True)
+    assert not os.path.isfile(task.filename)
+    assert pd.read_csv(str(tmpdir.join(PREFIX + '-keyTask-incomplete.csv'))).shape[0] == 2
+
+
+def testResumedSessionClockCarriesOn(simulatedSession, tmpdir):
+    filename = str(tmpdir.join(timelineFilename(1, '2019-01-01-10-00-00')))
+    session = simulatedSession(responses(5))
+    timeline = SessionTimeline(filename, info(), ledger=session.ledger, clock=session.globalClock)
+    task = session.taskSession(PREFIX + '-keyTask')
+    first = task.run(task.generate(3))
+    timeline.completed('first')
+    elapsed = session.globalClock.getTime()
+    task.run(task.generate(2)) # crash before 'second' is completed
+    session.ledger.close()
+
+    # a new process: its clock starts at 0 and is set to where the last completed section ended
+    session = simulatedSession(responses(2))
+    timeline = SessionTimeline(filename, info(), resume=True, ledger=session.ledger, clock=session.globalClock)
+    assert timeline.elapsed == elapsed
+    session.globalClock.reset(-timeline.elapsed)
+    task = session.taskSession(PREFIX + '-keyTask')
+    experimentMaxTimeSeconds = elapsed - first['elapsedTime'].iloc[0] + 0.5 # runs out during the first trial of the resumed section
+    assert task.run(task.generate(2), experimentMaxTimeSeconds=experimentMaxTimeSeconds) is None
+    session.ledger.close()
+
+    saved = pd.read_csv(task.filename)
+    assert list(saved['overallTrialNum']) == [1, 2, 3, 4]
+    assert saved['elapsedTime'].is_monotonic_increasing
+    assert saved['elapsedTime'].iloc[3] > elapsed
@@ -0,0 +1,53 @@
+from psychopyTools.staticLayer import StaticLayer
+
+
+class Stim(object):
+    def __init__(self, text, color='white'):
+        self.text, self.color = text, color
+
+
+class Image(object):
+    '''BufferImageStim stand-in: the members' texts and colours when it was captured.'''
+
+    def __init__(self, stimuli):
+        self.shows = [(s.text, s.color) for s in stimuli]
+        self.autoDraw = False
+        self.draws = 0
+
+    def setAutoDraw(self, value):
+        self.autoDraw = value
+
+    def draw(self):
+        self.draws += 1
+
+
+def testCapturedAgainOnlyWhenAMemberChanges():
+    cues = [Stim('red:R'), Stim('green:G')]
+    layer = StaticLayer(Image, cues, maxImages=2)
+    layer.draw()
+    layer.draw()
+    assert layer.captures == 1 and layer.image.draws == 2 and layer.image.depth == 1
+    cues[0].color = 'red'
+    assert layer.update().shows == [('red:R', 'red'), ('green:G', 'white')] and layer.captures == 2
+    cues[0].color = 'white'
+    assert layer.update().shows[0] == ('red:R', 'white') and layer.captures == 2 # kept from the first capture
+    cues[1].text = 'blue:B'
+    layer.update()
+    cues[1].text = 'green:G'
+    cues[0].color = 'red'
+    layer.update() # only the last 2 states are kept
+    assert layer.captures == 4
+
+
+def testAutoDrawFollowsTheCurrentImage():
+    cues = [Stim('F'), Stim('J')]
+    layer = StaticLayer(Image, cues)
+    layer.setAutoDraw(True)
+    first = layer.image
+    cues[1].text = 'K'
+    second = layer.update()
+    assert second.autoDraw and not first.autoDraw
+    layer.invalidate() # e.g., the window was resized
+    assert layer.image.autoDraw and layer.image is not second and layer.captures == 3
+    layer.setAutoDraw(False)
+    assert not layer.image.autoDraw and not layer.autoDraw
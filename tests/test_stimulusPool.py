@@ -0,0 +1,56 @@
+from psychopyTools.stimulusPool import StimulusPool, poolFor
+
+
+class RecordingStim(object):
+    '''TextStim stand-in that records the setters called.'''
+
+    def __init__(self, win, **kwargs):
+        self.__dict__.update(kwargs)
+        self.calls = []
+        self.autoDraw = False
+
+    def setText(self, text):
+        self.calls.append('text')
+        self.text = text
+
+    def setPos(self, pos):
+        self.calls.append('pos')
+        self.pos = pos
+
+    def setAutoDraw(self, autoDraw):
+        self.autoDraw = autoDraw
+
+
+class Window(object):
+    pass
+
+
+def testPooledStimulusIsReusedAndOnlyChangesAreSet():
+    pool = StimulusPool(Window(), RecordingStim)
+    style = dict(units='norm', font='Verdana', height=0.07, color=[1, 1, 1])
+    first = pool.get('feedback', text='correct', pos=[0.0, 0.0], **style)
+    second = pool.get('feedback', text='wrong', pos=(0, 0), **style)
+    assert second is first and first.calls == ['text'] # same pos as a tuple isn't set again
+    assert pool.get('feedback', text='wrong', **dict(style, height=0.1)) is not first # another style
+    assert pool.get('points', text='wrong', **style) is not first # another name
+    assert dict(pool.stats()) == {'hits': 1, 'misses': 3, 'evictions': 0, 'hitRate': 0.25, 'size': 3}
+
+
+def testLeastRecentlyUsedIsDropped():
+    pool = StimulusPool(Window(), RecordingStim, maxSize=2)
+    a = pool.get('a')
+    b = pool.get('b')
+    pool.get('a')
+    c = pool.get('c') # drops b
+    c.setAutoDraw(True)
+    assert pool.get('a') is a and pool.get('b') is not b # drops c
+    assert not c.autoDraw
+    assert pool.stats()['evictions'] == 2 and len(pool) == 2
+    pool.clear()
+    assert len(pool) == 0
+
+
+def testOnePoolPerWindow():
+    win = Window()
+    assert poolFor(win, RecordingStim) is poolFor(win, RecordingStim)
+    assert poolFor(Window(), RecordingStim) is not poolFor(win, RecordingStim)
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+from conftest import KeyTask
+from psychopyTools.taskSession import TrialsSummary, benchmark, trialTable
+
+
+def testTaskIsSetUpOnceForEveryRun(simulatedSession):
+    # a block, then embedded runs of one trial each: correct, wrong, missed
+    session = simulatedSession([('f', 0.2), ('j', 0.2), ('f', 0.3), ('j', 0.4), None])
+    made = []
+    task = session.taskSession(setup=lambda: made.append(KeyTask()) or made[-1])
+    task.run(task.generate(2))
+    summaries = [task.runTrials(1) for run in range(3)]
+    assert len(made) == 1 and task.runs == 4
+    assert [(s.trials, s.acc) for s in summaries] == [(1, 1), (1, 0), (1, 0)]
+    assert summaries[0].rt == 0.3 and np.isnan(summaries[2].rt)
+    assert len(task.journal) == 5 and pd.read_csv(task.backupFilename).shape[0] == 2 # the backup csv isn't rewritten after embedded runs
+    task.close()
+    session.ledger.close()
+    assert pd.read_csv(task.backupFilename).shape[0] == 5
+    assert list(pd.read_csv(task.filename)['overallTrialNum']) == [1, 2, 3, 4, 5]
+
+
+def testSummaryOfSkippedRun():
+    summary = TrialsSummary(None)
+    assert summary.trials == 0 and np.isnan(summary.acc) and np.isnan(summary.rt)
+    summary = TrialsSummary(pd.DataFrame({'acc': [np.nan], 'rt': [0.5]})) # not scored
+    assert summary.trials == 1 and np.isnan(summary.acc) and np.isnan(summary.rt)
+
+
+def testTrialTable():
+    trialsDf = trialTable(3, [('trialNo', [1, 2, 3]), ('task', 'stroop'), ('resp', None)])
+    assert list(trialsDf.columns) == ['trialNo', 'task', 'resp'] and list(trialsDf.index) == [0, 1, 2]
+    assert list(trialsDf['task']) == ['stroop'] * 3 and trialsDf['resp'].isnull().all()
+    benchmark(trials=5, repeats=1) # raises if trialTable() differs from the table built one column at a time
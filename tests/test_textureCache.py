@@ -0,0 +1,17 @@
+from psychopyTools.textureCache import TextureCache
+
+
+def testEachCombinationIsRenderedOnce():
+    made = []
+    def factory(text, colour):
+        made.append((text, colour))
+        return {'text': text, 'colour': colour}
+    cache = TextureCache(factory, [('red', 'green'), ('red', [1, 0, 0]), ('red', 'green')])
+    assert made == [('red', 'green'), ('red', [1, 0, 0])] and len(cache) == 2
+    assert cache.get('red', [1, 0, 0]) == {'text': 'red', 'colour': [1, 0, 0]} # list colours match their tuples
+    assert ('red', (1, 0, 0)) in cache
+    stimulus = cache.get('7')
+    assert cache.get('7') is stimulus and len(made) == 3 # made on first use
+    assert dict(cache.stats()) == {'hits': 2, 'misses': 1, 'size': 3}
+    cache.render([('7', None), ('8', None)])
+    assert made[-1] == ('8', None) and len(made) == 4
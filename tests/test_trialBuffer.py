@@ -0,0 +1,56 @@
+import pickle
+import numpy as np
+import pandas as pd
+from psychopyTools.trialBuffer import TrialBuffer
+
+
+def planned(index=None):
+    return pd.DataFrame({'trialNo': [1, 2, 3], 'acc': [0, 0, 0], 'resp': [None, None, None], 'rt': [np.nan] * 3, 'colour': ['red', 'blue', 'red']},
+                        columns=['trialNo', 'acc', 'resp', 'rt', 'colour'], index=index)
+
+
+def kinds(df):
+    '''dtype kind of each column (pandas 3 string columns count as object columns).'''
+    return [dtype.kind if isinstance(dtype, np.dtype) else 'O' for dtype in df.dtypes]
+
+
+WRITES = [(0, 'resp', 'f'), (0, 'rt', 0.512), (0, 'acc', 1), (1, 'acc', np.nan), (1, 'responseTTL', 15), (2, 'choice', 'low'),
+          (2, 'trialNo', 3.0), (2, 'rt', None)]
+
+
+def testMatchesDataFrameLoc():
+    # same values, columns and dtypes as writing to trialsDf with .loc
+    trialsDf = planned()
+    trials = TrialBuffer(planned())
+    for i, column, value in WRITES:
+        trialsDf.loc[i, column] = value
+        trials[i, column] = value
+    result = trials.dataFrame()
+    assert list(result.columns) == list(trialsDf.columns)
+    assert kinds(result) == kinds(trialsDf)
+    pd.testing.assert_frame_equal(result, trialsDf, check_dtype=False)
+    assert trials[0, 'resp'] == 'f'
+
+
+def testRowsSnapshot():
+    trials = TrialBuffer(planned(index=[10, 11, 12])) # labels that aren't positions
+    trials[11, 'rt'] = 0.3
+    row = trials.rows(11)
+    trials[11, 'rt'] = 0.9 # later writes don't change the snapshot
+    assert row.shape == (1, 5)
+    assert row.column('rt')[0] == 0.3
+    pd.testing.assert_frame_equal(row.toDataFrame(), planned(index=[10, 11, 12]).assign(rt=[np.nan, 0.3, np.nan])[1:2], check_dtype=False)
+    assert pickle.loads(pickle.dumps(row)).records() == row.records() # checkpointed as TrialRows
+    rts = trials.column('rt', 11, 13) # sliced by label
+    assert rts[0] == 0.9 and np.isnan(rts[1])
+
+
+def testOutOfRangeRow():
+    trials = TrialBuffer(planned())
+    for i in [-1, 3]:
+        try:
+            trials[i, 'rt'] = 0.1
+        except KeyError:
+            pass
+        else:
+            raise AssertionError('row {} was written'.format(i))
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+from psychopyTools.trialPlan import TrialPlan
+
+
+def planned():
+    return pd.DataFrame({'word': ['red', 'blue', 'green'], 'targetFrames': [60, np.nan, 90]}, index=[5, 6, 7])
+
+
+def testIteratesLikeIterrows():
+    trialsDf = planned()
+    plan = TrialPlan(trialsDf)
+    assert len(plan) == 3
+    assert [(i, thisTrial['word']) for i, thisTrial in plan] == [(i, row['word']) for i, row in trialsDf.iterrows()]
+    assert plan[6]['word'] == 'blue'
+    assert 'word' in plan[6] and 'colour' not in plan[6]
+    assert plan[6].get('colour', 'none') == 'none'
+
+
+def testDeadlineFrames():
+    # targetFrames if it is a number, else the first fallback that is one
+    plan = TrialPlan(planned(), deadlineFrames=[None, np.nan, 180, 120])
+    assert list(plan.column('deadlineFrames')) == [60, 180, 90]
+    assert list(TrialPlan(planned().drop(columns='targetFrames'), deadlineFrames=[45]).column('deadlineFrames')) == [45, 45, 45]
+
+
+def testReadOnlyAndExtra():
+    trialsDf = planned()
+    plan = TrialPlan(trialsDf, extra={'positions': np.zeros((3, 8, 2))})
+    assert plan[7]['positions'].shape == (8, 2)
+    try:
+        plan.column('targetFrames')[0] = 30
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('the plan was written to')
+    trialsDf.loc[5, 'word'] = 'changed'
+    assert plan[5]['word'] == 'red' # a copy of the generated trials
+    for extra in [{'word': ['a', 'b', 'c']}, {'positions': np.zeros((2, 8, 2))}]:
+        try:
+            TrialPlan(planned(), extra=extra)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('{} accepted'.format(list(extra)))
@@ -0,0 +1,38 @@
+import pandas as pd
+from psychopyTools.trialWriter import TrialWriter
+
+
+def row(t):
+    return pd.DataFrame({'trialNo': [t], 'resp': ['f']})
+
+
+def testCloseWritesEveryQueuedRow(tmpdir):
+    # with flush='quit' nothing has to reach the file before close()
+    filename = str(tmpdir.join('stroop.csv'))
+    writer = TrialWriter(flush='quit', fsync='quit')
+    for t in range(1, 201):
+        writer.write(filename, row(t), header=t == 1)
+    writer.close()
+    assert list(pd.read_csv(filename)['trialNo']) == list(range(1, 201))
+    assert writer.errors == []
+    assert not writer.thread.is_alive()
+    writer.close() # a second close (e.g., at exit) does nothing
+
+
+def testFlushBeforeReadingBack(tmpdir):
+    filename = str(tmpdir.join('stroop.csv'))
+    writer = TrialWriter(flush='quit', fsync=None)
+    writer.write(filename, row(1), header=True)
+    writer.write(filename, row(2))
+    writer.flush()
+    assert list(pd.read_csv(filename)['trialNo']) == [1, 2]
+    writer.close()
+
+
+def testInvalidPolicy():
+    try:
+        TrialWriter(flush='never')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('invalid flush policy accepted')